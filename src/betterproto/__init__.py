@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import array
 import dataclasses
 import enum as builtin_enum
 import json
 import math
+import operator
 import struct
 import sys
+import threading
 import typing
-import warnings
 from abc import ABC
 from base64 import (
     b64decode,
@@ -19,8 +21,13 @@ from datetime import (
     timedelta,
     timezone,
 )
-from io import BytesIO
 from itertools import count
+from json.encoder import encode_basestring_ascii
+from types import (
+    MappingProxyType,
+    MemberDescriptorType,
+    ModuleType,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -29,6 +36,7 @@ from typing import (
     Dict,
     Generator,
     Iterable,
+    List,
     Mapping,
     Optional,
     Set,
@@ -39,7 +47,10 @@ from typing import (
 )
 
 from dateutil.parser import isoparse
-from typing_extensions import Self
+from typing_extensions import (
+    Buffer,
+    Self,
+)
 
 from ._types import T
 from ._version import __version__
@@ -50,6 +61,11 @@ from .casing import (
 )
 from .enum import Enum as Enum
 from .grpc.grpclib_client import ServiceStub as ServiceStub
+from .json_backends import (
+    JsonBackend as JsonBackend,
+    get_json_backend as get_json_backend,
+    set_json_backend as set_json_backend,
+)
 from .utils import (
     classproperty,
     hybridmethod,
@@ -161,7 +177,24 @@ class Casing(builtin_enum.Enum):
     SNAKE = snake_case  #: A snake_case sterilization function.
 
 
-PLACEHOLDER: Any = object()
+class _Placeholder:
+    """The type of :data:`PLACEHOLDER`, pickled as a reference to it."""
+
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        return "PLACEHOLDER"
+
+
+PLACEHOLDER: Any = _Placeholder()
+
+# Generated message classes by fully qualified protobuf name.
+_MESSAGE_CLASSES: Dict[str, Type["Message"]] = {}
+# Guards the initialization of the metadata of message classes.
+_METADATA_LOCK = threading.RLock()
+
+# The oneof state of messages without any oneof group.
+_NO_GROUPS: Mapping[str, Optional[str]] = MappingProxyType({})
 
 
 @dataclasses.dataclass(frozen=True)
@@ -335,82 +368,81 @@ def _pack_fmt(proto_type: str) -> str:
     }[proto_type]
 
 
-def dump_varint(value: int, stream: "SupportsWrite[bytes]") -> None:
-    """Encodes a single varint and dumps it into the provided stream."""
-    if value < -(1 << 63):
-        raise ValueError(
-            "Negative value is not representable as a 64-bit integer - unable to encode a varint within 10 bytes."
-        )
-    elif value < 0:
+def encode_varint_into(value: int, buffer: bytearray) -> None:
+    """Encodes a single varint and appends it to the provided buffer."""
+    if 0 <= value < 0x80:
+        # Single-byte fast path (all field keys of field numbers below 16).
+        buffer.append(value)
+        return
+    if value < 0:
+        if value < -(1 << 63):
+            raise ValueError(
+                "Negative value is not representable as a 64-bit integer - unable to encode a varint within 10 bytes."
+            )
         value += 1 << 64
-
-    bits = value & 0x7F
-    value >>= 7
-    while value:
-        stream.write((0x80 | bits).to_bytes(1, "little"))
-        bits = value & 0x7F
+    elif value < 0x4000:
+        # Two-byte fast path
+        buffer.append((value & 0x7F) | 0x80)
+        buffer.append(value >> 7)
+        return
+
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
         value >>= 7
-    stream.write(bits.to_bytes(1, "little"))
+    buffer.append(value)
+
+
+def dump_varint(value: int, stream: "SupportsWrite[bytes]") -> None:
+    """Encodes a single varint and dumps it into the provided stream."""
+    stream.write(encode_varint(value))
 
 
 def encode_varint(value: int) -> bytes:
     """Encodes a single varint value for serialization."""
-    with BytesIO() as stream:
-        dump_varint(value, stream)
-        return stream.getvalue()
+    buffer = bytearray()
+    encode_varint_into(value, buffer)
+    return bytes(buffer)
 
 
 def size_varint(value: int) -> int:
     """Calculates the size in bytes that a value would take as a varint."""
-    if value < -(1 << 63):
+    if 0 <= value < 0x80:
+        return 1
+    elif value < -(1 << 63):
         raise ValueError(
             "Negative value is not representable as a 64-bit integer - unable to encode a varint within 10 bytes."
         )
     elif value < 0:
         return 10
-    elif value == 0:
-        return 1
     else:
-        return math.ceil(value.bit_length() / 7)
+        return (value.bit_length() + 6) // 7
 
 
-def _preprocess_single(proto_type: str, wraps: str, value: Any) -> bytes:
-    """Adjusts values before serialization."""
-    if proto_type in (
-        TYPE_ENUM,
-        TYPE_BOOL,
-        TYPE_INT32,
-        TYPE_INT64,
-        TYPE_UINT32,
-        TYPE_UINT64,
-    ):
-        return encode_varint(value)
-    elif proto_type in (TYPE_SINT32, TYPE_SINT64):
-        # Handle zig-zag encoding.
-        return encode_varint(value << 1 if value >= 0 else (value << 1) ^ (~0))
-    elif proto_type in FIXED_TYPES:
-        return struct.pack(_pack_fmt(proto_type), value)
-    elif proto_type == TYPE_STRING:
-        return value.encode("utf-8")
-    elif proto_type == TYPE_MESSAGE:
-        if isinstance(value, datetime):
-            # Convert the `datetime` to a timestamp message.
-            value = _Timestamp.from_datetime(value)
-        elif isinstance(value, timedelta):
-            # Convert the `timedelta` to a duration message.
-            value = _Duration.from_timedelta(value)
-        elif wraps:
-            if value is None:
-                return b""
-            value = _get_wrapper(wraps)(value=value)
+def _wire_type(proto_type: str) -> int:
+    """Returns the wire type used to encode values of the given proto type."""
+    if proto_type in WIRE_VARINT_TYPES:
+        return WIRE_VARINT
+    elif proto_type in WIRE_FIXED_32_TYPES:
+        return WIRE_FIXED_32
+    elif proto_type in WIRE_FIXED_64_TYPES:
+        return WIRE_FIXED_64
+    elif proto_type in WIRE_LEN_DELIM_TYPES:
+        return WIRE_LEN_DELIM
+    raise NotImplementedError(proto_type)
 
-        return bytes(value)
 
-    return value
+def _encode_message(value: "Message") -> bytearray:
+    """Encodes a (sub-)message using the encoder of its class."""
+    output = bytearray()
+    type(value)._betterproto.encoder(value, output)
+    return output
 
 
-def _len_preprocessed_single(proto_type: str, wraps: str, value: Any) -> int:
-    """Calculate the size of adjusted values for serialization without fully serializing them."""
+def _get_scalar_writer(proto_type: str) -> Callable[[Any, bytearray], None]:
+    """
+    Returns a function which appends a single varint or fixed size value of the
+    given type to a buffer.
+    """
     if proto_type in (
         TYPE_ENUM,
         TYPE_BOOL,
@@ -419,85 +451,981 @@ def _len_preprocessed_single(proto_type: str, wraps: str, value: Any) -> int:
         TYPE_UINT32,
         TYPE_UINT64,
     ):
-        return size_varint(value)
+        return encode_varint_into
     elif proto_type in (TYPE_SINT32, TYPE_SINT64):
-        # Handle zig-zag encoding.
-        return size_varint(value << 1 if value >= 0 else (value << 1) ^ (~0))
+
+        def write_sint(value: int, output: bytearray) -> None:
+            # Handle zig-zag encoding.
+            encode_varint_into(
+                value << 1 if value >= 0 else (value << 1) ^ (~0), output
+            )
+
+        return write_sint
     elif proto_type in FIXED_TYPES:
-        return len(struct.pack(_pack_fmt(proto_type), value))
-    elif proto_type == TYPE_STRING:
-        return len(value.encode("utf-8"))
-    elif proto_type == TYPE_MESSAGE:
+        pack = struct.Struct(_pack_fmt(proto_type)).pack
+
+        def write_fixed(value: Any, output: bytearray) -> None:
+            output += pack(value)
+
+        return write_fixed
+
+    raise NotImplementedError(proto_type)
+
+
+def _end_length_delimited(
+    output: bytearray, start: int, key_size: int, write_empty: bool
+) -> None:
+    """
+    Fills in the length prefix of a value written straight into the buffer after its
+    key and a single placeholder byte, ``start`` being the position of the value.
+
+    Sizes aren't known before the value is written, so one byte is reserved, which
+    fits the length of anything shorter than 128 bytes. Longer values get their full
+    length prefix spliced in instead, which only moves the value over in memory.
+    """
+    size = len(output) - start
+    if size < 0x80:
+        if size or write_empty:
+            output[start - 1] = size
+        else:
+            # Nothing was written, so drop the key as well.
+            del output[start - 1 - key_size :]
+    else:
+        output[start - 1 : start] = encode_varint(size)
+
+
+def _get_message_converter(wraps: str) -> Callable[[Any], Optional["Message"]]:
+    """
+    Returns a function which converts the value of a message field to the message
+    to serialize, for the well-known types represented by plain Python values.
+    """
+    wrapper_cls = _get_wrapper(wraps) if wraps else None
+
+    def convert(value: Any) -> Optional[Message]:
         if isinstance(value, datetime):
             # Convert the `datetime` to a timestamp message.
-            value = _Timestamp.from_datetime(value)
+            return _Timestamp.from_datetime(value)
         elif isinstance(value, timedelta):
             # Convert the `timedelta` to a duration message.
-            value = _Duration.from_timedelta(value)
-        elif wraps:
-            if value is None:
-                return 0
-            value = _get_wrapper(wraps)(value=value)
-
-        return len(bytes(value))
+            return _Duration.from_timedelta(value)
+        elif wrapper_cls is not None:
+            return None if value is None else wrapper_cls(value=value)
+        return value
 
-    return len(value)
+    return convert
 
 
-def _serialize_single(
+def _get_single_encoder(
     field_number: int,
     proto_type: str,
-    value: Any,
     *,
     serialize_empty: bool = False,
     wraps: str = "",
-) -> bytes:
-    """Serializes a single field and value."""
-    value = _preprocess_single(proto_type, wraps, value)
+) -> Callable[[Any, bytearray], None]:
+    """
+    Returns a function which serializes a single field and value into a buffer,
+    with the field key baked in.
+    """
+    wire_type = _wire_type(proto_type)
+    key = encode_varint((field_number << 3) | wire_type)
+
+    if wire_type != WIRE_LEN_DELIM:
+        write_value = _get_scalar_writer(proto_type)
+
+        def encode(value: Any, output: bytearray) -> None:
+            output += key
+            write_value(value, output)
+
+        return encode
+
+    write_empty = serialize_empty or bool(wraps)
+    if proto_type == TYPE_MESSAGE:
+        convert = _get_message_converter(wraps)
+        key_size = len(key)
+
+        def encode_message(value: Any, output: bytearray) -> None:
+            if not isinstance(value, Message):
+                value = convert(value)
+            output += key
+            output.append(0)
+            if value is not None:
+                # Nested messages are written in place rather than being
+                # serialized on their own and copied over.
+                start = len(output)
+                type(value)._betterproto.encoder(value, output)
+                _end_length_delimited(output, start, key_size, write_empty)
+
+        return encode_message
+
+    if proto_type == TYPE_STRING:
+        encode_value = lambda value: value.encode("utf-8")
+    else:
+        encode_value = lambda value: value
 
-    output = bytearray()
-    if proto_type in WIRE_VARINT_TYPES:
-        key = encode_varint(field_number << 3)
-        output += key + value
-    elif proto_type in WIRE_FIXED_32_TYPES:
-        key = encode_varint((field_number << 3) | 5)
-        output += key + value
-    elif proto_type in WIRE_FIXED_64_TYPES:
-        key = encode_varint((field_number << 3) | 1)
-        output += key + value
-    elif proto_type in WIRE_LEN_DELIM_TYPES:
-        if len(value) or serialize_empty or wraps:
-            key = encode_varint((field_number << 3) | 2)
-            output += key + encode_varint(len(value)) + value
+    def encode(value: Any, output: bytearray) -> None:
+        data = encode_value(value)
+        if data or write_empty:
+            output += key
+            encode_varint_into(len(data), output)
+            output += data
+
+    return encode
+
+
+def _get_packed_encoder(proto_type: str) -> Callable[[List[Any]], bytes]:
+    """
+    Returns a function which encodes all the values of a packed repeated field in
+    bulk rather than one element at a time.
+    """
+    if proto_type in FIXED_TYPES:
+        fmt = _pack_fmt(proto_type)
+        return lambda values: struct.pack(f"{fmt[0]}{len(values)}{fmt[1:]}", *values)
+
+    zigzag = proto_type in (TYPE_SINT32, TYPE_SINT64)
+
+    def encode_varints(values: List[int]) -> bytes:
+        if zigzag:
+            # Handle zig-zag encoding.
+            values = [v << 1 if v >= 0 else (v << 1) ^ (~0) for v in values]
+        if values and min(values) >= 0 and max(values) < 0x80:
+            # Every value fits into a single byte.
+            return bytes(values)
+        buf = bytearray()
+        for value in values:
+            encode_varint_into(value, buf)
+        return buf
+
+    return encode_varints
+
+
+# Element types of the repeated numeric fields which can be stored in an
+# ``array.array`` (by type code) or a ``numpy.ndarray`` (by dtype) instead of a list.
+_ARRAY_TYPES: Dict[str, Tuple[str, str]] = {
+    TYPE_DOUBLE: ("d", "float64"),
+    TYPE_FLOAT: ("f", "float32"),
+    TYPE_INT32: ("i", "int32"),
+    TYPE_SINT32: ("i", "int32"),
+    TYPE_SFIXED32: ("i", "int32"),
+    TYPE_UINT32: ("I", "uint32"),
+    TYPE_FIXED32: ("I", "uint32"),
+    TYPE_INT64: ("q", "int64"),
+    TYPE_SINT64: ("q", "int64"),
+    TYPE_SFIXED64: ("q", "int64"),
+    TYPE_UINT64: ("Q", "uint64"),
+    TYPE_FIXED64: ("Q", "uint64"),
+}
+
+
+def _is_ndarray_type(t: Any) -> bool:
+    """True if the type hint is ``numpy.ndarray`` or ``numpy.typing.NDArray[...]``."""
+    t = getattr(t, "__origin__", t)
+    return (
+        getattr(t, "__module__", None) == "numpy"
+        and getattr(t, "__name__", None) == "ndarray"
+    )
+
+
+class _ArrayGen:
+    """
+    Default generator of a repeated numeric field stored in an ``array.array`` or a
+    ``numpy.ndarray``, which also converts the field to and from the wire format in
+    bulk.
+    """
+
+    __slots__ = ("typecode", "dtype", "numpy")
+
+    def __init__(self, proto_type: str, use_numpy: bool):
+        try:
+            self.typecode, dtype = _ARRAY_TYPES[proto_type]
+        except KeyError:
+            raise TypeError(
+                f"Repeated {proto_type} fields can't be stored in a typed array."
+            ) from None
+        if use_numpy:
+            import numpy
+
+            self.numpy = numpy
+            self.dtype = numpy.dtype(dtype)
+        else:
+            self.numpy = None
+            self.dtype = None
+
+    def __call__(self) -> Any:
+        return self.from_list([])
+
+    def from_list(self, values: Iterable[Any]) -> Any:
+        if self.numpy is not None:
+            return self.numpy.array(values, dtype=self.dtype)
+        return array.array(self.typecode, values)
+
+    @staticmethod
+    def to_list(values: Any) -> List[Any]:
+        return values.tolist() if hasattr(values, "tolist") else list(values)
+
+    def from_bytes(self, data: Buffer) -> Any:
+        """Reads packed little-endian fixed size values."""
+        if self.numpy is not None:
+            # astype() copies the values out of the buffer being parsed.
+            little_endian = self.dtype.newbyteorder("<")
+            return self.numpy.frombuffer(data, dtype=little_endian).astype(self.dtype)
+        values = array.array(self.typecode)
+        values.frombytes(data)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def to_bytes(self, values: Any) -> bytes:
+        """Writes packed little-endian fixed size values."""
+        if self.numpy is not None:
+            little_endian = self.dtype.newbyteorder("<")
+            return self.numpy.asarray(values, dtype=little_endian).tobytes()
+        if not isinstance(values, array.array) or values.typecode != self.typecode:
+            values = array.array(self.typecode, values)
+        if sys.byteorder == "big":
+            values = array.array(self.typecode, values)
+            values.byteswap()
+        return values.tobytes()
+
+    def extend(self, current: Any, values: Iterable[Any]) -> Any:
+        """Adds values to the field, returning the (possibly reallocated) field."""
+        if self.numpy is not None:
+            # Convert before concatenating, as mixing uint64 values with Python
+            # ints would go through float64 and lose precision.
+            asarray = self.numpy.asarray
+            return self.numpy.concatenate(
+                (asarray(current, dtype=self.dtype), asarray(values, dtype=self.dtype))
+            )
+        current.extend(values)
+        return current
+
+    def equal(self, a: Any, b: Any) -> bool:
+        return self.to_list(a) == self.to_list(b)
+
+
+def _get_field_encoder(
+    meta: FieldMetadata, default_gen: Callable[[], Any]
+) -> Callable[[Any, bytearray], None]:
+    """
+    Returns a function which serializes the (non-default) value of a field into a
+    buffer. Repeated fields are written either packed or item by item, maps are
+    written as a series of key/value entry messages.
+    """
+    number = meta.number
+    proto_type = meta.proto_type
+    wraps = meta.wraps or ""
+
+    # Being selected in a group means this field is the one that is currently set
+    # in a `oneof` group, so it must be serialized even if the value is the default
+    # zero value.
+    #
+    # Note that proto3 field presence/optional fields are put in a synthetic
+    # single-item oneof by protoc, which helps us ensure we send the value even if
+    # the value is the default zero value.
+    selected_in_group = bool(meta.group) or bool(meta.optional)
+
+    if proto_type == TYPE_MAP:
+        assert meta.map_types
+        encode_key = _get_single_encoder(1, meta.map_types[0])
+        encode_value = _get_single_encoder(2, meta.map_types[1])
+        map_key = encode_varint((number << 3) | WIRE_LEN_DELIM)
+        map_key_size = len(map_key)
+
+        def encode_map(value: Dict[Any, Any], output: bytearray) -> None:
+            for k, v in value.items():
+                output += map_key
+                output.append(0)
+                start = len(output)
+                encode_key(k, output)
+                encode_value(v, output)
+                _end_length_delimited(output, start, map_key_size, False)
+
+        return encode_map
+
+    if default_gen is list or isinstance(default_gen, _ArrayGen):
+        if proto_type in PACKED_TYPES:
+            # Packed lists look like a length-delimited field. First,
+            # encode all the values into a buffer in bulk and then
+            # treat it like a field of raw bytes.
+            encode_items = _get_packed_encoder(proto_type)
+            if isinstance(default_gen, _ArrayGen):
+                if proto_type in FIXED_TYPES:
+                    # The array already holds the values in the wire format.
+                    encode_items = default_gen.to_bytes
+                else:
+                    encode_values, to_list = encode_items, default_gen.to_list
+                    encode_items = lambda values: encode_values(to_list(values))
+            packed_key = encode_varint((number << 3) | WIRE_LEN_DELIM)
+
+            def encode_packed(value: List[Any], output: bytearray) -> None:
+                buf = encode_items(value)
+                if buf:
+                    output += packed_key
+                    encode_varint_into(len(buf), output)
+                    output += buf
+
+            return encode_packed
+
+        # If it's an empty message it still needs to be represented as an item in
+        # the repeated list.
+        encode_single = _get_single_encoder(
+            number, proto_type, wraps=wraps, serialize_empty=True
+        )
+
+        def encode_repeated(value: List[Any], output: bytearray) -> None:
+            if type(value) is _LazyField:
+                value.write(output)
+                return
+            for item in value:
+                encode_single(item, output)
+
+        return encode_repeated
+
+    if proto_type == TYPE_MESSAGE and not wraps:
+        # Empty messages can still be sent on the wire if they were set (or
+        # received empty).
+        convert = _get_message_converter(wraps)
+        message_key = encode_varint((number << 3) | WIRE_LEN_DELIM)
+        message_key_size = len(message_key)
+
+        def encode_message(value: Any, output: bytearray) -> None:
+            if type(value) is _LazyField:
+                # Not accessed since being parsed, so it hasn't changed either.
+                value.write(output)
+                return
+            write_empty = selected_in_group
+            if isinstance(value, Message):
+                write_empty = write_empty or value._serialized_on_wire
+            else:
+                value = convert(value)
+            output += message_key
+            output.append(0)
+            start = len(output)
+            type(value)._betterproto.encoder(value, output)
+            _end_length_delimited(output, start, message_key_size, write_empty)
+
+        return encode_message
+
+    return _get_single_encoder(
+        number, proto_type, wraps=wraps, serialize_empty=selected_in_group
+    )
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _is_empty(value: Any) -> bool:
+    # The truth value of a numpy array is ambiguous.
+    return len(value) == 0
+
+
+def _get_default_check(
+    default_gen: Callable[[], Any], default: Any
+) -> Callable[[Any], bool]:
+    """
+    Returns a predicate telling whether a field value is the default (zero) value
+    which does not need to be serialized, given the default value of fields with an
+    immutable one (or :data:`PLACEHOLDER`).
+    """
+    if default_gen is list or default_gen is dict:
+        return operator.not_
+    if isinstance(default_gen, _ArrayGen):
+        return _is_empty
+    if default is PLACEHOLDER:
+        # Messages are the default unless set on the wire or with any field set
+        # to a value other than its default.
+        return lambda value: (
+            isinstance(value, Message) and not value._serialized_on_wire and not value
+        )
+    return lambda value: value == default
+
+
+def _get_dict_converter(
+    meta: FieldMetadata,
+    default_gen: Callable[[], Any],
+    default: Any,
+    field_cls: Type,
+    casing: Casing,
+    include_default_values: bool,
+) -> Tuple[Callable[[Any], bool], Callable[[Any], Any]]:
+    """
+    Returns a predicate telling whether a (non-``None``) field value is the default
+    one left out of the dict representation of a message, and a function converting
+    such a value to its JSON serializable representation.
+    """
+    proto_type = meta.proto_type
+    repeated = default_gen is list or isinstance(default_gen, _ArrayGen)
+
+    if proto_type == TYPE_MESSAGE:
+        if field_cls is datetime:
+            convert: Callable[[Any], Any] = _Timestamp.timestamp_to_json
+            is_default: Callable[[Any], bool] = lambda value: value == DATETIME_ZERO
+        elif field_cls is timedelta:
+            convert = _Duration.delta_to_json
+            is_default = lambda value: value == timedelta(0)
+        elif meta.wraps:
+            return (lambda value: False), _identity
+        else:
+            convert = lambda value: value.to_dict(casing, include_default_values)
+            is_default = lambda value: not value._serialized_on_wire
+        if repeated:
+            return operator.not_, lambda value: [convert(item) for item in value]
+        return is_default, convert
+
+    if proto_type == TYPE_MAP:
+        if meta.map_types[1] == TYPE_MESSAGE:  # type: ignore
+            return operator.not_, lambda value: {
+                key: item.to_dict(casing, include_default_values)
+                for key, item in value.items()
+            }
+        return operator.not_, dict
+
+    if proto_type in INT_64_TYPES:
+        convert = str
+    elif proto_type == TYPE_BYTES:
+        convert = lambda value: b64encode(value).decode("utf8")
+    elif proto_type == TYPE_ENUM:
+        convert = lambda value: field_cls(value).name
+    elif proto_type in (TYPE_FLOAT, TYPE_DOUBLE):
+        convert = _dump_float
+    else:
+        convert = _identity
+
+    if isinstance(default_gen, _ArrayGen):
+        to_list = default_gen.to_list
+        if convert is _identity:
+            return _is_empty, to_list
+        return _is_empty, lambda value: [convert(item) for item in to_list(value)]
+    if repeated:
+        if proto_type == TYPE_ENUM:
+            # A single value is transparently upgraded to a repeated one.
+            return operator.not_, lambda value: (
+                [convert(item) for item in value]
+                if isinstance(value, typing.Iterable) and not isinstance(value, str)
+                else [convert(value)]
+            )
+        if convert is _identity:
+            return operator.not_, _identity
+        return operator.not_, lambda value: [convert(item) for item in value]
+    return (lambda value: value == default), convert
+
+
+def _get_dict_value_converter(
+    meta: FieldMetadata, default_gen: Callable[[], Any], field_cls: Type
+) -> Callable[[Any], Any]:
+    """
+    Returns a function converting a (non-``None``) value of the dict representation
+    of a message to the value of a field, given the class of the field (or of its
+    items, or values for maps), see :meth:`Message.from_dict`.
+    """
+    proto_type = meta.proto_type
+
+    if proto_type == TYPE_MESSAGE:
+        if field_cls is datetime:
+            convert: Callable[[Any], Any] = isoparse
+        elif field_cls is timedelta:
+            convert = lambda value: timedelta(seconds=float(value[:-1]))
+        elif meta.wraps:
+            return _identity
+        else:
+            # Going through `from_dict` keeps custom representations, like the one of
+            # `Struct`, working.
+            convert = lambda value: field_cls.from_dict(value)
+        return lambda value: (
+            [convert(item) for item in value]
+            if isinstance(value, list)
+            else convert(value)
+        )
+
+    if proto_type == TYPE_MAP:
+        if meta.map_types[1] == TYPE_MESSAGE:  # type: ignore
+            # This is the class of the map values.
+            return lambda value: {
+                key: field_cls.from_dict(item) for key, item in value.items()
+            }
+        return _identity
+
+    if proto_type in INT_64_TYPES:
+        convert = int
+    elif proto_type == TYPE_BYTES:
+        convert = b64decode
+    elif proto_type == TYPE_ENUM:
+        from_string = field_cls.from_string
+        convert = lambda value: from_string(value) if isinstance(value, str) else value
+    elif proto_type in (TYPE_FLOAT, TYPE_DOUBLE):
+        convert = _parse_float
     else:
-        raise NotImplementedError(proto_type)
+        convert = _identity
 
-    return bytes(output)
+    if proto_type == TYPE_ENUM:
+        # Items of repeated enums must be names.
+        convert_item = from_string
+    else:
+        convert_item = convert
+    if convert is _identity:
+        convert_value = _identity
+    else:
+        convert_value = lambda value: (
+            [convert_item(item) for item in value]
+            if isinstance(value, list)
+            else convert(value)
+        )
+    if isinstance(default_gen, _ArrayGen):
+        from_list = default_gen.from_list
+        return lambda value: from_list(convert_value(value))
+    return convert_value
 
 
-def _len_single(
-    field_number: int,
-    proto_type: str,
-    value: Any,
-    *,
-    serialize_empty: bool = False,
-    wraps: str = "",
-) -> int:
-    """Calculates the size of a serialized single field and value."""
-    size = _len_preprocessed_single(proto_type, wraps, value)
-    if proto_type in WIRE_VARINT_TYPES:
-        size += size_varint(field_number << 3)
-    elif proto_type in WIRE_FIXED_32_TYPES:
-        size += size_varint((field_number << 3) | 5)
-    elif proto_type in WIRE_FIXED_64_TYPES:
-        size += size_varint((field_number << 3) | 1)
-    elif proto_type in WIRE_LEN_DELIM_TYPES:
-        if size or serialize_empty or wraps:
-            size += size_varint((field_number << 3) | 2) + size_varint(size)
+def _get_json_separators(
+    start: str, end: str, indent: Optional[str], level: int
+) -> Tuple[str, str, str]:
+    """
+    Returns the opening, item separating and closing strings of a non-empty JSON
+    object or array at the given nesting level, as laid out by :func:`json.dumps`.
+    """
+    if indent is None:
+        return start, ", ", end
+    newline = "\n" + indent * (level + 1)
+    return start + newline, "," + newline, "\n" + indent * level + end
+
+
+def _get_json_key(key: Any) -> str:
+    """Returns a map key as a JSON object key, as :func:`json.dumps` does."""
+    if isinstance(key, str):
+        return json.dumps(key)
+    if isinstance(key, bool):
+        return '"true"' if key else '"false"'
+    return f'"{key}"'
+
+
+def _write_json_value(
+    value: Any, write: Callable[[str], Any], indent: Optional[str], level: int
+) -> None:
+    value_type = type(value)
+    if value_type is str:
+        write(encode_basestring_ascii(value))
+        return
+    if value_type is int or (value_type is float and math.isfinite(value)):
+        write(repr(value))
+        return
+    text = json.dumps(value, indent=indent)
+    if indent is not None and level:
+        text = text.replace("\n", "\n" + indent * level)
+    write(text)
+
+
+def _write_json_message(
+    message: "Message",
+    casing: Casing,
+    include_default_values: bool,
+    write: Callable[[str], Any],
+    indent: Optional[str],
+    level: int,
+) -> None:
+    if type(message).to_dict is not Message.to_dict:
+        # Messages with their own representation, like `Struct`.
+        value = message.to_dict(casing, include_default_values)
+        _write_json_value(value, write, indent, level)
+    else:
+        writer = message._betterproto.get_json_writer(casing, include_default_values)
+        writer(message, write, indent, level)
+
+
+def _write_json_messages(
+    messages: List["Message"],
+    casing: Casing,
+    include_default_values: bool,
+    write: Callable[[str], Any],
+    indent: Optional[str],
+    level: int,
+) -> None:
+    if not messages:
+        write("[]")
+        return
+    start, separator, end = _get_json_separators("[", "]", indent, level)
+    write(start)
+    for index, message in enumerate(messages):
+        if index:
+            write(separator)
+        _write_json_message(
+            message, casing, include_default_values, write, indent, level + 1
+        )
+    write(end)
+
+
+def _write_json_message_map(
+    messages: Dict[Any, "Message"],
+    casing: Casing,
+    include_default_values: bool,
+    write: Callable[[str], Any],
+    indent: Optional[str],
+    level: int,
+) -> None:
+    if not messages:
+        write("{}")
+        return
+    start, separator, end = _get_json_separators("{", "}", indent, level)
+    write(start)
+    for index, (key, message) in enumerate(messages.items()):
+        if index:
+            write(separator)
+        write(f"{_get_json_key(key)}: ")
+        _write_json_message(
+            message, casing, include_default_values, write, indent, level + 1
+        )
+    write(end)
+
+
+# How a decoded value is stored into its field.
+_STORE_SET = 0
+_STORE_APPEND = 1
+_STORE_EXTEND = 2
+_STORE_MAP = 3
+_STORE_ARRAY = 4
+_STORE_LAZY = 5
+
+
+def _skip_field(buffer: memoryview, pos: int, wire_type: int) -> int:
+    """Skips over the value of a field, returning the position after it."""
+    if wire_type == WIRE_VARINT:
+        _, pos = decode_varint(buffer, pos)
+    elif wire_type == WIRE_FIXED_64:
+        pos += 8
+    elif wire_type == WIRE_LEN_DELIM:
+        length, pos = decode_varint(buffer, pos)
+        pos += length
+    elif wire_type == WIRE_FIXED_32:
+        pos += 4
+    return pos
+
+
+def _decode_message(
+    cls: Type[T], buffer: memoryview, pos: int, end: int, lazy: bool = False
+) -> T:
+    """Decodes a (sub-)message of the given class from part of a buffer."""
+    message = cls._from_wire()
+    if lazy:
+        cls._betterproto.lazy_decoder(message, buffer, pos, end)
     else:
-        raise NotImplementedError(proto_type)
+        cls._betterproto.decoder(message, buffer, pos, end)
+    return message
+
+
+def _unpickle_message(
+    cls: Type[T],
+    values: Union[Dict[str, Any], Tuple[Any, ...]],
+    serialized_on_wire: bool,
+    unknown_fields: bytes,
+    group_current: Optional[Dict[str, Optional[str]]],
+) -> T:
+    """
+    Makes a message from the state pickled by :meth:`Message.__reduce__`: the
+    values of its slots if the class is slotted, or else its ``__dict__``.
+    """
+    message = cls.__new__(cls)
+    if isinstance(values, tuple):
+        for slot, value in zip(cls._betterproto.field_slots, values):
+            slot.__set__(message, value)
+    else:
+        message.__dict__.update(values)
+    message._serialized_on_wire = serialized_on_wire
+    message._unknown_fields = unknown_fields
+    message._group_current = _NO_GROUPS if group_current is None else group_current
+    return message
+
+
+def _get_projection(fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    Turns dotted field paths into a tree of the selected fields, e.g.
+    ``["a.b", "a.c", "d"]`` into ``{"a": {"b": None, "c": None}, "d": None}``,
+    ``None`` standing for a field selected as a whole.
+    """
+    projection: Dict[str, Any] = {}
+    for path in fields:
+        *parents, last = path.split(".")
+        node: Optional[Dict[str, Any]] = projection
+        for name in parents:
+            node = node.setdefault(name, {})
+            if node is None:
+                # The whole field is already selected.
+                break
+        else:
+            node[last] = None
+    return projection
+
+
+def _get_projected_message_decoder(
+    cls: Type["Message"], projection: Dict[str, Any], keep_skipped: bool, lazy: bool
+) -> Callable[[memoryview, int], Tuple[Any, int]]:
+    """
+    Returns a function which reads a single nested message from a buffer, decoding
+    only the fields selected by the projection.
+    """
+    decoder = cls._betterproto._get_decoder(lazy, projection, keep_skipped)
+
+    def decode_message(buffer: memoryview, pos: int) -> Tuple[Any, int]:
+        length, pos = decode_varint(buffer, pos)
+        end = pos + length
+        message = cls._from_wire()
+        decoder(message, buffer, pos, end)
+        return message, end
+
+    return decode_message
+
+
+class _LazyField:
+    """
+    The value of a nested message field parsed lazily. The field's records (the
+    length and the encoded message following each occurrence of the field key) are
+    kept as they were on the wire and only decoded when the field is first
+    accessed. Until then they are written back out unchanged.
+    """
+
+    __slots__ = ("key", "read", "repeated", "records")
+
+    def __init__(
+        self,
+        key: bytes,
+        read: Callable[[memoryview, int], Tuple[Any, int]],
+        repeated: bool,
+    ):
+        self.key = key
+        self.read = read
+        self.repeated = repeated
+        self.records: List[bytes] = []
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The reader can't be pickled, so the value is pickled decoded.
+        return (_identity, (self.decode(),))
+
+    def write(self, output: bytearray) -> None:
+        for record in self.records:
+            output += self.key
+            output += record
+
+    def decode(self) -> Any:
+        try:
+            values = [self.read(memoryview(record), 0)[0] for record in self.records]
+        except (EOFError, IndexError, struct.error) as e:
+            raise ValueError(
+                "Unable to parse message - the data ended unexpectedly."
+            ) from e
+        return values if self.repeated else values[-1]
+
+
+def _read_record(buffer: memoryview, pos: int) -> Tuple[bytes, int]:
+    """Reads a length-delimited value as is, length prefix included."""
+    length, end = decode_varint(buffer, pos)
+    end += length
+    return bytes(buffer[pos:end]), end
+
+
+def _get_value_decoder(
+    proto_type: str, wraps: str, field_cls: Type, lazy: bool = False
+) -> Callable[[memoryview, int], Tuple[Any, int]]:
+    """
+    Returns a function which reads a single value of the given type from a buffer,
+    returning the adjusted value and the position after it. Messages are parsed
+    lazily if ``lazy`` is set.
+    """
+    if proto_type in (TYPE_INT32, TYPE_INT64):
+        bits = int(proto_type[3:])
+        mask = (1 << bits) - 1
+        signbit = 1 << (bits - 1)
+
+        def decode_int(buffer: memoryview, pos: int) -> Tuple[int, int]:
+            value, pos = decode_varint(buffer, pos)
+            return ((value & mask) ^ signbit) - signbit, pos
+
+        return decode_int
+    elif proto_type in (TYPE_UINT32, TYPE_UINT64):
+        return decode_varint
+    elif proto_type in (TYPE_SINT32, TYPE_SINT64):
+
+        def decode_sint(buffer: memoryview, pos: int) -> Tuple[int, int]:
+            value, pos = decode_varint(buffer, pos)
+            # Undo zig-zag encoding
+            return (value >> 1) ^ (-(value & 1)), pos
+
+        return decode_sint
+    elif proto_type == TYPE_BOOL:
+
+        def decode_bool(buffer: memoryview, pos: int) -> Tuple[bool, int]:
+            value, pos = decode_varint(buffer, pos)
+            # Booleans use a varint encoding, so convert it to true/false.
+            return value > 0, pos
 
-    return size
+        return decode_bool
+    elif proto_type == TYPE_ENUM:
+        try_value = field_cls.try_value
+
+        def decode_enum(buffer: memoryview, pos: int) -> Tuple[Enum, int]:
+            value, pos = decode_varint(buffer, pos)
+            # Convert enum ints to python enum instances
+            return try_value(value), pos
+
+        return decode_enum
+    elif proto_type in FIXED_TYPES:
+        packer = struct.Struct(_pack_fmt(proto_type))
+        unpack_from = packer.unpack_from
+        size = packer.size
+
+        def decode_fixed(buffer: memoryview, pos: int) -> Tuple[Any, int]:
+            return unpack_from(buffer, pos)[0], pos + size
+
+        return decode_fixed
+    elif proto_type == TYPE_STRING:
+
+        def decode_string(buffer: memoryview, pos: int) -> Tuple[str, int]:
+            length, pos = decode_varint(buffer, pos)
+            end = pos + length
+            return str(buffer[pos:end], "utf-8"), end
+
+        return decode_string
+    elif proto_type == TYPE_BYTES:
+
+        def decode_bytes(buffer: memoryview, pos: int) -> Tuple[bytes, int]:
+            length, pos = decode_varint(buffer, pos)
+            end = pos + length
+            return bytes(buffer[pos:end]), end
+
+        return decode_bytes
+    elif proto_type in (TYPE_MESSAGE, TYPE_MAP):
+        convert: Optional[Callable[[Any], Any]] = None
+        if field_cls is datetime:
+            message_cls, convert = _Timestamp, _Timestamp.to_datetime
+        elif field_cls is timedelta:
+            message_cls, convert = _Duration, _Duration.to_timedelta
+        elif wraps:
+            # This is a Google wrapper value message around a single scalar type.
+            message_cls, convert = _get_wrapper(wraps), operator.attrgetter("value")
+        else:
+            message_cls = field_cls
+
+        def decode_message(buffer: memoryview, pos: int) -> Tuple[Any, int]:
+            length, pos = decode_varint(buffer, pos)
+            end = pos + length
+            value = _decode_message(message_cls, buffer, pos, end, lazy)
+            if convert is not None:
+                value = convert(value)
+            return value, end
+
+        return decode_message
+
+    raise NotImplementedError(proto_type)
+
+
+def _decode_varints(buffer: memoryview, pos: int, end: int) -> List[int]:
+    """Decodes all the varints packed into part of a buffer in one go."""
+    data = bytes(buffer[pos:end])
+    if data.isascii():
+        # Every value fits into a single byte.
+        return list(data)
+
+    values = []
+    append = values.append
+    i = 0
+    size = len(data)
+    while i < size:
+        b = data[i]
+        i += 1
+        if b < 0x80:
+            append(b)
+            continue
+        result = b & 0x7F
+        shift = 7
+        while True:
+            b = data[i]
+            i += 1
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+            if shift >= 64:
+                raise ValueError("Too many bytes when decoding varint.")
+        append(result)
+    return values
+
+
+def _get_packed_decoder(
+    proto_type: str, field_cls: Type
+) -> Callable[[memoryview, int], Tuple[List[Any], int]]:
+    """
+    Returns a function which reads all the values of a packed repeated field in bulk
+    rather than one element at a time.
+    """
+    if proto_type in FIXED_TYPES:
+        fmt = _pack_fmt(proto_type)
+        item_size = struct.calcsize(fmt)
+
+        def decode_fixed(buffer: memoryview, pos: int) -> Tuple[List[Any], int]:
+            length, pos = decode_varint(buffer, pos)
+            count, remainder = divmod(length, item_size)
+            if remainder:
+                raise ValueError(
+                    "Packed field data is not a whole number of fixed size values."
+                )
+            values = struct.unpack_from(f"{fmt[0]}{count}{fmt[1:]}", buffer, pos)
+            return list(values), pos + length
+
+        return decode_fixed
+
+    convert: Optional[Callable[[List[int]], List[Any]]] = None
+    if proto_type in (TYPE_INT32, TYPE_INT64):
+        bits = int(proto_type[3:])
+        mask = (1 << bits) - 1
+        signbit = 1 << (bits - 1)
+        convert = lambda values: [((v & mask) ^ signbit) - signbit for v in values]
+    elif proto_type in (TYPE_SINT32, TYPE_SINT64):
+        # Undo zig-zag encoding
+        convert = lambda values: [(v >> 1) ^ (-(v & 1)) for v in values]
+    elif proto_type == TYPE_BOOL:
+        convert = lambda values: [v > 0 for v in values]
+    elif proto_type == TYPE_ENUM:
+        try_value = field_cls.try_value
+        convert = lambda values: list(map(try_value, values))
+
+    def decode_varints(buffer: memoryview, pos: int) -> Tuple[List[Any], int]:
+        length, pos = decode_varint(buffer, pos)
+        end = pos + length
+        values = _decode_varints(buffer, pos, end)
+        if convert is not None:
+            values = convert(values)
+        return values, end
+
+    return decode_varints
+
+
+def _read_array_item(
+    read: Callable[[memoryview, int], Tuple[Any, int]], buffer: memoryview, pos: int
+) -> Tuple[Tuple[Any], int]:
+    """Reads a single unpacked value of a typed array field."""
+    value, pos = read(buffer, pos)
+    return (value,), pos
+
+
+def _get_array_decoder(
+    proto_type: str, gen: _ArrayGen
+) -> Callable[[memoryview, int], Tuple[Any, int]]:
+    """
+    Returns a function which reads all the values of a packed repeated field stored in
+    a typed array.
+    """
+    if proto_type not in FIXED_TYPES:
+        return _get_packed_decoder(proto_type, int)
+
+    item_size = struct.calcsize(_pack_fmt(proto_type))
+
+    def decode_fixed(buffer: memoryview, pos: int) -> Tuple[Any, int]:
+        length, pos = decode_varint(buffer, pos)
+        if length % item_size:
+            raise ValueError(
+                "Packed field data is not a whole number of fixed size values."
+            )
+        end = pos + length
+        return gen.from_bytes(buffer[pos:end]), end
+
+    return decode_fixed
 
 
 def _parse_float(value: Any) -> float:
@@ -549,7 +1477,7 @@ def load_varint(stream: "SupportsRead[bytes]") -> Tuple[int, bytes]:
     Load a single varint value from a stream. Returns the value and the raw bytes read.
     """
     result = 0
-    raw = b""
+    raw = bytearray()
     for shift in count(0, 7):
         if shift >= 64:
             raise ValueError("Too many bytes when decoding varint.")
@@ -557,10 +1485,10 @@ def load_varint(stream: "SupportsRead[bytes]") -> Tuple[int, bytes]:
         if not b:
             raise EOFError("Stream ended unexpectedly while attempting to load varint.")
         raw += b
-        b_int = int.from_bytes(b, byteorder="little")
+        b_int = b[0]
         result |= (b_int & 0x7F) << shift
         if not (b_int & 0x80):
-            return result, raw
+            return result, bytes(raw)
 
 
 def decode_varint(buffer: bytes, pos: int) -> Tuple[int, int]:
@@ -568,10 +1496,32 @@ def decode_varint(buffer: bytes, pos: int) -> Tuple[int, int]:
     Decode a single varint value from a byte buffer. Returns the value and the
     new position in the buffer.
     """
-    with BytesIO(buffer) as stream:
-        stream.seek(pos)
-        value, raw = load_varint(stream)
-    return value, pos + len(raw)
+    try:
+        b = buffer[pos]
+        if b < 0x80:
+            # Single-byte fast path
+            return b, pos + 1
+        result = b & 0x7F
+        b = buffer[pos + 1]
+        if b < 0x80:
+            # Two-byte fast path
+            return result | (b << 7), pos + 2
+        result |= (b & 0x7F) << 7
+        pos += 2
+        shift = 14
+        while True:
+            b = buffer[pos]
+            pos += 1
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                return result, pos
+            shift += 7
+            if shift >= 64:
+                raise ValueError("Too many bytes when decoding varint.")
+    except IndexError:
+        raise EOFError(
+            "Buffer ended unexpectedly while attempting to decode varint."
+        ) from None
 
 
 @dataclasses.dataclass(frozen=True)
@@ -635,43 +1585,207 @@ def parse_fields(value: bytes) -> Generator[ParsedField, None, None]:
         )
 
 
-class ProtoClassMetadata:
-    __slots__ = (
-        "oneof_group_by_field",
-        "oneof_field_by_group",
-        "default_gen",
-        "cls_by_field",
-        "field_name_by_number",
-        "meta_by_field_name",
-        "sorted_field_names",
-    )
-
-    oneof_group_by_field: Dict[str, str]
-    oneof_field_by_group: Dict[str, Set[dataclasses.Field]]
-    field_name_by_number: Dict[int, str]
-    meta_by_field_name: Dict[str, FieldMetadata]
-    sorted_field_names: Tuple[str, ...]
-    default_gen: Dict[str, Callable[[], Any]]
-    cls_by_field: Dict[str, Type]
+class _Field:
+    """
+    The descriptor standing in for a message field on its class, in place of the
+    default value the dataclass decorator leaves behind. Reading an unset field
+    gives (and keeps) its default value, reading a lazily parsed field decodes it
+    and reading a ``oneof`` field other than the one set in its group raises
+    :class:`AttributeError`.
+
+    Setting a field marks the message as set and only does the bookkeeping the
+    field needs: selecting it in its ``oneof`` group, or marking messages without
+    any field as set (as nothing else can). The decoder sets fields through
+    :meth:`set_raw` and :meth:`select` instead.
+
+    Values are kept in the instance ``__dict__``, with :data:`PLACEHOLDER` for unset
+    fields, see :class:`_SlotField` for slotted messages.
+    """
 
-    def __init__(self, cls: Type["Message"]):
-        by_field = {}
-        by_group: Dict[str, Set] = {}
-        by_field_name = {}
-        by_field_number = {}
+    __slots__ = ("name", "group", "message", "siblings")
 
-        fields = dataclasses.fields(cls)
-        for field in fields:
-            meta = FieldMetadata.get(field)
+    def __init__(self, name: str, meta: FieldMetadata):
+        self.name = name
+        self.group = meta.group
+        self.message = meta.proto_type == TYPE_MESSAGE
+        # The other fields of the oneof group, see `ProtoClassMetadata`.
+        self.siblings: Tuple[_Field, ...] = ()
 
-            if meta.group:
-                # This is part of a one-of group.
-                by_field[field.name] = meta.group
+    def get_raw(self, instance: "Message") -> Any:
+        return instance.__dict__.get(self.name, PLACEHOLDER)
 
-                by_group.setdefault(meta.group, set()).add(field)
+    def set_raw(self, instance: "Message", value: Any) -> None:
+        instance.__dict__[self.name] = value
 
-            by_field_name[field.name] = meta
-            by_field_number[meta.number] = field.name
+    def __get__(self, instance: Optional["Message"], owner: Any = None) -> Any:
+        if instance is None:
+            return self
+
+        if self.group is not None:
+            try:
+                current = instance._group_current[self.group]
+            except AttributeError:
+                # Still in `__init__`, the groups are not set up yet.
+                pass
+            else:
+                if current != self.name:
+                    message = f"{self.group!r} is set to {current!r}, not {self.name!r}"
+                    if sys.version_info < (3, 10):
+                        raise AttributeError(message)
+                    raise AttributeError(message, name=self.name, obj=instance)
+
+        value = self.get_raw(instance)
+        if value is PLACEHOLDER:
+            # Defaults are only made on first access, which also avoids infinite
+            # recursion for recursive message types.
+            value = instance._get_field_default(self.name)
+            self.set_raw(instance, value)
+        elif type(value) is _LazyField:
+            # Decode a lazily parsed nested message on first access.
+            value = value.decode()
+            self.set_raw(instance, value)
+        return value
+
+    def __set__(self, instance: "Message", value: Any) -> None:
+        if (
+            self.message
+            and isinstance(value, Message)
+            and not value._betterproto.meta_by_field_name
+        ):
+            value._serialized_on_wire = True
+
+        self.set_raw(instance, value)
+        # Track when a field has been set.
+        instance._serialized_on_wire = True
+        if self.group is not None:
+            self.select(instance)
+
+    def select(self, instance: "Message") -> None:
+        """Makes the field the one set in its ``oneof`` group, unsetting the others."""
+        try:
+            group_current = instance._group_current
+        except AttributeError:
+            # Still in `__init__`, `__post_init__` sets up the groups.
+            return
+        group_current[self.group] = self.name
+        for field in self.siblings:
+            field.set_raw(instance, PLACEHOLDER)
+
+    @staticmethod
+    def install(cls: Type["Message"], name: str, meta: FieldMetadata) -> "_Field":
+        """Replaces the class attribute of a field with its descriptor."""
+        for klass in cls.__mro__:
+            if name in klass.__dict__:
+                attr = klass.__dict__[name]
+                break
+        else:
+            attr = None
+
+        if isinstance(attr, _SlotField):
+            attr = attr.slot
+        field = (
+            _SlotField(name, meta, attr)
+            if isinstance(attr, MemberDescriptorType)
+            else _Field(name, meta)
+        )
+        setattr(cls, name, field)
+        return field
+
+
+class _SlotField(_Field):
+    """
+    The descriptor of a field of a slotted message, keeping values in the slot of
+    the field.
+    """
+
+    __slots__ = ("slot",)
+
+    def __init__(self, name: str, meta: FieldMetadata, slot: Any):
+        super().__init__(name, meta)
+        self.slot = slot
+
+    def get_raw(self, instance: "Message") -> Any:
+        return self.slot.__get__(instance)
+
+    def set_raw(self, instance: "Message", value: Any) -> None:
+        self.slot.__set__(instance, value)
+
+
+class ProtoClassMetadata:
+    __slots__ = (
+        "oneof_group_by_field",
+        "oneof_field_by_group",
+        "default_gen",
+        "default_values",
+        "default_factories",
+        "default_checks",
+        "type_hints",
+        "cls_by_field",
+        "field_name_by_number",
+        "meta_by_field_name",
+        "sorted_field_names",
+        "output_names",
+        "field_name_by_key",
+        "field_by_name",
+        "field_slots",
+        "encoder",
+        "decoder",
+        "lazy_decoder",
+        "projected_decoders",
+        "dict_encoders",
+        "json_writers",
+        "dict_decoder",
+        "dict_kwargs_decoder",
+    )
+
+    oneof_group_by_field: Dict[str, str]
+    oneof_field_by_group: Dict[str, Set[dataclasses.Field]]
+    field_name_by_number: Dict[int, str]
+    meta_by_field_name: Dict[str, FieldMetadata]
+    sorted_field_names: Tuple[str, ...]
+    output_names: Dict[Casing, Dict[str, str]]
+    field_name_by_key: Dict[str, str]
+    field_by_name: Dict[str, _Field]
+    field_slots: Tuple[Any, ...]
+    default_gen: Dict[str, Callable[[], Any]]
+    default_values: Dict[str, Any]
+    default_factories: Dict[str, Callable[[], Any]]
+    default_checks: Dict[str, Callable[[Any], bool]]
+    type_hints: Dict[str, Type]
+    cls_by_field: Dict[str, Type]
+    encoder: Callable[["Message", bytearray], None]
+    decoder: Callable[["Message", memoryview, int, int], None]
+    lazy_decoder: Callable[["Message", memoryview, int, int], None]
+    projected_decoders: Dict[
+        Tuple[Tuple[str, ...], bool, bool],
+        Callable[["Message", memoryview, int, int], None],
+    ]
+    dict_encoders: Dict[Tuple[Casing, bool], Callable[["Message"], Dict[str, Any]]]
+    json_writers: Dict[
+        Tuple[Casing, bool],
+        Callable[["Message", Callable[[str], Any], Optional[str], int], None],
+    ]
+    dict_decoder: Optional[Callable[["Message", Mapping[str, Any]], None]]
+    dict_kwargs_decoder: Optional[Callable[[Mapping[str, Any]], Dict[str, Any]]]
+
+    def __init__(self, cls: Type["Message"]):
+        by_field = {}
+        by_group: Dict[str, Set] = {}
+        by_field_name = {}
+        by_field_number = {}
+
+        fields = dataclasses.fields(cls)
+        for field in fields:
+            meta = FieldMetadata.get(field)
+
+            if meta.group:
+                # This is part of a one-of group.
+                by_field[field.name] = meta.group
+
+                by_group.setdefault(meta.group, set()).add(field)
+
+            by_field_name[field.name] = meta
+            by_field_number[meta.number] = field.name
 
         self.oneof_group_by_field = by_field
         self.oneof_field_by_group = by_group
@@ -680,27 +1794,471 @@ class ProtoClassMetadata:
         self.sorted_field_names = tuple(
             by_field_number[number] for number in sorted(by_field_number)
         )
-        self.default_gen = self._get_default_gen(cls, fields)
-        self.cls_by_field = self._get_cls_by_field(cls, fields)
+        # The JSON (camelCase) names of the fields, and their snake_case names.
+        self.output_names = {}
+        for casing in (Casing.CAMEL, Casing.SNAKE):
+            self.get_output_names(casing)
+        self.field_name_by_key = self._get_field_name_by_key()
+        self.type_hints = get_type_hints(cls, vars(sys.modules[cls.__module__]), {})
+        self.default_gen = {
+            field.name: self._get_field_default_gen(field, self.type_hints[field.name])
+            for field in fields
+        }
+        self._set_defaults()
+        self.cls_by_field = self._get_cls_by_field(fields)
+        self.field_by_name = {
+            field.name: _Field.install(cls, field.name, by_field_name[field.name])
+            for field in fields
+        }
+        self.field_slots = tuple(
+            field.slot
+            for field in self.field_by_name.values()
+            if isinstance(field, _SlotField)
+        )
+        for group_fields in by_group.values():
+            for field in group_fields:
+                self.field_by_name[field.name].siblings = tuple(
+                    self.field_by_name[other.name]
+                    for other in group_fields
+                    if other is not field
+                )
+        self.encoder = self._get_encoder(fields)
+        self.decoder = self._get_decoder()
+        self.lazy_decoder = self._get_decoder(lazy=True)
+        self.projected_decoders = {}
+        self.dict_encoders = {}
+        self.json_writers = {}
+        self.dict_decoder = None
+        self.dict_kwargs_decoder = None
+
+    def get_projected_decoder(
+        self, fields: Tuple[str, ...], keep_skipped: bool, lazy: bool
+    ) -> Callable[["Message", memoryview, int, int], None]:
+        """
+        Returns the (cached) function parsing only the given field paths of an
+        instance of the class.
+        """
+        key = (fields, keep_skipped, lazy)
+        try:
+            return self.projected_decoders[key]
+        except KeyError:
+            decoder = self._get_decoder(lazy, _get_projection(fields), keep_skipped)
+            self.projected_decoders[key] = decoder
+            return decoder
+
+    def get_output_names(self, casing: Casing) -> Dict[str, str]:
+        """
+        Returns the (cached) keys of the fields in the dict representation of an
+        instance of the class with the given casing.
+        """
+        try:
+            return self.output_names[casing]
+        except KeyError:
+            names = {
+                name: casing(name).rstrip("_")  # type: ignore
+                for name in self.meta_by_field_name
+            }
+            self.output_names[casing] = names
+            return names
+
+    def _get_field_name_by_key(self) -> Dict[str, str]:
+        """
+        Returns the fields by the keys they have in dict representations: their
+        names, (original) proto names and names in each output casing. Other keys
+        are matched by their snake case.
+        """
+        field_name_by_key = {}
+        for name in self.meta_by_field_name:
+            keys = [name, name.rstrip("_")]
+            keys.extend(names[name] for names in self.output_names.values())
+            for key in keys:
+                # Keys matching a field by their snake case keep doing so.
+                field_name = safe_snake_case(key)
+                if field_name not in self.meta_by_field_name:
+                    field_name = name
+                field_name_by_key[key] = field_name
+        return field_name_by_key
+
+    def get_dict_encoder(
+        self, casing: Casing, include_default_values: bool
+    ) -> Callable[["Message"], Dict[str, Any]]:
+        """
+        Returns the (cached) function making the dict representation of an instance
+        of the class, see :meth:`Message.to_dict`.
+        """
+        key = (casing, include_default_values)
+        try:
+            return self.dict_encoders[key]
+        except KeyError:
+            encoder = self._get_dict_encoder(casing, include_default_values)
+            self.dict_encoders[key] = encoder
+            return encoder
+
+    def _get_dict_fields(
+        self, casing: Casing, include_default_values: bool
+    ) -> Tuple[
+        Tuple[
+            str,
+            str,
+            Callable[["Message"], Any],
+            Optional[str],
+            Callable[[Any], bool],
+            Callable[[Any], Any],
+        ],
+        ...,
+    ]:
+        """
+        Returns the output key of each field, with how to read it, tell whether
+        its value is the default one, and convert its value for the dict
+        representation of a message.
+        """
+        output_names = self.get_output_names(casing)
+        return tuple(
+            (
+                output_names[name],
+                name,
+                self.field_by_name[name].__get__,
+                meta.group,
+                *_get_dict_converter(
+                    meta,
+                    self.default_gen[name],
+                    self.default_values.get(name, PLACEHOLDER),
+                    self.cls_by_field[name],
+                    casing,
+                    include_default_values,
+                ),
+            )
+            for name, meta in self.meta_by_field_name.items()
+        )
+
+    def _get_dict_encoder(
+        self, casing: Casing, include_default_values: bool
+    ) -> Callable[["Message"], Dict[str, Any]]:
+        """
+        Builds the function making the dict representation of instances of the
+        class, with the output key of each field and the conversion of its values
+        worked out ahead of time.
+        """
+        field_encoders = self._get_dict_fields(casing, include_default_values)
+
+        if include_default_values:
+
+            def encode_all(message: "Message") -> Dict[str, Any]:
+                output: Dict[str, Any] = {}
+                group_current = message._group_current
+                for key, name, get, group, _, convert in field_encoders:
+                    if group is not None and group_current.get(group) != name:
+                        value = message._get_field_default(name)
+                    else:
+                        value = get(message)
+                    output[key] = None if value is None else convert(value)
+                return output
+
+            return encode_all
+
+        def encode(message: "Message") -> Dict[str, Any]:
+            output: Dict[str, Any] = {}
+            group_current = message._group_current
+            for key, name, get, group, is_default, convert in field_encoders:
+                if group is None:
+                    value = get(message)
+                    if value is None or is_default(value):
+                        continue
+                elif group_current.get(group) == name:
+                    # The field set in a `oneof` group is output even if it is the
+                    # default value.
+                    value = get(message)
+                    if value is None:
+                        continue
+                else:
+                    continue
+                output[key] = convert(value)
+            return output
+
+        return encode
+
+    def get_dict_decoder(self) -> Callable[["Message", Mapping[str, Any]], None]:
+        """
+        Returns the (cached) function setting the fields of an instance of the class
+        from a dict representation, see :meth:`Message.from_dict`.
+        """
+        decoder = self.dict_decoder
+        if decoder is None:
+            self.dict_decoder = decoder = self._get_dict_decoder()
+        return decoder
+
+    def _get_dict_decoder(self) -> Callable[["Message", Mapping[str, Any]], None]:
+        """
+        Builds the function setting the fields of an instance of the class from a
+        dict representation. Fields are looked up by key in :attr:`field_name_by_key`
+        (other keys are matched by their snake case), and the conversion of their
+        values is worked out ahead of time.
+        """
+        field_decoders, decoders_by_key = self._get_dict_field_decoders()
+
+        def decode(message: "Message", mapping: Mapping[str, Any]) -> None:
+            for key, value in mapping.items():
+                try:
+                    _, set_raw, select, convert = decoders_by_key[key]
+                except KeyError:
+                    try:
+                        _, set_raw, select, convert = field_decoders[
+                            safe_snake_case(key)
+                        ]
+                    except KeyError:
+                        continue
+                if value is None:
+                    continue
+                set_raw(message, convert(value))
+                if select is not None:
+                    select(message)
+
+        return decode
+
+    def get_dict_kwargs_decoder(
+        self,
+    ) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+        """
+        Returns the (cached) function turning a dict representation into the
+        arguments of the class, for classes validating them in ``__init__`` (i.e.
+        pydantic dataclasses), see :meth:`Message.from_dict`.
+        """
+        decoder = self.dict_kwargs_decoder
+        if decoder is None:
+            self.dict_kwargs_decoder = decoder = self._get_dict_kwargs_decoder()
+        return decoder
+
+    def _get_dict_kwargs_decoder(self) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+        """
+        Builds the function turning a dict representation into the arguments of the
+        class, converting values like :meth:`_get_dict_decoder` does. Every member
+        of a ``oneof`` group given is passed on, so the class can reject them.
+        """
+        field_decoders, decoders_by_key = self._get_dict_field_decoders()
+
+        def decode(mapping: Mapping[str, Any]) -> Dict[str, Any]:
+            kwargs = {}
+            for key, value in mapping.items():
+                try:
+                    name, _, _, convert = decoders_by_key[key]
+                except KeyError:
+                    try:
+                        name, _, _, convert = field_decoders[safe_snake_case(key)]
+                    except KeyError:
+                        continue
+                if value is None:
+                    continue
+                kwargs[name] = convert(value)
+            return kwargs
+
+        return decode
+
+    def _get_dict_field_decoders(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Returns the name, raw setter, ``oneof`` selector and value converter of each
+        field, by field name and by key in :attr:`field_name_by_key`.
+        """
+        field_decoders = {
+            name: (
+                name,
+                field.set_raw,
+                field.select if field.group is not None else None,
+                _get_dict_value_converter(
+                    meta,
+                    self.default_gen[name],
+                    self.cls_by_field[
+                        f"{name}.value" if meta.proto_type == TYPE_MAP else name
+                    ],
+                ),
+            )
+            for name, meta in self.meta_by_field_name.items()
+            for field in (self.field_by_name[name],)
+        }
+        decoders_by_key = {
+            key: field_decoders[name] for key, name in self.field_name_by_key.items()
+        }
+        return field_decoders, decoders_by_key
+
+    def get_json_writer(
+        self, casing: Casing, include_default_values: bool
+    ) -> Callable[["Message", Callable[[str], Any], Optional[str], int], None]:
+        """
+        Returns the (cached) function writing the JSON representation of an
+        instance of the class, see :meth:`Message.dump_json`.
+        """
+        key = (casing, include_default_values)
+        try:
+            return self.json_writers[key]
+        except KeyError:
+            writer = self._get_json_writer(casing, include_default_values)
+            self.json_writers[key] = writer
+            return writer
+
+    def _get_json_writer(
+        self, casing: Casing, include_default_values: bool
+    ) -> Callable[["Message", Callable[[str], Any], Optional[str], int], None]:
+        """
+        Builds the function writing the JSON representation of instances of the
+        class piece by piece, given the function writing text, the indent and the
+        nesting level of the message. Nested messages are written the same way,
+        while other values are converted like in the dict representation.
+        """
+        field_writers = []
+        for key, name, get, group, is_default, convert in self._get_dict_fields(
+            casing, include_default_values
+        ):
+            meta = self.meta_by_field_name[name]
+            field_cls = self.cls_by_field[name]
+            write_value: Optional[Callable[..., None]] = None
+            if meta.proto_type == TYPE_MESSAGE:
+                if field_cls is not datetime and field_cls is not timedelta:
+                    if not meta.wraps:
+                        write_value = (
+                            _write_json_messages
+                            if self.default_gen[name] is list
+                            else _write_json_message
+                        )
+            elif meta.proto_type == TYPE_MAP:
+                if meta.map_types[1] == TYPE_MESSAGE:  # type: ignore
+                    write_value = _write_json_message_map
+            field_writers.append(
+                (
+                    f"{json.dumps(key)}: ",
+                    name,
+                    get,
+                    group,
+                    is_default,
+                    convert,
+                    write_value,
+                )
+            )
+
+        def write_json(
+            message: "Message",
+            write: Callable[[str], Any],
+            indent: Optional[str],
+            level: int,
+        ) -> None:
+            start, separator, end = _get_json_separators("{", "}", indent, level)
+            group_current = message._group_current
+            empty = True
+            for (
+                key,
+                name,
+                get,
+                group,
+                is_default,
+                convert,
+                write_value,
+            ) in field_writers:
+                if group is not None and group_current.get(group) != name:
+                    if not include_default_values:
+                        continue
+                    value = message._get_field_default(name)
+                else:
+                    value = get(message)
+                    if value is None:
+                        if not include_default_values:
+                            continue
+                    elif (
+                        not include_default_values
+                        and group is None
+                        and is_default(value)
+                    ):
+                        continue
+
+                write(start if empty else separator)
+                empty = False
+                write(key)
+                if value is None:
+                    write("null")
+                elif write_value is None:
+                    _write_json_value(convert(value), write, indent, level + 1)
+                else:
+                    write_value(
+                        value, casing, include_default_values, write, indent, level + 1
+                    )
+            write("{}" if empty else end)
+
+        return write_json
 
     @staticmethod
-    def _get_default_gen(
-        cls: Type["Message"], fields: Iterable[dataclasses.Field]
-    ) -> Dict[str, Callable[[], Any]]:
-        return {field.name: cls._get_field_default_gen(field) for field in fields}
+    def _get_field_default_gen(field: dataclasses.Field, t: Type) -> Any:
+        if t is array.array or _is_ndarray_type(t):
+            # This is a repeated numeric field stored in a typed array.
+            return _ArrayGen(FieldMetadata.get(field).proto_type, t is not array.array)
+        elif hasattr(t, "__origin__"):
+            if t.__origin__ is dict:
+                # This is some kind of map (dict in Python).
+                return dict
+            elif t.__origin__ is list:
+                # This is some kind of list (repeated) field.
+                return list
+            elif t.__origin__ is Union and t.__args__[1] is type(None):
+                # This is an optional field (either wrapped, or using proto3
+                # field presence). For setting the default we really don't care
+                # what kind of field it is.
+                return type(None)
+            else:
+                return t
+        elif issubclass(t, Enum):
+            # Enums always default to zero.
+            return t.try_value
+        elif t is datetime:
+            # Offsets are relative to 1970-01-01T00:00:00Z
+            return datetime_default_gen
+        else:
+            # This is either a primitive scalar or another message type. Calling
+            # it should result in its zero value.
+            return t
 
     @staticmethod
-    def _get_cls_by_field(
-        cls: Type["Message"], fields: Iterable[dataclasses.Field]
-    ) -> Dict[str, Type]:
+    def _get_field_cls(t: Type, index: int = 0) -> Type:
+        """
+        Get the class of a field, or of its items or map keys/values, from its type
+        hint.
+        """
+        if hasattr(t, "__args__") and index >= 0:
+            if t.__args__ is not None:
+                t = t.__args__[index]
+        return t
+
+    def _set_defaults(self) -> None:
+        """
+        Makes the default value of each field with an immutable one once and for
+        all, leaving factories for the mutable ones (lists, maps, typed arrays and
+        messages, which are made without going through ``__init__``).
+        """
+        self.default_values = {}
+        self.default_factories = {}
+        for name, default_gen in self.default_gen.items():
+            if (
+                default_gen is list
+                or default_gen is dict
+                or isinstance(default_gen, _ArrayGen)
+            ):
+                self.default_factories[name] = default_gen
+            elif isinstance(default_gen, type) and issubclass(default_gen, Message):
+                self.default_factories[name] = default_gen._default
+            else:
+                self.default_values[name] = default_gen()
+        self.default_checks = {
+            name: _get_default_check(
+                default_gen, self.default_values.get(name, PLACEHOLDER)
+            )
+            for name, default_gen in self.default_gen.items()
+        }
+
+    def _get_cls_by_field(self, fields: Iterable[dataclasses.Field]) -> Dict[str, Type]:
         field_cls = {}
 
         for field in fields:
             meta = FieldMetadata.get(field)
+            type_hint = self.type_hints[field.name]
             if meta.proto_type == TYPE_MAP:
                 assert meta.map_types
-                kt = cls._cls_for(field, index=0)
-                vt = cls._cls_for(field, index=1)
+                kt = self._get_field_cls(type_hint, index=0)
+                vt = self._get_field_cls(type_hint, index=1)
                 field_cls[field.name] = dataclasses.make_dataclass(
                     "Entry",
                     [
@@ -711,10 +2269,231 @@ class ProtoClassMetadata:
                 )
                 field_cls[f"{field.name}.value"] = vt
             else:
-                field_cls[field.name] = cls._cls_for(field)
+                field_cls[field.name] = self._get_field_cls(type_hint)
 
         return field_cls
 
+    def _get_encoder(
+        self, fields: Iterable[dataclasses.Field]
+    ) -> Callable[["Message", bytearray], None]:
+        """
+        Builds the function serializing instances of the class into a buffer, with
+        everything that can be known about each field ahead of time baked in.
+        """
+        field_encoders = tuple(
+            (
+                field.name,
+                self.field_by_name[field.name].get_raw,
+                meta.group,
+                bool(meta.group) or bool(meta.optional),
+                self.default_checks[field.name],
+                _get_field_encoder(meta, self.default_gen[field.name]),
+            )
+            for field in fields
+            for meta in (FieldMetadata.get(field),)
+        )
+
+        def encode(message: "Message", output: bytearray) -> None:
+            group_current = message._group_current
+            for (
+                name,
+                get_raw,
+                group,
+                selected_in_group,
+                is_default,
+                encode_field,
+            ) in field_encoders:
+                value = get_raw(message)
+                if value is PLACEHOLDER or value is None:
+                    # Unset fields and optional items should be skipped. The latter
+                    # is used for the Google wrapper types and proto3 field
+                    # presence/optional fields.
+                    continue
+                if group is not None and group_current.get(group) != name:
+                    # Not the field currently set in its `oneof` group.
+                    continue
+                if not selected_in_group and is_default(value):
+                    # Default (zero) values are not serialized, unless this is the
+                    # selected oneof item.
+                    continue
+                encode_field(value, output)
+            output += message._unknown_fields
+
+        return encode
+
+    def _get_decoder(
+        self,
+        lazy: bool = False,
+        projection: Optional[Dict[str, Any]] = None,
+        keep_skipped: bool = True,
+    ) -> Callable[["Message", memoryview, int, int], None]:
+        """
+        Builds the function parsing part of a buffer into an instance of the class.
+        Fields are dispatched on their raw key through a table holding a specialised
+        reader for each field number and wire type the field may be encoded with.
+
+        When ``lazy`` is set, nested message fields are only read as raw records to
+        be decoded on first access (see :class:`_LazyField`).
+
+        A ``projection`` (see :func:`_get_projection`) restricts the fields which
+        are decoded, leaving all others to be skipped like unknown fields, which
+        are kept (or dropped, if ``keep_skipped`` is unset).
+        """
+        if projection is not None:
+            for name in projection.keys() - self.meta_by_field_name.keys():
+                raise ValueError(f"Unknown field {name!r} in field selection.")
+        readers: Dict[
+            int, Tuple[_Field, Callable[[memoryview, int], Tuple[Any, int]], int]
+        ]
+        readers = {}
+        lazy_fields: Dict[
+            str, Tuple[bytes, Callable[[memoryview, int], Tuple[Any, int]], bool]
+        ]
+        lazy_fields = {}
+        for name, meta in self.meta_by_field_name.items():
+            subfields = None
+            if projection is not None:
+                if name not in projection:
+                    continue
+                subfields = projection[name]
+            field = self.field_by_name[name]
+            field_cls = self.cls_by_field[name]
+            key = meta.number << 3
+            if subfields:
+                # Only some of the fields of the nested message(s) are selected.
+                if not (
+                    meta.proto_type == TYPE_MESSAGE
+                    and isinstance(field_cls, type)
+                    and issubclass(field_cls, Message)
+                ):
+                    raise ValueError(
+                        f"Can't select fields of {name!r}, which isn't a message."
+                    )
+                read = _get_projected_message_decoder(
+                    field_cls, subfields, keep_skipped, lazy
+                )
+                store = _STORE_APPEND if self.default_gen[name] is list else _STORE_SET
+                readers[key | WIRE_LEN_DELIM] = (field, read, store)
+                continue
+            if meta.proto_type == TYPE_MAP:
+                # Each entry is a key/value message of its own.
+                read = _get_value_decoder(TYPE_MAP, "", field_cls, lazy)
+                readers[key | WIRE_LEN_DELIM] = (field, read, _STORE_MAP)
+                continue
+
+            read = _get_value_decoder(
+                meta.proto_type, meta.wraps or "", field_cls, lazy
+            )
+            wire_type = _wire_type(meta.proto_type)
+            gen = self.default_gen[name]
+            if (
+                lazy
+                and meta.proto_type == TYPE_MESSAGE
+                and isinstance(field_cls, type)
+                and issubclass(field_cls, Message)
+            ):
+                readers[key | wire_type] = (field, _read_record, _STORE_LAZY)
+                lazy_fields[name] = (
+                    encode_varint(key | wire_type),
+                    read,
+                    gen is list,
+                )
+                continue
+            if isinstance(gen, _ArrayGen):
+                readers[key | wire_type] = (
+                    field,
+                    lambda buffer, pos, read=read: _read_array_item(read, buffer, pos),
+                    _STORE_ARRAY,
+                )
+                readers[key | WIRE_LEN_DELIM] = (
+                    field,
+                    _get_array_decoder(meta.proto_type, gen),
+                    _STORE_ARRAY,
+                )
+                continue
+            if gen is not list:
+                readers[key | wire_type] = (field, read, _STORE_SET)
+                continue
+
+            readers[key | wire_type] = (field, read, _STORE_APPEND)
+            if meta.proto_type in PACKED_TYPES:
+                # This is a packed repeated field.
+                readers[key | WIRE_LEN_DELIM] = (
+                    field,
+                    _get_packed_decoder(meta.proto_type, field_cls),
+                    _STORE_EXTEND,
+                )
+
+        default_gen = self.default_gen
+
+        def decode(message: "Message", buffer: memoryview, pos: int, end: int) -> None:
+            unknown_fields = []
+            while pos < end:
+                start = pos
+                key = buffer[pos]
+                if key < 0x80:
+                    pos += 1
+                else:
+                    key, pos = decode_varint(buffer, pos)
+                reader = readers.get(key)
+                if reader is None:
+                    # Unknown fields (and known fields with an unexpected wire
+                    # type) are kept as they are so they round trip.
+                    pos = _skip_field(buffer, pos, key & 0x7)
+                    if keep_skipped:
+                        unknown_fields.append(buffer[start:pos])
+                    continue
+
+                # Fields are set directly, the message is known to be set already
+                # and only a `oneof` group may need updating.
+                field, read, store = reader
+                value, pos = read(buffer, pos)
+                if store == _STORE_SET:
+                    field.set_raw(message, value)
+                    if field.group is not None:
+                        field.select(message)
+                    continue
+
+                current = field.get_raw(message)
+                if store == _STORE_LAZY:
+                    lazy_key, read_value, repeated = lazy_fields[field.name]
+                    if repeated and type(current) is _LazyField:
+                        current.records.append(value)
+                    elif repeated and current is not PLACEHOLDER and current:
+                        # Items decoded before can't be kept in raw form.
+                        current.append(read_value(memoryview(value), 0)[0])
+                    else:
+                        current = _LazyField(lazy_key, read_value, repeated)
+                        current.records.append(value)
+                        field.set_raw(message, current)
+                        if field.group is not None:
+                            field.select(message)
+                    continue
+
+                if current is PLACEHOLDER:
+                    current = default_gen[field.name]()
+                    field.set_raw(message, current)
+
+                if store == _STORE_APPEND:
+                    current.append(value)
+                elif store == _STORE_EXTEND:
+                    current.extend(value)
+                elif store == _STORE_MAP:
+                    # Value represents a single key/value pair entry in the map.
+                    current[value.key] = value.value
+                else:
+                    # Typed arrays may need to be reallocated to grow.
+                    extended = default_gen[field.name].extend(current, value)
+                    if extended is not current:
+                        field.set_raw(message, extended)
+
+            if pos != end:
+                raise ValueError("Field data extends beyond the end of the message.")
+            if unknown_fields:
+                message._unknown_fields += b"".join(unknown_fields)
+
+        return decode
+
 
 class Message(ABC):
     """
@@ -733,22 +2512,56 @@ class Message(ABC):
             Calls :meth:`__bool__`.
     """
 
+    # Messages generated with the ``slots`` plugin option are slotted dataclasses,
+    # so the base class must not bring in an instance ``__dict__`` of its own.
+    __slots__ = ("_serialized_on_wire", "_unknown_fields", "_group_current")
+
     _serialized_on_wire: bool
     _unknown_fields: bytes
     _group_current: Dict[str, str]
     _betterproto_meta: ClassVar[ProtoClassMetadata]
+    # The fully qualified protobuf name of generated messages.
+    _proto_name: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Only register the class defining the name, and not its subclasses. The
+        # first module defining a message wins (e.g. the standard well-known types
+        # over their pydantic counterparts), but slotted dataclasses replace the
+        # class they are made from.
+        name = cls.__dict__.get("_proto_name")
+        if name is not None:
+            registered = _MESSAGE_CLASSES.get(name)
+            if registered is None or (
+                registered.__module__ == cls.__module__
+                and registered.__qualname__ == cls.__qualname__
+            ):
+                _MESSAGE_CLASSES[name] = cls
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        # The field descriptors doing the bookkeeping of assignments are installed
+        # with the metadata, which must happen before the first instance runs
+        # `__init__`. It can't be done in `__init_subclass__`, which runs before the
+        # dataclass decorator has turned the class into a dataclass.
+        if "_betterproto_meta" not in cls.__dict__:
+            cls._betterproto
+        return super().__new__(cls)
 
     def __post_init__(self) -> None:
         # Keep track of whether every field was default
         all_sentinel = True
 
         # Set current field of each group after `__init__` has already been run.
-        group_current: Dict[str, Optional[str]] = {}
-        for field_name, meta in self._betterproto.meta_by_field_name.items():
+        # Messages without any oneof group share a single empty, read-only mapping.
+        proto_meta = self._betterproto
+        group_current: Dict[str, Optional[str]] = (
+            {} if proto_meta.oneof_field_by_group else _NO_GROUPS
+        )
+        for field_name, meta in proto_meta.meta_by_field_name.items():
             if meta.group:
                 group_current.setdefault(meta.group)
 
-            value = self.__raw_get(field_name)
+            value = proto_meta.field_by_name[field_name].get_raw(self)
             if value is not PLACEHOLDER and not (meta.optional and value is None):
                 # Found a non-sentinel value
                 all_sentinel = False
@@ -758,17 +2571,23 @@ class Message(ABC):
                     group_current[meta.group] = field_name
 
         # Now that all the defaults are set, reset it!
-        self.__dict__["_serialized_on_wire"] = not all_sentinel
-        self.__dict__["_unknown_fields"] = b""
-        self.__dict__["_group_current"] = group_current
+        object.__setattr__(self, "_serialized_on_wire", not all_sentinel)
+        object.__setattr__(self, "_unknown_fields", b"")
+        object.__setattr__(self, "_group_current", group_current)
 
     def __raw_get(self, name: str) -> Any:
-        return super().__getattribute__(name)
+        field = self._betterproto.field_by_name[name]
+        value = field.get_raw(self)
+        if type(value) is _LazyField:
+            value = value.decode()
+            field.set_raw(self, value)
+        return value
 
     def __eq__(self, other) -> bool:
         if type(self) is not type(other):
             return NotImplemented
 
+        defaults = self._betterproto.default_gen
         for field_name in self._betterproto.meta_by_field_name:
             self_val = self.__raw_get(field_name)
             other_val = other.__raw_get(field_name)
@@ -779,7 +2598,11 @@ class Message(ABC):
             elif other_val is PLACEHOLDER:
                 other_val = other._get_field_default(field_name)
 
-            if self_val != other_val:
+            default_gen = defaults[field_name]
+            if isinstance(default_gen, _ArrayGen):
+                if not default_gen.equal(self_val, other_val):
+                    return False
+            elif self_val != other_val:
                 # We consider two nan values to be the same for the
                 # purposes of comparing messages (otherwise a message
                 # is not equal to itself)
@@ -808,70 +2631,16 @@ class Message(ABC):
         for field_name in self._betterproto.sorted_field_names:
             yield field_name, self.__raw_get(field_name), PLACEHOLDER
 
-    if not TYPE_CHECKING:
-
-        def __getattribute__(self, name: str) -> Any:
-            """
-            Lazily initialize default values to avoid infinite recursion for recursive
-            message types.
-            Raise :class:`AttributeError` on attempts to access unset ``oneof`` fields.
-            """
-            try:
-                group_current = super().__getattribute__("_group_current")
-            except AttributeError:
-                pass
-            else:
-                if name not in {"__class__", "_betterproto"}:
-                    group = self._betterproto.oneof_group_by_field.get(name)
-                    if group is not None and group_current[group] != name:
-                        if sys.version_info < (3, 10):
-                            raise AttributeError(
-                                f"{group!r} is set to {group_current[group]!r}, not {name!r}"
-                            )
-                        else:
-                            raise AttributeError(
-                                f"{group!r} is set to {group_current[group]!r}, not {name!r}",
-                                name=name,
-                                obj=self,
-                            )
-
-            value = super().__getattribute__(name)
-            if value is not PLACEHOLDER:
-                return value
-
-            value = self._get_field_default(name)
-            super().__setattr__(name, value)
-            return value
-
-    def __setattr__(self, attr: str, value: Any) -> None:
-        if (
-            isinstance(value, Message)
-            and hasattr(value, "_betterproto")
-            and not value._betterproto.meta_by_field_name
-        ):
-            value._serialized_on_wire = True
-
-        if attr != "_serialized_on_wire":
-            # Track when a field has been set.
-            self.__dict__["_serialized_on_wire"] = True
-
-        if hasattr(self, "_group_current"):  # __post_init__ had already run
-            if attr in self._betterproto.oneof_group_by_field:
-                group = self._betterproto.oneof_group_by_field[attr]
-                for field in self._betterproto.oneof_field_by_group[group]:
-                    if field.name == attr:
-                        self._group_current[group] = field.name
-                    else:
-                        super().__setattr__(field.name, PLACEHOLDER)
-
-        super().__setattr__(attr, value)
-
     def __bool__(self) -> bool:
         """True if the Message has any fields with non-default values."""
+        defaults = self._betterproto.default_gen
         return any(
-            self.__raw_get(field_name)
-            not in (PLACEHOLDER, self._get_field_default(field_name))
+            len(value) > 0
+            if isinstance(defaults[field_name], _ArrayGen)
+            else value != self._get_field_default(field_name)
             for field_name in self._betterproto.meta_by_field_name
+            for value in (self.__raw_get(field_name),)
+            if value is not PLACEHOLDER
         )
 
     def __deepcopy__(self: T, _: Any = {}) -> T:
@@ -893,16 +2662,51 @@ class Message(ABC):
     @classproperty
     def _betterproto(cls: type[Self]) -> ProtoClassMetadata:  # type: ignore
         """
-        Lazy initialize metadata for each protobuf class.
-        It may be initialized multiple times in a multi-threaded environment,
-        but that won't affect the correctness.
+        Lazy initialize metadata for each protobuf class, once (see :func:`warmup` to
+        do it ahead of time).
         """
         try:
-            return cls._betterproto_meta
-        except AttributeError:
-            cls._betterproto_meta = meta = ProtoClassMetadata(cls)
+            return cls.__dict__["_betterproto_meta"]
+        except KeyError:
+            pass
+        with _METADATA_LOCK:
+            # Another thread may have been initializing it meanwhile.
+            meta = cls.__dict__.get("_betterproto_meta")
+            if meta is None:
+                cls._betterproto_meta = meta = ProtoClassMetadata(cls)
             return meta
 
+    @classmethod
+    def _from_wire(cls) -> Self:
+        """
+        Makes an empty instance the way the parsers need them, with every field
+        unset but the message itself marked as set. Unlike calling the class, this
+        doesn't go through ``__init__`` and ``__post_init__``.
+        """
+        meta = cls._betterproto
+        self = cls.__new__(cls)
+        for slot in meta.field_slots:
+            slot.__set__(self, PLACEHOLDER)
+        self._serialized_on_wire = True
+        self._unknown_fields = b""
+        self._group_current = (
+            dict.fromkeys(meta.oneof_field_by_group)
+            if meta.oneof_field_by_group
+            else _NO_GROUPS
+        )
+        return self
+
+    @classmethod
+    def _default(cls) -> Self:
+        """
+        Makes the default value of message fields of the class: an empty instance
+        not marked as set, made without going through ``__init__`` like
+        :meth:`_from_wire` (so deprecated messages don't warn about it either).
+        """
+        self = cls._from_wire()
+        self._serialized_on_wire = False
+        return self
+
     def dump(self, stream: "SupportsWrite[bytes]", delimit: bool = False) -> None:
         """
         Dumps the binary encoded Protobuf message to the stream.
@@ -914,204 +2718,57 @@ class Message(ABC):
         delimit:
             Whether to prefix the message with a varint declaring its size.
         """
+        output = bytearray()
+        self._betterproto.encoder(self, output)
         if delimit == SIZE_DELIMITED:
-            dump_varint(len(self), stream)
-
-        for field_name, meta in self._betterproto.meta_by_field_name.items():
-            try:
-                value = getattr(self, field_name)
-            except AttributeError:
-                continue
-
-            if value is None:
-                # Optional items should be skipped. This is used for the Google
-                # wrapper types and proto3 field presence/optional fields.
-                continue
-
-            # Being selected in a a group means this field is the one that is
-            # currently set in a `oneof` group, so it must be serialized even
-            # if the value is the default zero value.
-            #
-            # Note that proto3 field presence/optional fields are put in a
-            # synthetic single-item oneof by protoc, which helps us ensure we
-            # send the value even if the value is the default zero value.
-            selected_in_group = bool(meta.group) or meta.optional
-
-            # Empty messages can still be sent on the wire if they were
-            # set (or received empty).
-            serialize_empty = isinstance(value, Message) and value._serialized_on_wire
-
-            include_default_value_for_oneof = self._include_default_value_for_oneof(
-                field_name=field_name, meta=meta
-            )
+            dump_varint(len(output), stream)
+        stream.write(output)
 
-            if value == self._get_field_default(field_name) and not (
-                selected_in_group or serialize_empty or include_default_value_for_oneof
-            ):
-                # Default (zero) values are not serialized. Two exceptions are
-                # if this is the selected oneof item or if we know we have to
-                # serialize an empty message (i.e. zero value was explicitly
-                # set by the user).
-                continue
-
-            if isinstance(value, list):
-                if meta.proto_type in PACKED_TYPES:
-                    # Packed lists look like a length-delimited field. First,
-                    # preprocess/encode each value into a buffer and then
-                    # treat it like a field of raw bytes.
-                    buf = bytearray()
-                    for item in value:
-                        buf += _preprocess_single(meta.proto_type, "", item)
-                    stream.write(_serialize_single(meta.number, TYPE_BYTES, buf))
-                else:
-                    for item in value:
-                        stream.write(
-                            _serialize_single(
-                                meta.number,
-                                meta.proto_type,
-                                item,
-                                wraps=meta.wraps or "",
-                                serialize_empty=True,
-                            )
-                            # if it's an empty message it still needs to be represented
-                            # as an item in the repeated list
-                            or b"\n\x00"
-                        )
+    def dump_into(self, buffer: bytearray, delimit: int = 0) -> int:
+        """
+        Appends the binary encoded Protobuf message to the end of a buffer, without
+        creating any intermediate buffers. This allows a buffer to be reused (e.g.
+        by clearing it with ``del buffer[:]``) or to be filled with a whole batch of
+        messages.
 
-            elif isinstance(value, dict):
-                for k, v in value.items():
-                    assert meta.map_types
-                    sk = _serialize_single(1, meta.map_types[0], k)
-                    sv = _serialize_single(2, meta.map_types[1], v)
-                    stream.write(
-                        _serialize_single(meta.number, meta.proto_type, sk + sv)
-                    )
-            else:
-                # If we have an empty string and we're including the default value for
-                # a oneof, make sure we serialize it. This ensures that the byte string
-                # output isn't simply an empty string. This also ensures that round trip
-                # serialization will keep `which_one_of` calls consistent.
-                if (
-                    isinstance(value, str)
-                    and value == ""
-                    and include_default_value_for_oneof
-                ):
-                    serialize_empty = True
-
-                stream.write(
-                    _serialize_single(
-                        meta.number,
-                        meta.proto_type,
-                        value,
-                        serialize_empty=serialize_empty or bool(selected_in_group),
-                        wraps=meta.wraps or "",
-                    )
-                )
+        Parameters
+        -----------
+        buffer: :class:`bytearray`
+            The buffer to append the message to.
+        delimit: :class:`int`
+            :data:`SIZE_DELIMITED` to prefix the message with a varint declaring its
+            size, like :meth:`dump`.
 
-        stream.write(self._unknown_fields)
+        Returns
+        --------
+        :class:`int`
+            The number of bytes appended to the buffer.
+        """
+        mark = len(buffer)
+        if delimit == SIZE_DELIMITED:
+            buffer.append(0)
+            start = len(buffer)
+            self._betterproto.encoder(self, buffer)
+            _end_length_delimited(buffer, start, 0, True)
+        else:
+            self._betterproto.encoder(self, buffer)
+        return len(buffer) - mark
 
     def __bytes__(self) -> bytes:
         """
         Get the binary encoded Protobuf representation of this message instance.
         """
-        with BytesIO() as stream:
-            self.dump(stream)
-            return stream.getvalue()
+        output = bytearray()
+        self._betterproto.encoder(self, output)
+        return bytes(output)
 
     def __len__(self) -> int:
         """
         Get the size of the encoded Protobuf representation of this message instance.
         """
-        size = 0
-        for field_name, meta in self._betterproto.meta_by_field_name.items():
-            try:
-                value = getattr(self, field_name)
-            except AttributeError:
-                continue
-
-            if value is None:
-                # Optional items should be skipped. This is used for the Google
-                # wrapper types and proto3 field presence/optional fields.
-                continue
-
-            # Being selected in a group means this field is the one that is
-            # currently set in a `oneof` group, so it must be serialized even
-            # if the value is the default zero value.
-            #
-            # Note that proto3 field presence/optional fields are put in a
-            # synthetic single-item oneof by protoc, which helps us ensure we
-            # send the value even if the value is the default zero value.
-            selected_in_group = bool(meta.group)
-
-            # Empty messages can still be sent on the wire if they were
-            # set (or received empty).
-            serialize_empty = isinstance(value, Message) and value._serialized_on_wire
-
-            include_default_value_for_oneof = self._include_default_value_for_oneof(
-                field_name=field_name, meta=meta
-            )
-
-            if value == self._get_field_default(field_name) and not (
-                selected_in_group or serialize_empty or include_default_value_for_oneof
-            ):
-                # Default (zero) values are not serialized. Two exceptions are
-                # if this is the selected oneof item or if we know we have to
-                # serialize an empty message (i.e. zero value was explicitly
-                # set by the user).
-                continue
-
-            if isinstance(value, list):
-                if meta.proto_type in PACKED_TYPES:
-                    # Packed lists look like a length-delimited field. First,
-                    # preprocess/encode each value into a buffer and then
-                    # treat it like a field of raw bytes.
-                    buf = bytearray()
-                    for item in value:
-                        buf += _preprocess_single(meta.proto_type, "", item)
-                    size += _len_single(meta.number, TYPE_BYTES, buf)
-                else:
-                    for item in value:
-                        size += (
-                            _len_single(
-                                meta.number,
-                                meta.proto_type,
-                                item,
-                                wraps=meta.wraps or "",
-                                serialize_empty=True,
-                            )
-                            # if it's an empty message it still needs to be represented
-                            # as an item in the repeated list
-                            or 2
-                        )
-
-            elif isinstance(value, dict):
-                for k, v in value.items():
-                    assert meta.map_types
-                    sk = _serialize_single(1, meta.map_types[0], k)
-                    sv = _serialize_single(2, meta.map_types[1], v)
-                    size += _len_single(meta.number, meta.proto_type, sk + sv)
-            else:
-                # If we have an empty string and we're including the default value for
-                # a oneof, make sure we serialize it. This ensures that the byte string
-                # output isn't simply an empty string. This also ensures that round trip
-                # serialization will keep `which_one_of` calls consistent.
-                if (
-                    isinstance(value, str)
-                    and value == ""
-                    and include_default_value_for_oneof
-                ):
-                    serialize_empty = True
-
-                size += _len_single(
-                    meta.number,
-                    meta.proto_type,
-                    value,
-                    serialize_empty=serialize_empty or bool(selected_in_group),
-                    wraps=meta.wraps or "",
-                )
-
-        size += len(self._unknown_fields)
-        return size
+        output = bytearray()
+        self._betterproto.encoder(self, output)
+        return len(output)
 
     # For compatibility with other libraries
     def SerializeToString(self: T) -> bytes:
@@ -1136,104 +2793,50 @@ class Message(ABC):
         return self.parse(pickled_bytes)
 
     def __reduce__(self) -> Tuple[Any, ...]:
-        return (self.__class__.FromString, (bytes(self),))
+        # Pickle the values of the fields rather than the encoded message, so that
+        # unpickling doesn't have to parse it again (lazily parsed fields are
+        # decoded, see `_LazyField.__reduce__`).
+        # Slotted messages have no `__dict__`, even if they have no fields.
+        if hasattr(self, "__dict__"):
+            values = self.__dict__
+        else:
+            values = tuple(
+                [slot.__get__(self) for slot in self._betterproto.field_slots]
+            )
+        return (
+            _unpickle_message,
+            (
+                self.__class__,
+                values,
+                self._serialized_on_wire,
+                self._unknown_fields,
+                self._group_current or None,
+            ),
+        )
 
     @classmethod
     def _type_hint(cls, field_name: str) -> Type:
-        return cls._type_hints()[field_name]
+        return cls._betterproto.type_hints[field_name]
 
     @classmethod
     def _type_hints(cls) -> Dict[str, Type]:
-        module = sys.modules[cls.__module__]
-        return get_type_hints(cls, module.__dict__, {})
+        return cls._betterproto.type_hints
 
     @classmethod
     def _cls_for(cls, field: dataclasses.Field, index: int = 0) -> Type:
         """Get the message class for a field from the type hints."""
-        field_cls = cls._type_hint(field.name)
-        if hasattr(field_cls, "__args__") and index >= 0:
-            if field_cls.__args__ is not None:
-                field_cls = field_cls.__args__[index]
-        return field_cls
+        return ProtoClassMetadata._get_field_cls(cls._type_hint(field.name), index)
 
     def _get_field_default(self, field_name: str) -> Any:
-        with warnings.catch_warnings():
-            # ignore warnings when initialising deprecated field defaults
-            warnings.filterwarnings("ignore", category=DeprecationWarning)
-            return self._betterproto.default_gen[field_name]()
+        meta = self._betterproto
+        try:
+            return meta.default_values[field_name]
+        except KeyError:
+            return meta.default_factories[field_name]()
 
     @classmethod
     def _get_field_default_gen(cls, field: dataclasses.Field) -> Any:
-        t = cls._type_hint(field.name)
-
-        if hasattr(t, "__origin__"):
-            if t.__origin__ is dict:
-                # This is some kind of map (dict in Python).
-                return dict
-            elif t.__origin__ is list:
-                # This is some kind of list (repeated) field.
-                return list
-            elif t.__origin__ is Union and t.__args__[1] is type(None):
-                # This is an optional field (either wrapped, or using proto3
-                # field presence). For setting the default we really don't care
-                # what kind of field it is.
-                return type(None)
-            else:
-                return t
-        elif issubclass(t, Enum):
-            # Enums always default to zero.
-            return t.try_value
-        elif t is datetime:
-            # Offsets are relative to 1970-01-01T00:00:00Z
-            return datetime_default_gen
-        else:
-            # This is either a primitive scalar or another message type. Calling
-            # it should result in its zero value.
-            return t
-
-    def _postprocess_single(
-        self, wire_type: int, meta: FieldMetadata, field_name: str, value: Any
-    ) -> Any:
-        """Adjusts values after parsing."""
-        if wire_type == WIRE_VARINT:
-            if meta.proto_type in (TYPE_INT32, TYPE_INT64):
-                bits = int(meta.proto_type[3:])
-                value = value & ((1 << bits) - 1)
-                signbit = 1 << (bits - 1)
-                value = int((value ^ signbit) - signbit)
-            elif meta.proto_type in (TYPE_SINT32, TYPE_SINT64):
-                # Undo zig-zag encoding
-                value = (value >> 1) ^ (-(value & 1))
-            elif meta.proto_type == TYPE_BOOL:
-                # Booleans use a varint encoding, so convert it to true/false.
-                value = value > 0
-            elif meta.proto_type == TYPE_ENUM:
-                # Convert enum ints to python enum instances
-                value = self._betterproto.cls_by_field[field_name].try_value(value)
-        elif wire_type in (WIRE_FIXED_32, WIRE_FIXED_64):
-            fmt = _pack_fmt(meta.proto_type)
-            value = struct.unpack(fmt, value)[0]
-        elif wire_type == WIRE_LEN_DELIM:
-            if meta.proto_type == TYPE_STRING:
-                value = str(value, "utf-8")
-            elif meta.proto_type == TYPE_MESSAGE:
-                cls = self._betterproto.cls_by_field[field_name]
-
-                if cls == datetime:
-                    value = _Timestamp().parse(value).to_datetime()
-                elif cls == timedelta:
-                    value = _Duration().parse(value).to_timedelta()
-                elif meta.wraps:
-                    # This is a Google wrapper value message around a single
-                    # scalar type.
-                    value = _get_wrapper(meta.wraps)().parse(value).value
-                else:
-                    value = cls().parse(value)
-                    value._serialized_on_wire = True
-            elif meta.proto_type == TYPE_MAP:
-                value = self._betterproto.cls_by_field[field_name]().parse(value)
-
-        return value
+        return cls._betterproto.default_gen[field.name]
 
     def _include_default_value_for_oneof(
         self, field_name: str, meta: FieldMetadata
@@ -1269,99 +2872,87 @@ class Message(ABC):
         if size == SIZE_DELIMITED:
             size, _ = load_varint(stream)
 
-        # Got some data over the wire
-        self._serialized_on_wire = True
-        proto_meta = self._betterproto
-        read = 0
-        for parsed in load_fields(stream):
-            field_name = proto_meta.field_name_by_number.get(parsed.number)
-            if not field_name:
-                self._unknown_fields += parsed.raw
-                continue
-
-            meta = proto_meta.meta_by_field_name[field_name]
-
-            value: Any
-            if parsed.wire_type == WIRE_LEN_DELIM and meta.proto_type in PACKED_TYPES:
-                # This is a packed repeated field.
-                pos = 0
-                value = []
-                while pos < len(parsed.value):
-                    if meta.proto_type in (TYPE_FLOAT, TYPE_FIXED32, TYPE_SFIXED32):
-                        decoded, pos = parsed.value[pos : pos + 4], pos + 4
-                        wire_type = WIRE_FIXED_32
-                    elif meta.proto_type in (TYPE_DOUBLE, TYPE_FIXED64, TYPE_SFIXED64):
-                        decoded, pos = parsed.value[pos : pos + 8], pos + 8
-                        wire_type = WIRE_FIXED_64
-                    else:
-                        decoded, pos = decode_varint(parsed.value, pos)
-                        wire_type = WIRE_VARINT
-                    decoded = self._postprocess_single(
-                        wire_type, meta, field_name, decoded
-                    )
-                    value.append(decoded)
-            else:
-                value = self._postprocess_single(
-                    parsed.wire_type, meta, field_name, parsed.value
-                )
-
-            try:
-                current = getattr(self, field_name)
-            except AttributeError:
-                current = self._get_field_default(field_name)
-                setattr(self, field_name, current)
-
-            if meta.proto_type == TYPE_MAP:
-                # Value represents a single key/value pair entry in the map.
-                current[value.key] = value.value
-            elif isinstance(current, list) and not isinstance(value, list):
-                current.append(value)
-            else:
-                setattr(self, field_name, value)
-
-            # If we have now loaded the expected length of the message, stop
-            if size is not None:
-                prev = read
-                read += len(parsed.raw)
-                if read == size:
-                    break
-                elif read > size:
+        if size is None:
+            data = stream.read()
+        else:
+            data = stream.read(size)
+            while len(data) < size:
+                chunk = stream.read(size - len(data))
+                if not chunk:
                     raise ValueError(
-                        f"Expected message of size {size}, can only read "
-                        f"either {prev} or {read} bytes - there is no "
-                        "message of the expected size in the stream."
+                        f"Expected message of size {size}, but was only able to "
+                        f"read {len(data)} bytes - the stream may have ended too "
+                        "soon, or the expected size may have been incorrect."
                     )
+                data += chunk
 
-        if size is not None and read < size:
-            raise ValueError(
-                f"Expected message of size {size}, but was only able to "
-                f"read {read} bytes - the stream may have ended too soon,"
-                " or the expected size may have been incorrect."
-            )
-
-        return self
+        return self.parse(data)
 
-    def parse(self: T, data: bytes) -> T:
+    def parse(
+        self: T,
+        data: Buffer,
+        lazy: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        keep_skipped: bool = True,
+    ) -> T:
         """
         Parse the binary encoded Protobuf into this message instance. This
         returns the instance itself and is therefore assignable and chainable.
 
+        The data is decoded in place, so any object supporting the buffer protocol
+        (e.g. :class:`bytearray`, :class:`memoryview` or :class:`mmap.mmap`) can be
+        parsed without first being copied into :class:`bytes`.
+
         Parameters
         -----------
-        data: :class:`bytes`
+        data: Union[:class:`bytes`, :class:`bytearray`, :class:`memoryview`]
             The data to parse the message from.
+        lazy: :class:`bool`
+            If ``True``, nested messages are kept in their encoded form and only
+            decoded when they are first accessed. Nested messages which are never
+            accessed are serialized again as they were received, without being
+            decoded at all. Errors in their encoding are only raised on access.
+        fields: Optional[Iterable[:class:`str`]]
+            The fields to decode, if not all of them. Fields of nested messages are
+            selected with dotted paths, e.g. ``["header.trace_id", "items.id"]``.
+            All other fields are skipped over without being decoded.
+        keep_skipped: :class:`bool`
+            Whether fields skipped due to ``fields`` are kept as unknown fields (so
+            they're serialized again) or dropped. Default is ``True``.
 
         Returns
         --------
         :class:`Message`
             The initialized message.
         """
-        with BytesIO(data) as stream:
-            return self.load(stream)
+        if fields is not None:
+            decoder = self._betterproto.get_projected_decoder(
+                tuple(fields), keep_skipped, lazy
+            )
+        elif lazy:
+            decoder = self._betterproto.lazy_decoder
+        else:
+            decoder = self._betterproto.decoder
+
+        buffer = memoryview(data)
+        if buffer.ndim != 1 or buffer.format != "B":
+            buffer = buffer.cast("B")
+
+        # Got some data over the wire
+        self._serialized_on_wire = True
+        try:
+            decoder(self, buffer, 0, len(buffer))
+        except (EOFError, IndexError, struct.error) as e:
+            raise ValueError(
+                "Unable to parse message - the data ended unexpectedly."
+            ) from e
+        finally:
+            buffer.release()
+        return self
 
     # For compatibility with other libraries.
     @classmethod
-    def FromString(cls: Type[T], data: bytes) -> T:
+    def FromString(cls: Type[T], data: Buffer, lazy: bool = False) -> T:
         """
         Parse the binary encoded Protobuf into this message instance. This
         returns the instance itself and is therefore assignable and chainable.
@@ -1375,13 +2966,15 @@ class Message(ABC):
         -----------
         data: :class:`bytes`
             The data to parse the protobuf from.
+        lazy: :class:`bool`
+            Whether to decode nested messages on first access, see :meth:`parse`.
 
         Returns
         --------
         :class:`Message`
             The initialized message.
         """
-        return cls().parse(data)
+        return cls._from_wire().parse(data, lazy)
 
     def to_dict(
         self, casing: Casing = Casing.CAMEL, include_default_values: bool = False
@@ -1404,185 +2997,7 @@ class Message(ABC):
         Dict[:class:`str`, Any]
             The JSON serializable dict representation of this object.
         """
-        output: Dict[str, Any] = {}
-        field_types = self._type_hints()
-        defaults = self._betterproto.default_gen
-        for field_name, meta in self._betterproto.meta_by_field_name.items():
-            field_is_repeated = defaults[field_name] is list
-            try:
-                value = getattr(self, field_name)
-            except AttributeError:
-                value = self._get_field_default(field_name)
-            cased_name = casing(field_name).rstrip("_")  # type: ignore
-            if meta.proto_type == TYPE_MESSAGE:
-                if isinstance(value, datetime):
-                    if (
-                        value != DATETIME_ZERO
-                        or include_default_values
-                        or self._include_default_value_for_oneof(
-                            field_name=field_name, meta=meta
-                        )
-                    ):
-                        output[cased_name] = _Timestamp.timestamp_to_json(value)
-                elif isinstance(value, timedelta):
-                    if (
-                        value != timedelta(0)
-                        or include_default_values
-                        or self._include_default_value_for_oneof(
-                            field_name=field_name, meta=meta
-                        )
-                    ):
-                        output[cased_name] = _Duration.delta_to_json(value)
-                elif meta.wraps:
-                    if value is not None or include_default_values:
-                        output[cased_name] = value
-                elif field_is_repeated:
-                    # Convert each item.
-                    cls = self._betterproto.cls_by_field[field_name]
-                    if cls == datetime:
-                        value = [_Timestamp.timestamp_to_json(i) for i in value]
-                    elif cls == timedelta:
-                        value = [_Duration.delta_to_json(i) for i in value]
-                    else:
-                        value = [
-                            i.to_dict(casing, include_default_values) for i in value
-                        ]
-                    if value or include_default_values:
-                        output[cased_name] = value
-                elif value is None:
-                    if include_default_values:
-                        output[cased_name] = value
-                elif (
-                    value._serialized_on_wire
-                    or include_default_values
-                    or self._include_default_value_for_oneof(
-                        field_name=field_name, meta=meta
-                    )
-                ):
-                    output[cased_name] = value.to_dict(casing, include_default_values)
-            elif meta.proto_type == TYPE_MAP:
-                output_map = {**value}
-                for k in value:
-                    if hasattr(value[k], "to_dict"):
-                        output_map[k] = value[k].to_dict(casing, include_default_values)
-
-                if value or include_default_values:
-                    output[cased_name] = output_map
-            elif (
-                value != self._get_field_default(field_name)
-                or include_default_values
-                or self._include_default_value_for_oneof(
-                    field_name=field_name, meta=meta
-                )
-            ):
-                if meta.proto_type in INT_64_TYPES:
-                    if field_is_repeated:
-                        output[cased_name] = [str(n) for n in value]
-                    elif value is None:
-                        if include_default_values:
-                            output[cased_name] = value
-                    else:
-                        output[cased_name] = str(value)
-                elif meta.proto_type == TYPE_BYTES:
-                    if field_is_repeated:
-                        output[cased_name] = [
-                            b64encode(b).decode("utf8") for b in value
-                        ]
-                    elif value is None and include_default_values:
-                        output[cased_name] = value
-                    else:
-                        output[cased_name] = b64encode(value).decode("utf8")
-                elif meta.proto_type == TYPE_ENUM:
-                    if field_is_repeated:
-                        enum_class = field_types[field_name].__args__[0]
-                        if isinstance(value, typing.Iterable) and not isinstance(
-                            value, str
-                        ):
-                            output[cased_name] = [enum_class(el).name for el in value]
-                        else:
-                            # transparently upgrade single value to repeated
-                            output[cased_name] = [enum_class(value).name]
-                    elif value is None:
-                        if include_default_values:
-                            output[cased_name] = value
-                    elif meta.optional:
-                        enum_class = field_types[field_name].__args__[0]
-                        output[cased_name] = enum_class(value).name
-                    else:
-                        enum_class = field_types[field_name]  # noqa
-                        output[cased_name] = enum_class(value).name
-                elif meta.proto_type in (TYPE_FLOAT, TYPE_DOUBLE):
-                    if field_is_repeated:
-                        output[cased_name] = [_dump_float(n) for n in value]
-                    else:
-                        output[cased_name] = _dump_float(value)
-                else:
-                    output[cased_name] = value
-        return output
-
-    @classmethod
-    def _from_dict_init(cls, mapping: Mapping[str, Any]) -> Mapping[str, Any]:
-        init_kwargs: Dict[str, Any] = {}
-        for key, value in mapping.items():
-            field_name = safe_snake_case(key)
-            try:
-                meta = cls._betterproto.meta_by_field_name[field_name]
-            except KeyError:
-                continue
-            if value is None:
-                continue
-
-            if meta.proto_type == TYPE_MESSAGE:
-                sub_cls = cls._betterproto.cls_by_field[field_name]
-                if sub_cls == datetime:
-                    value = (
-                        [isoparse(item) for item in value]
-                        if isinstance(value, list)
-                        else isoparse(value)
-                    )
-                elif sub_cls == timedelta:
-                    value = (
-                        [timedelta(seconds=float(item[:-1])) for item in value]
-                        if isinstance(value, list)
-                        else timedelta(seconds=float(value[:-1]))
-                    )
-                elif not meta.wraps:
-                    value = (
-                        [sub_cls.from_dict(item) for item in value]
-                        if isinstance(value, list)
-                        else sub_cls.from_dict(value)
-                    )
-            elif meta.map_types and meta.map_types[1] == TYPE_MESSAGE:
-                sub_cls = cls._betterproto.cls_by_field[f"{field_name}.value"]
-                value = {k: sub_cls.from_dict(v) for k, v in value.items()}
-            else:
-                if meta.proto_type in INT_64_TYPES:
-                    value = (
-                        [int(n) for n in value]
-                        if isinstance(value, list)
-                        else int(value)
-                    )
-                elif meta.proto_type == TYPE_BYTES:
-                    value = (
-                        [b64decode(n) for n in value]
-                        if isinstance(value, list)
-                        else b64decode(value)
-                    )
-                elif meta.proto_type == TYPE_ENUM:
-                    enum_cls = cls._betterproto.cls_by_field[field_name]
-                    if isinstance(value, list):
-                        value = [enum_cls.from_string(e) for e in value]
-                    elif isinstance(value, str):
-                        value = enum_cls.from_string(value)
-                elif meta.proto_type in (TYPE_FLOAT, TYPE_DOUBLE):
-                    value = (
-                        [_parse_float(n) for n in value]
-                        if isinstance(value, list)
-                        else _parse_float(value)
-                    )
-
-            init_kwargs[field_name] = value
-        return init_kwargs
+        return self._betterproto.get_dict_encoder(casing, include_default_values)(self)
 
     @hybridmethod
     def from_dict(cls: type[Self], value: Mapping[str, Any]) -> Self:  # type: ignore
@@ -1599,8 +3014,13 @@ class Message(ABC):
         :class:`Message`
             The initialized message.
         """
-        self = cls(**cls._from_dict_init(value))
-        self._serialized_on_wire = True
+        if hasattr(cls, "__pydantic_model__"):
+            # Pydantic dataclasses validate (and coerce) their fields in `__init__`.
+            self = cls(**cls._betterproto.get_dict_kwargs_decoder()(value))
+            self._serialized_on_wire = True
+            return self
+        self = cls._from_wire()
+        cls._betterproto.get_dict_decoder()(self, value)
         return self
 
     @from_dict.instancemethod
@@ -1620,8 +3040,7 @@ class Message(ABC):
             The initialized message.
         """
         self._serialized_on_wire = True
-        for field, value in self._from_dict_init(value).items():
-            setattr(self, field, value)
+        self._betterproto.get_dict_decoder()(self, value)
         return self
 
     def to_json(
@@ -1629,6 +3048,7 @@ class Message(ABC):
         indent: Union[None, int, str] = None,
         include_default_values: bool = False,
         casing: Casing = Casing.CAMEL,
+        backend: Union[None, str, JsonBackend] = None,
     ) -> str:
         """A helper function to parse the message instance into its JSON
         representation.
@@ -1637,6 +3057,8 @@ class Message(ABC):
 
             json.dumps(message.to_dict(), indent=indent)
 
+        with the default JSON backend.
+
         Parameters
         -----------
         indent: Optional[Union[:class:`int`, :class:`str`]]
@@ -1651,17 +3073,60 @@ class Message(ABC):
             The casing to use for key values. Default is :attr:`Casing.CAMEL` for
             compatibility purposes.
 
+        backend: Optional[Union[:class:`str`, :class:`JsonBackend`]]
+            The JSON backend to use, see :func:`get_json_backend`. Defaults to the one
+            set with :func:`set_json_backend`.
+
         Returns
         --------
         :class:`str`
             The JSON representation of the message.
         """
-        return json.dumps(
+        return get_json_backend(backend).dumps(
             self.to_dict(include_default_values=include_default_values, casing=casing),
-            indent=indent,
+            indent,
+        )
+
+    def dump_json(
+        self,
+        stream: "SupportsWrite[str]",
+        indent: Union[None, int, str] = None,
+        include_default_values: bool = False,
+        casing: Casing = Casing.CAMEL,
+    ) -> None:
+        """
+        Writes the JSON representation of the message into a text stream, as
+        returned by :meth:`to_json`, but piece by piece from the fields of the
+        message rather than building its dict representation first.
+
+        Parameters
+        -----------
+        stream: :class:`io.TextIOBase`
+            The stream to write to.
+
+        indent: Optional[Union[:class:`int`, :class:`str`]]
+            The indent, as passed to :func:`json.dumps`.
+
+        include_default_values: :class:`bool`
+            If ``True`` will include the default values of fields. Default is ``False``.
+            E.g. an ``int32`` field will be included with a value of ``0`` if this is
+            set to ``True``, otherwise this would be ignored.
+
+        casing: :class:`Casing`
+            The casing to use for key values. Default is :attr:`Casing.CAMEL` for
+            compatibility purposes.
+        """
+        if isinstance(indent, int):
+            indent = " " * indent
+        _write_json_message(
+            self, casing, include_default_values, stream.write, indent, 0
         )
 
-    def from_json(self: T, value: Union[str, bytes]) -> T:
+    def from_json(
+        self: T,
+        value: Union[str, bytes],
+        backend: Union[None, str, JsonBackend] = None,
+    ) -> T:
         """A helper function to return the message instance from its JSON
         representation. This returns the instance itself and is therefore assignable
         and chainable.
@@ -1670,17 +3135,23 @@ class Message(ABC):
 
             return message.from_dict(json.loads(value))
 
+        with the default JSON backend.
+
         Parameters
         -----------
         value: Union[:class:`str`, :class:`bytes`]
             The value to pass to :func:`json.loads`.
 
+        backend: Optional[Union[:class:`str`, :class:`JsonBackend`]]
+            The JSON backend to use, see :func:`get_json_backend`. Defaults to the one
+            set with :func:`set_json_backend`.
+
         Returns
         --------
         :class:`Message`
             The initialized message.
         """
-        return self.from_dict(json.loads(value))
+        return self.from_dict(get_json_backend(backend).loads(value))
 
     def to_pydict(
         self, casing: Casing = Casing.CAMEL, include_default_values: bool = False
@@ -1705,10 +3176,12 @@ class Message(ABC):
         """
         output: Dict[str, Any] = {}
         defaults = self._betterproto.default_gen
+        output_names = self._betterproto.get_output_names(casing)
         for field_name, meta in self._betterproto.meta_by_field_name.items():
-            field_is_repeated = defaults[field_name] is list
+            default_gen = defaults[field_name]
+            field_is_repeated = default_gen is list
             value = getattr(self, field_name)
-            cased_name = casing(field_name).rstrip("_")  # type: ignore
+            cased_name = output_names[field_name]
             if meta.proto_type == TYPE_MESSAGE:
                 if isinstance(value, datetime):
                     if (
@@ -1755,7 +3228,11 @@ class Message(ABC):
                 if value or include_default_values:
                     output[cased_name] = value
             elif (
-                value != self._get_field_default(field_name)
+                (
+                    len(value) > 0
+                    if isinstance(default_gen, _ArrayGen)
+                    else value != self._get_field_default(field_name)
+                )
                 or include_default_values
                 or self._include_default_value_for_oneof(
                     field_name=field_name, meta=meta
@@ -1780,8 +3257,9 @@ class Message(ABC):
             The initialized message.
         """
         self._serialized_on_wire = True
+        field_name_by_key = self._betterproto.field_name_by_key
         for key in value:
-            field_name = safe_snake_case(key)
+            field_name = field_name_by_key.get(key) or safe_snake_case(key)
             meta = self._betterproto.meta_by_field_name.get(field_name)
             if not meta:
                 continue
@@ -1792,7 +3270,7 @@ class Message(ABC):
                     if isinstance(v, list):
                         cls = self._betterproto.cls_by_field[field_name]
                         for item in value[key]:
-                            v.append(cls().from_pydict(item))
+                            v.append(cls._from_wire().from_pydict(item))
                     elif isinstance(v, datetime):
                         v = value[key]
                     elif isinstance(v, timedelta):
@@ -1807,9 +3285,12 @@ class Message(ABC):
                     v = getattr(self, field_name)
                     cls = self._betterproto.cls_by_field[f"{field_name}.value"]
                     for k in value[key]:
-                        v[k] = cls().from_pydict(value[key][k])
+                        v[k] = cls._from_wire().from_pydict(value[key][k])
                 else:
                     v = value[key]
+                    default_gen = self._betterproto.default_gen[field_name]
+                    if isinstance(default_gen, _ArrayGen):
+                        v = default_gen.from_list(v)
 
                 if v is not None:
                     setattr(self, field_name, v)
@@ -1873,7 +3354,14 @@ Message.__annotations__ = {}  # HACK to avoid typing.get_type_hints breaking :)
 try:
     import betterproto_rust_codec
 
-    def __parse_patch(self: T, data: bytes) -> T:
+    def __parse_patch(
+        self: T,
+        data: bytes,
+        lazy: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        keep_skipped: bool = True,
+    ) -> T:
+        # The Rust codec always decodes the whole message.
         betterproto_rust_codec.deserialize(self, data)
         return self
 
@@ -1900,6 +3388,57 @@ def serialized_on_wire(message: Message) -> bool:
     return message._serialized_on_wire
 
 
+def get_message_class(name: str) -> Type[Message]:
+    """
+    Return the class of a generated message from its fully qualified protobuf name,
+    like ``google.protobuf.Timestamp``. The module defining it must have been
+    imported.
+
+    Raises
+    -------
+    :class:`KeyError`
+        If no message class of that name has been imported.
+    """
+    return _MESSAGE_CLASSES[name]
+
+
+def warmup(module: Optional[ModuleType] = None) -> None:
+    """
+    Initialize the metadata used to (de)serialize the messages of a module (or of
+    every generated message imported so far), and of the messages they refer to,
+    ahead of their first use, e.g. when an application starts up. Otherwise this
+    is done when each class is first used.
+
+    Parameters
+    -----------
+    module: Optional[:class:`ModuleType`]
+        The module whose messages to initialize.
+    """
+    if module is None:
+        pending = list(_MESSAGE_CLASSES.values())
+    else:
+        pending = [
+            value
+            for value in vars(module).values()
+            if isinstance(value, type)
+            and issubclass(value, Message)
+            and value.__module__ == module.__name__
+            and dataclasses.is_dataclass(value)
+        ]
+
+    seen: Set[Type[Message]] = set()
+    while pending:
+        cls = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        pending.extend(
+            field_cls
+            for field_cls in cls._betterproto.cls_by_field.values()
+            if isinstance(field_cls, type) and issubclass(field_cls, Message)
+        )
+
+
 def which_one_of(message: Message, group_name: str) -> Tuple[str, Optional[Any]]:
     """
     Return the name and value of a message's one-of field group.
@@ -0,0 +1,274 @@
+"""
+Parsing and serializing large batches of messages in parallel, across a pool of
+processes. The encoded messages are handed over through shared memory, so only the
+messages themselves are pickled (see :meth:`Message.__reduce__`). Batches parsed or
+serialized in parallel require Python 3.8 or later.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from array import array
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    wait,
+)
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from typing_extensions import Buffer
+
+from . import (
+    Message,
+    _decode_message,
+)
+from ._types import T
+
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # for Python<3.8
+    SharedMemory = None  # type: ignore
+
+
+#: The number of messages parsed or serialized by a worker at once.
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def parse_many(
+    cls: Type[T],
+    data: Iterable[Buffer],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    transform: Optional[Callable[[T], Any]] = None,
+) -> List[Any]:
+    """
+    Parses a batch of encoded messages, in parallel if it's larger than a chunk.
+
+    The encoded messages are copied into shared memory once, and each worker parses
+    chunks of them in place. The parsed messages are pickled back, which costs less
+    than parsing them but is not free: when only something derived from each
+    message is needed, derive it in the workers with ``transform``.
+
+    Parameters
+    -----------
+    cls: Type[:class:`Message`]
+        The class of the messages.
+    data: Iterable[Union[:class:`bytes`, :class:`bytearray`, :class:`memoryview`]]
+        The encoded messages.
+    workers: Optional[:class:`int`]
+        The number of processes to parse with, by default as many as there are
+        CPUs. ``1`` parses in the calling process.
+    chunk_size: :class:`int`
+        The number of messages parsed by a worker at once.
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        A (process) pool to reuse across batches, instead of starting one for the
+        batch. ``workers`` is ignored.
+    transform: Optional[Callable[[:class:`Message`], Any]]
+        A (picklable) function to apply to each parsed message, whose results are
+        returned instead of the messages.
+
+    Returns
+    --------
+    List[Any]
+        The parsed messages, or the results of ``transform``, in order.
+
+    Raises
+    -------
+    :class:`ValueError`
+        If a message is truncated.
+    :class:`RuntimeError`
+        If the batch is parsed in parallel on Python 3.7.
+    """
+    records = data if isinstance(data, Sequence) else list(data)
+    if not _is_parallel(len(records), workers, chunk_size, executor):
+        messages = [cls.FromString(record) for record in records]
+        return messages if transform is None else list(map(transform, messages))
+
+    offsets = array("Q", [0])
+    for record in records:
+        offsets.append(offsets[-1] + memoryview(record).nbytes)
+
+    shm = SharedMemory(create=True, size=max(offsets[-1], 1))
+    try:
+        for index, record in enumerate(records):
+            shm.buf[offsets[index] : offsets[index + 1]] = memoryview(record).cast("B")
+        chunks = [
+            (cls, shm.name, offsets[start : start + chunk_size + 1], transform)
+            for start in range(0, len(records), chunk_size)
+        ]
+        return [
+            result
+            for results in _map(_parse_chunk, chunks, workers, executor)
+            for result in results
+        ]
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def serialize_many(
+    messages: Iterable[Message],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> List[bytes]:
+    """
+    Serializes a batch of messages, in parallel if it's larger than a chunk.
+
+    The messages are pickled to the workers, and each worker serializes chunks of
+    them into shared memory. Pickling a message is cheaper than serializing it
+    when it mostly holds numbers (e.g. packed repeated fields), but for messages of
+    a few small fields it costs about as much, leaving little to gain.
+
+    Parameters
+    -----------
+    messages: Iterable[:class:`Message`]
+        The messages.
+    workers: Optional[:class:`int`]
+        The number of processes to serialize with, by default as many as there are
+        CPUs. ``1`` serializes in the calling process.
+    chunk_size: :class:`int`
+        The number of messages serialized by a worker at once.
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        A (process) pool to reuse across batches, instead of starting one for the
+        batch. ``workers`` is ignored.
+
+    Returns
+    --------
+    List[:class:`bytes`]
+        The encoded messages, in order.
+
+    Raises
+    -------
+    :class:`RuntimeError`
+        If the batch is serialized in parallel on Python 3.7.
+    """
+    messages = messages if isinstance(messages, Sequence) else list(messages)
+    if not _is_parallel(len(messages), workers, chunk_size, executor):
+        return [bytes(message) for message in messages]
+
+    chunks = [
+        messages[start : start + chunk_size]
+        for start in range(0, len(messages), chunk_size)
+    ]
+    blocks = iter(_map(_serialize_chunk, chunks, workers, executor, _discard_block))
+    outputs = []
+    try:
+        for name, offsets in blocks:
+            shm = SharedMemory(name)
+            try:
+                outputs.extend(
+                    shm.buf[start:end].tobytes()
+                    for start, end in zip(offsets, offsets[1:])
+                )
+            finally:
+                shm.close()
+                shm.unlink()
+    finally:
+        # Unlink the blocks left if copying out of one failed.
+        for block in blocks:
+            _discard_block(block)
+    return outputs
+
+
+def _is_parallel(
+    count: int, workers: Optional[int], chunk_size: int, executor: Optional[Executor]
+) -> bool:
+    """Whether a batch is worth splitting across processes."""
+    if count <= chunk_size:
+        return False
+    if executor is None and workers is not None and workers <= 1:
+        return False
+    if SharedMemory is None:
+        raise RuntimeError(
+            "Parallel batches require Python 3.8 or later, pass workers=1 to "
+            "process them in the calling process"
+        )
+    return True
+
+
+def _map(
+    function: Callable[[Any], T],
+    chunks: List[Any],
+    workers: Optional[int],
+    executor: Optional[Executor],
+    discard: Optional[Callable[[T], Any]] = None,
+) -> List[T]:
+    """
+    Runs a function over each chunk in a pool, returning the results in order. If
+    any chunk fails, the results of the others are passed to ``discard`` before the
+    error is raised.
+    """
+    if executor is None:
+        workers = min(workers or os.cpu_count() or 1, len(chunks))
+        with ProcessPoolExecutor(workers) as executor:
+            return _map(function, chunks, workers, executor, discard)
+
+    futures = [executor.submit(function, chunk) for chunk in chunks]
+    wait(futures)
+    errors = [future.exception() for future in futures if future.exception()]
+    if errors:
+        if discard is not None:
+            for future in futures:
+                if future.exception() is None:
+                    discard(future.result())
+        raise errors[0]
+    return [future.result() for future in futures]
+
+
+def _parse_chunk(
+    chunk: Tuple[Type[T], str, array, Optional[Callable[[T], Any]]]
+) -> List[Any]:
+    """Parses the messages between consecutive offsets of a shared memory block."""
+    cls, name, offsets, transform = chunk
+    shm = SharedMemory(name)
+    try:
+        messages = [
+            _decode_message(cls, shm.buf, start, end)
+            for start, end in zip(offsets, offsets[1:])
+        ]
+    except (EOFError, IndexError, struct.error) as e:
+        raise ValueError(
+            "Unable to parse message - the data ended unexpectedly."
+        ) from e
+    finally:
+        shm.close()
+    return messages if transform is None else list(map(transform, messages))
+
+
+def _serialize_chunk(messages: Sequence[Message]) -> Tuple[str, array]:
+    """
+    Serializes messages into a new shared memory block, returning its name and the
+    offsets of the messages in it. The caller unlinks the block.
+    """
+    output = bytearray()
+    offsets = array("Q", [0])
+    for message in messages:
+        message.dump_into(output)
+        offsets.append(len(output))
+
+    shm = SharedMemory(create=True, size=max(len(output), 1))
+    try:
+        shm.buf[: len(output)] = output
+    finally:
+        shm.close()
+    return shm.name, offsets
+
+
+def _discard_block(block: Tuple[str, array]) -> None:
+    """Unlinks a shared memory block made by :func:`_serialize_chunk`."""
+    shm = SharedMemory(block[0])
+    shm.close()
+    shm.unlink()
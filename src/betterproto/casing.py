@@ -1,5 +1,6 @@
 import keyword
 import re
+from functools import lru_cache
 
 
 # Word delimiters and symbols that will not be preserved when re-casing.
@@ -14,7 +15,15 @@ WORD = "[A-Z]*[a-z]*[0-9]*"
 # language=PythonRegExp
 WORD_UPPER = "[A-Z]+(?![a-z])[0-9]*"
 
+SNAKE_CASE_PATTERN = re.compile(f"(^)?({SYMBOLS})({WORD_UPPER}|{WORD})")
+PASCAL_CASE_PATTERN = re.compile(f"({SYMBOLS})({WORD_UPPER}|{WORD})")
 
+# How many values of each casing are remembered, as the same names (e.g. of fields
+# and map keys) keep being converted.
+CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CACHE_SIZE)
 def safe_snake_case(value: str) -> str:
     """Snake case a value taking into account Python keywords."""
     value = snake_case(value)
@@ -22,6 +31,7 @@ def safe_snake_case(value: str) -> str:
     return value
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def snake_case(value: str, strict: bool = True) -> str:
     """
     Join words with an underscore into lowercase and remove symbols.
@@ -55,14 +65,14 @@ def snake_case(value: str, strict: bool = True) -> str:
 
         return ("_" * delimiter_count) + word.lower()
 
-    snake = re.sub(
-        f"(^)?({SYMBOLS})({WORD_UPPER}|{WORD})",
+    snake = SNAKE_CASE_PATTERN.sub(
         lambda groups: substitute_word(groups[2], groups[3], groups[1] is not None),
         value,
     )
     return snake
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def pascal_case(value: str, strict: bool = True) -> str:
     """
     Capitalize each word and remove symbols.
@@ -91,13 +101,13 @@ def pascal_case(value: str, strict: bool = True) -> str:
 
         return ("_" * delimiter_length) + word.capitalize()
 
-    return re.sub(
-        f"({SYMBOLS})({WORD_UPPER}|{WORD})",
+    return PASCAL_CASE_PATTERN.sub(
         lambda groups: substitute_word(groups[1], groups[2]),
         value,
     )
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def camel_case(value: str, strict: bool = True) -> str:
     """
     Capitalize all words except first and remove symbols.
@@ -162,6 +162,10 @@ class Enum(IntEnum if TYPE_CHECKING else int, metaclass=EnumType):
     def __deepcopy__(self, memo: Any) -> Self:
         return self
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Members are made with keyword arguments, which pickle can't pass.
+        return self.__class__.try_value, (self.value,)
+
     @classmethod
     def try_value(cls, value: int = 0) -> Self:
         """Return the value which corresponds to the value.
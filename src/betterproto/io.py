@@ -0,0 +1,634 @@
+"""
+Reading and writing streams of size-delimited messages, as written by
+``message.dump(stream, betterproto.SIZE_DELIMITED)``: each message prefixed with a
+varint declaring its size, and indexing files of them for random access.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from base64 import (
+    b64decode,
+    b64encode,
+)
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from . import (
+    SIZE_DELIMITED,
+    Message,
+    _decode_message,
+    decode_varint,
+    size_varint,
+    which_one_of,
+)
+from ._types import T
+
+
+if TYPE_CHECKING:
+    from _typeshed import (
+        SupportsRead,
+        SupportsWrite,
+    )
+
+
+#: The default number of bytes read or written at once.
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+Source = Union["SupportsRead[bytes]", bytes, bytearray, memoryview, mmap.mmap]
+
+
+class DelimitedReader(Generic[T]):
+    """
+    Iterates lazily over the size-delimited messages of a binary stream, or of a
+    buffer (e.g. :class:`bytes` or the :class:`mmap.mmap` of a file) which is parsed
+    in place.
+
+    Streams are read in chunks of (at least) ``buffer_size`` bytes, rather than
+    reading each size prefix byte by byte like :meth:`Message.load` does.
+
+    Parameters
+    -----------
+    source: Union[:class:`BinaryIO`, :class:`bytes`, :class:`bytearray`, :class:`memoryview`, :class:`mmap.mmap`]
+        The stream or buffer to read messages from.
+    cls: Type[:class:`Message`]
+        The class of the messages.
+    lazy: :class:`bool`
+        Whether nested messages are only decoded on first access, see
+        :meth:`Message.parse`.
+    buffer_size: :class:`int`
+        The number of bytes read from streams at once.
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        cls: Type[T],
+        lazy: bool = False,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        self.source = source
+        self.cls = cls
+        self.lazy = lazy
+        self.buffer_size = buffer_size
+
+    def __iter__(self) -> Iterator[T]:
+        cls = self.cls
+        lazy = self.lazy
+        for _, view, start, end in self._records():
+            try:
+                yield _decode_message(cls, view, start, end, lazy)
+            except (EOFError, IndexError, struct.error) as e:
+                raise ValueError(
+                    "Unable to parse message - the data ended unexpectedly."
+                ) from e
+
+    def _records(self) -> Iterator[Tuple[int, memoryview, int, int]]:
+        """
+        Yields the offset of each message (size prefix included) from the start of
+        the source, and the buffer holding the message with its start and end in
+        it. The buffer is only valid until the next message is read.
+        """
+        if isinstance(self.source, _BUFFER_TYPES):
+            with memoryview(self.source) as view:
+                if view.ndim != 1 or view.format != "B":
+                    view = view.cast("B")
+                pos = 0
+                end = len(view)
+                while pos < end:
+                    try:
+                        start, stop = _read_prefix(view, pos)
+                    except EOFError:
+                        raise _truncated() from None
+                    if stop > end:
+                        raise _truncated()
+                    yield pos, view, start, stop
+                    pos = stop
+            return
+
+        read = self.source.read  # type: ignore
+        buffer = bytearray()
+        # The start of the next message (size prefix included) in the buffer, and
+        # how many more bytes at least are needed to read it.
+        pos = 0
+        needed = 0
+        # The offset of the buffer from the start of the stream.
+        base = 0
+        while True:
+            chunk = read(max(self.buffer_size, needed))
+            if not chunk:
+                if pos < len(buffer):
+                    raise _truncated()
+                return
+            del buffer[:pos]
+            base += pos
+            buffer += chunk
+            pos = 0
+
+            with memoryview(buffer) as view:
+                end = len(view)
+                while pos < end:
+                    try:
+                        start, stop = _read_prefix(view, pos)
+                    except EOFError:
+                        # The size prefix is incomplete.
+                        needed = 1
+                        break
+                    if stop > end:
+                        needed = stop - end
+                        break
+                    yield base + pos, view, start, stop
+                    pos = stop
+                else:
+                    needed = 0
+
+
+def _read_prefix(view: memoryview, pos: int) -> Tuple[int, int]:
+    """Returns the start and end of the size-delimited message at a position."""
+    size, start = decode_varint(view, pos)
+    return start, start + size
+
+
+def _truncated() -> ValueError:
+    return ValueError("Unable to read message - the data ended unexpectedly.")
+
+
+class DelimitedWriter:
+    """
+    Writes size-delimited messages into a binary stream, in batches of (at least)
+    ``buffer_size`` bytes. Pending messages are written when the writer is flushed,
+    or used as a context manager and exited.
+
+    Parameters
+    -----------
+    stream: :class:`BinaryIO`
+        The stream to write messages to.
+    buffer_size: :class:`int`
+        The number of bytes to batch before writing them to the stream.
+    """
+
+    def __init__(
+        self,
+        stream: "SupportsWrite[bytes]",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+
+    def write(self, message: Message) -> int:
+        """
+        Writes a message.
+
+        Returns
+        --------
+        :class:`int`
+            The number of bytes written, size prefix included.
+        """
+        size = message.dump_into(self.buffer, SIZE_DELIMITED)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+        return size
+
+    def write_many(self, messages: Iterable[Message]) -> int:
+        """
+        Writes messages.
+
+        Returns
+        --------
+        :class:`int`
+            The number of bytes written, size prefixes included.
+        """
+        return sum(map(self.write, messages))
+
+    def flush(self) -> None:
+        """Writes the pending messages to the stream."""
+        if self.buffer:
+            self.stream.write(self.buffer)
+            del self.buffer[:]
+
+    def __enter__(self) -> DelimitedWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.flush()
+
+
+def read_delimited(
+    source: Source,
+    cls: Type[T],
+    lazy: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Iterator[T]:
+    """
+    Iterates lazily over the size-delimited messages of a binary stream or buffer,
+    see :class:`DelimitedReader`.
+    """
+    return iter(DelimitedReader(source, cls, lazy, buffer_size))
+
+
+def write_delimited(
+    stream: "SupportsWrite[bytes]",
+    messages: Iterable[Message],
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> int:
+    """
+    Writes messages size-delimited into a binary stream, in batches, see
+    :class:`DelimitedWriter`.
+
+    Returns
+    --------
+    :class:`int`
+        The number of bytes written, size prefixes included.
+    """
+    with DelimitedWriter(stream, buffer_size) as writer:
+        return writer.write_many(messages)
+
+
+#: The suffix of the sidecar file an index of a file is saved to.
+INDEX_SUFFIX = ".idx"
+
+_INDEX_MAGIC = b"BPIDX\x01"
+_KEY_TYPES = (str, bytes, int, float, type(None))
+
+
+class DelimitedIndex:
+    """
+    The offsets of the size-delimited messages of a file, and optionally the
+    records holding each value of a key field, so that single messages can be read
+    without parsing the ones before them, see :class:`IndexedReader`.
+
+    Parameters
+    -----------
+    offsets: Iterable[:class:`int`]
+        The offset of each message (size prefix included) from the start of the
+        file.
+    size: :class:`int`
+        The size of the indexed file, used to detect stale indexes.
+    key: Optional[:class:`str`]
+        The (dotted) path of the field the messages are indexed by, if any.
+    keys: Optional[List[Any]]
+        The value of the key field of each message.
+    mtime: Optional[:class:`int`]
+        The modification time of the indexed file in nanoseconds, if known, used
+        to detect stale indexes.
+    """
+
+    def __init__(
+        self,
+        offsets: Iterable[int],
+        size: int,
+        key: Optional[str] = None,
+        keys: Optional[List[Any]] = None,
+        mtime: Optional[int] = None,
+    ):
+        self.offsets = array("Q", offsets)
+        self.size = size
+        self.key = key
+        self.keys = keys
+        self.mtime = mtime
+        # The first record holding each key.
+        self.records_by_key: Dict[Any, int] = {}
+        if keys is not None:
+            for record, value in enumerate(keys):
+                self.records_by_key.setdefault(value, record)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @classmethod
+    def build(
+        cls,
+        source: Source,
+        message_cls: Type[Message],
+        key: Optional[str] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> DelimitedIndex:
+        """
+        Indexes the size-delimited messages of a binary stream or buffer, in a
+        single pass. Only the key field, if any, of each message is decoded.
+
+        Parameters
+        -----------
+        source: Union[:class:`BinaryIO`, :class:`bytes`, :class:`bytearray`, :class:`memoryview`, :class:`mmap.mmap`]
+            The stream or buffer to index. Offsets are counted from the position
+            it is read from.
+        message_cls: Type[:class:`Message`]
+            The class of the messages.
+        key: Optional[:class:`str`]
+            The (dotted) path of the scalar field to index the messages by, e.g.
+            ``"header.id"``. Messages in which it is unset (an optional field, or
+            a field in an unselected member of a ``oneof`` group) have the key
+            ``None``.
+        buffer_size: :class:`int`
+            The number of bytes read from streams at once.
+
+        Raises
+        -------
+        :class:`ValueError`
+            If a message is truncated, or the key is not a field of the messages.
+        :class:`TypeError`
+            If the key field is not a scalar.
+        """
+        offsets = array("Q")
+        keys: Optional[List[Any]] = None
+        size = 0
+        mtime = _get_mtime(source)
+        if key is not None:
+            keys = []
+            path = key.split(".")
+            decoder = message_cls._betterproto.get_projected_decoder(
+                (key,), False, False
+            )
+
+        for offset, view, start, stop in DelimitedReader(
+            source, message_cls, buffer_size=buffer_size
+        )._records():
+            offsets.append(offset)
+            size = offset + size_varint(stop - start) + stop - start
+            if keys is not None:
+                message = message_cls._from_wire()
+                decoder(message, view, start, stop)
+                value = message
+                for name in path:
+                    group = value._betterproto.oneof_group_by_field.get(name)
+                    if group is not None and which_one_of(value, group)[0] != name:
+                        # Another member of the `oneof` group is set.
+                        value = None
+                        break
+                    value = getattr(value, name)
+                if not isinstance(value, _KEY_TYPES):
+                    raise TypeError(f"The key field {key!r} must be a scalar field")
+                keys.append(value)
+        return cls(offsets, size, key, keys, mtime)
+
+    def record(self, key: Any) -> int:
+        """
+        Returns the number of the first record holding a value of the key field.
+
+        Raises
+        -------
+        :class:`KeyError`
+            If no record holds the value.
+        :class:`ValueError`
+            If the messages are not indexed by a key field.
+        """
+        if self.keys is None:
+            raise ValueError("The messages are not indexed by a key field")
+        return self.records_by_key[key]
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Saves the index to a file: the offsets as little-endian 64-bit integers,
+        followed by the other attributes in JSON.
+        """
+        offsets = self.offsets
+        if sys.byteorder == "big":
+            offsets = array("Q", offsets)
+            offsets.byteswap()
+        keys = self.keys
+        key_type = None
+        if keys is not None and any(isinstance(value, bytes) for value in keys):
+            key_type = "bytes"
+            keys = [
+                None if value is None else b64encode(value).decode("ascii")
+                for value in keys
+            ]
+        trailer = {
+            "size": self.size,
+            "mtime": self.mtime,
+            "key": self.key,
+            "key_type": key_type,
+            "keys": keys,
+        }
+
+        with open(path, "wb") as stream:
+            stream.write(_INDEX_MAGIC)
+            stream.write(struct.pack("<Q", len(offsets)))
+            offsets.tofile(stream)
+            stream.write(json.dumps(trailer).encode())
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> DelimitedIndex:
+        """
+        Loads an index saved with :meth:`save`.
+
+        Raises
+        -------
+        :class:`ValueError`
+            If the file is not an index.
+        """
+        with open(path, "rb") as stream:
+            if stream.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+                raise ValueError(f"{os.fspath(path)!r} is not a message index")
+            try:
+                (count,) = struct.unpack("<Q", stream.read(8))
+                offsets = array("Q")
+                offsets.fromfile(stream, count)
+                trailer = json.loads(stream.read())
+            except (struct.error, EOFError, json.JSONDecodeError) as e:
+                raise ValueError(
+                    f"The message index {os.fspath(path)!r} is truncated"
+                ) from e
+
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        keys = trailer["keys"]
+        if trailer["key_type"] == "bytes":
+            keys = [None if value is None else b64decode(value) for value in keys]
+        return cls(offsets, trailer["size"], trailer["key"], keys, trailer.get("mtime"))
+
+
+def _get_mtime(source: Source) -> Optional[int]:
+    """Returns the modification time of the file a source reads, if any."""
+    try:
+        return os.fstat(source.fileno()).st_mtime_ns  # type: ignore
+    except (AttributeError, OSError):
+        # Not a file, e.g. a buffer or an in-memory stream.
+        return None
+
+
+def index_path(path: Union[str, os.PathLike]) -> str:
+    """Returns the path of the sidecar file the index of a file is saved to."""
+    return os.fspath(path) + INDEX_SUFFIX
+
+
+class IndexedReader(Generic[T]):
+    """
+    Reads single size-delimited messages of a seekable binary stream (e.g. a file)
+    by their record number or key, seeking straight to them with the help of a
+    :class:`DelimitedIndex`. Only the requested message is read and parsed.
+
+    Readers of files are best made with :meth:`open`, which maintains the index of
+    the file in a sidecar file.
+
+    Parameters
+    -----------
+    stream: :class:`BinaryIO`
+        The stream to read messages from, starting from the position the index was
+        built from.
+    cls: Type[:class:`Message`]
+        The class of the messages.
+    index: :class:`DelimitedIndex`
+        The index of the messages of the stream.
+    """
+
+    def __init__(self, stream: BinaryIO, cls: Type[T], index: DelimitedIndex):
+        self.stream = stream
+        self.cls = cls
+        self.index = index
+        self._base = stream.tell()
+
+    @classmethod
+    def open(
+        cls,
+        path: Union[str, os.PathLike],
+        message_cls: Type[T],
+        key: Optional[str] = None,
+        rebuild: bool = False,
+    ) -> IndexedReader[T]:
+        """
+        Opens a file of size-delimited messages. Its index is loaded from the
+        sidecar file next to it (see :func:`index_path`), or built and saved there
+        if it's missing, stale (the file changed size or modification time) or
+        indexed by another key.
+
+        Parameters
+        -----------
+        path: Union[:class:`str`, :class:`os.PathLike`]
+            The path of the file.
+        message_cls: Type[:class:`Message`]
+            The class of the messages.
+        key: Optional[:class:`str`]
+            The (dotted) path of the scalar field to find messages by, if any.
+        rebuild: :class:`bool`
+            Whether to rebuild the index even if it is up to date.
+        """
+        stream = open(path, "rb")
+        try:
+            stat = os.fstat(stream.fileno())
+            sidecar = index_path(path)
+            index = None
+            if not rebuild and os.path.exists(sidecar):
+                try:
+                    index = DelimitedIndex.load(sidecar)
+                except ValueError:
+                    pass
+                else:
+                    if (
+                        index.size != stat.st_size
+                        or index.mtime != stat.st_mtime_ns
+                        or index.key != key
+                    ):
+                        index = None
+            if index is None:
+                index = DelimitedIndex.build(stream, message_cls, key)
+                index.save(sidecar)
+                stream.seek(0)
+            return cls(stream, message_cls, index)
+        except BaseException:
+            stream.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, record: int) -> T:
+        """
+        Reads the message of a record, which may be negative to count from the
+        end.
+
+        Raises
+        -------
+        :class:`IndexError`
+            If there's no such record.
+        """
+        self.stream.seek(self._base + self.index.offsets[record])
+        return self.cls._from_wire().load(self.stream, SIZE_DELIMITED)
+
+    def find(self, key: Any) -> T:
+        """
+        Reads the first message whose key field holds a value.
+
+        Raises
+        -------
+        :class:`KeyError`
+            If no message holds the value.
+        :class:`ValueError`
+            If the messages are not indexed by a key field.
+        """
+        return self[self.index.record(key)]
+
+    def close(self) -> None:
+        """Closes the stream."""
+        self.stream.close()
+
+    def __enter__(self) -> IndexedReader[T]:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Builds the sidecar index of a file of size-delimited messages, e.g.
+    ``python -m betterproto.io events.bin myapp.events:Event --key header.id``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m betterproto.io",
+        description="Index a file of size-delimited messages for random access.",
+    )
+    parser.add_argument("path", help="The file of size-delimited messages.")
+    parser.add_argument(
+        "message", help="The class of the messages, e.g. myapp.events:Event."
+    )
+    parser.add_argument("--key", help="The (dotted) path of a field to index.")
+    args = parser.parse_args(argv)
+
+    module_name, _, class_name = args.message.rpartition(":")
+    if not module_name:
+        module_name, _, class_name = args.message.rpartition(".")
+    message_cls = getattr(importlib.import_module(module_name), class_name)
+
+    with open(args.path, "rb") as stream:
+        index = DelimitedIndex.build(stream, message_cls, args.key)
+    sidecar = index_path(args.path)
+    index.save(sidecar)
+    print(f"Indexed {len(index)} messages into {sidecar}")
+
+
+if __name__ == "__main__":
+    main()
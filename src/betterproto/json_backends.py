@@ -0,0 +1,163 @@
+"""
+The libraries turning the dict representation of messages into JSON text and back,
+see :meth:`betterproto.Message.to_json` and :meth:`betterproto.Message.from_json`.
+"""
+
+from __future__ import annotations
+
+import json
+import warnings
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import (
+    Any,
+    Dict,
+    Type,
+    Union,
+)
+
+
+class JsonBackend(ABC):
+    """
+    A JSON library. Dict representations of messages only hold dicts, lists,
+    strings, numbers, booleans and ``None``, so any JSON library can handle them
+    natively.
+    """
+
+    #: The name the backend is selected by.
+    name: str
+
+    @abstractmethod
+    def dumps(self, value: Any, indent: Union[None, int, str] = None) -> str:
+        """Returns the JSON text of a value, indented as :func:`json.dumps` does."""
+
+    @abstractmethod
+    def loads(self, value: Union[str, bytes]) -> Any:
+        """Returns the value of a JSON text."""
+
+
+class StdlibJsonBackend(JsonBackend):
+    """The :mod:`json` module of the standard library, the default backend."""
+
+    name = "json"
+
+    def dumps(self, value: Any, indent: Union[None, int, str] = None) -> str:
+        return json.dumps(value, indent=indent)
+
+    def loads(self, value: Union[str, bytes]) -> Any:
+        return json.loads(value)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    `orjson <https://github.com/ijl/orjson>`_, which outputs compact JSON without
+    escaping non-ASCII characters. Only indents of 2 spaces are supported, other
+    indents are handled by the :mod:`json` module.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.orjson = orjson
+        # Map keys may be integers or booleans.
+        self.options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, value: Any, indent: Union[None, int, str] = None) -> str:
+        if indent is None:
+            options = self.options
+        elif indent == 2 or indent == "  ":
+            options = self.options | self.orjson.OPT_INDENT_2
+        else:
+            return json.dumps(value, indent=indent)
+        return self.orjson.dumps(value, option=options).decode()
+
+    def loads(self, value: Union[str, bytes]) -> Any:
+        return self.orjson.loads(value)
+
+
+class UjsonBackend(JsonBackend):
+    """`UltraJSON <https://github.com/ultrajson/ultrajson>`_."""
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self.ujson = ujson
+
+    def dumps(self, value: Any, indent: Union[None, int, str] = None) -> str:
+        if isinstance(indent, str):
+            return json.dumps(value, indent=indent)
+        return self.ujson.dumps(value, indent=indent or 0)
+
+    def loads(self, value: Union[str, bytes]) -> Any:
+        return self.ujson.loads(value)
+
+
+BACKENDS: Dict[str, Type[JsonBackend]] = {
+    backend.name: backend
+    for backend in (StdlibJsonBackend, OrjsonBackend, UjsonBackend)
+}
+
+_backends: Dict[str, JsonBackend] = {}
+_default: JsonBackend = StdlibJsonBackend()
+
+
+def get_json_backend(backend: Union[None, str, JsonBackend] = None) -> JsonBackend:
+    """
+    Returns a JSON backend.
+
+    A backend whose library is not installed falls back to the :mod:`json` module of
+    the standard library, with a :class:`RuntimeWarning`.
+
+    Parameters
+    -----------
+    backend: Optional[Union[:class:`str`, :class:`JsonBackend`]]
+        The backend, or its name (one of :data:`BACKENDS`). Defaults to the one set
+        with :func:`set_json_backend`.
+
+    Raises
+    -------
+    :class:`ValueError`
+        If there is no backend of the given name.
+    """
+    if backend is None:
+        return _default
+    if isinstance(backend, JsonBackend):
+        return backend
+    try:
+        return _backends[backend]
+    except KeyError:
+        pass
+
+    try:
+        backend_cls = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown JSON backend {backend!r}") from None
+    try:
+        instance = backend_cls()
+    except ImportError:
+        warnings.warn(
+            f"The {backend} JSON backend is not installed, falling back to json",
+            RuntimeWarning,
+        )
+        instance = _backends.get("json") or StdlibJsonBackend()
+    _backends[backend] = instance
+    return instance
+
+
+def set_json_backend(backend: Union[str, JsonBackend]) -> None:
+    """
+    Sets the JSON backend used by default, see :func:`get_json_backend`.
+
+    Parameters
+    -----------
+    backend: Union[:class:`str`, :class:`JsonBackend`]
+        The backend, or its name.
+    """
+    global _default
+    _default = get_json_backend(backend)
@@ -29,6 +29,8 @@ class CodeGeneratorResponseFeature(betterproto.Enum):
 class Version(betterproto.Message):
     """The version number of protocol compiler."""
 
+    _proto_name = "google.protobuf.compiler.Version"
+
     major: int = betterproto.int32_field(1)
     minor: int = betterproto.int32_field(2)
     patch: int = betterproto.int32_field(3)
@@ -43,6 +45,8 @@ class Version(betterproto.Message):
 class CodeGeneratorRequest(betterproto.Message):
     """An encoded CodeGeneratorRequest is written to the plugin's stdin."""
 
+    _proto_name = "google.protobuf.compiler.CodeGeneratorRequest"
+
     file_to_generate: List[str] = betterproto.string_field(1)
     """
     The .proto files that were explicitly listed on the command-line.  The
@@ -95,6 +99,8 @@ class CodeGeneratorRequest(betterproto.Message):
 class CodeGeneratorResponse(betterproto.Message):
     """The plugin writes an encoded CodeGeneratorResponse to stdout."""
 
+    _proto_name = "google.protobuf.compiler.CodeGeneratorResponse"
+
     error: str = betterproto.string_field(1)
     """
     Error message.  If non-empty, code generation failed.  The plugin process
@@ -136,6 +142,8 @@ class CodeGeneratorResponse(betterproto.Message):
 class CodeGeneratorResponseFile(betterproto.Message):
     """Represents a single generated file."""
 
+    _proto_name = "google.protobuf.compiler.CodeGeneratorResponse.File"
+
     name: str = betterproto.string_field(1)
     """
     The file name, relative to the output directory.  The name must not
@@ -452,6 +452,8 @@ class Any(betterproto.Message):
          }
     """
 
+    _proto_name = "google.protobuf.Any"
+
     type_url: str = betterproto.string_field(1)
     """
     A URL/resource name that uniquely identifies the type of the serialized
@@ -497,6 +499,8 @@ class SourceContext(betterproto.Message):
      protobuf element, like the file in which it is defined.
     """
 
+    _proto_name = "google.protobuf.SourceContext"
+
     file_name: str = betterproto.string_field(1)
     """
     The path-qualified name of the .proto file that contained the associated
@@ -508,6 +512,8 @@ class SourceContext(betterproto.Message):
 class Type(betterproto.Message):
     """A protocol buffer message type."""
 
+    _proto_name = "google.protobuf.Type"
+
     name: str = betterproto.string_field(1)
     """The fully qualified message name."""
 
@@ -536,6 +542,8 @@ class Type(betterproto.Message):
 class Field(betterproto.Message):
     """A single field of a message type."""
 
+    _proto_name = "google.protobuf.Field"
+
     kind: "FieldKind" = betterproto.enum_field(1)
     """The field type."""
 
@@ -579,6 +587,8 @@ class Field(betterproto.Message):
 class Enum(betterproto.Message):
     """Enum type definition."""
 
+    _proto_name = "google.protobuf.Enum"
+
     name: str = betterproto.string_field(1)
     """Enum type name."""
 
@@ -606,6 +616,8 @@ class Enum(betterproto.Message):
 class EnumValue(betterproto.Message):
     """Enum value definition."""
 
+    _proto_name = "google.protobuf.EnumValue"
+
     name: str = betterproto.string_field(1)
     """Enum value name."""
 
@@ -623,6 +635,8 @@ class Option(betterproto.Message):
      enumeration, etc.
     """
 
+    _proto_name = "google.protobuf.Option"
+
     name: str = betterproto.string_field(1)
     """
     The option's name. For protobuf built-in options (options defined in
@@ -654,6 +668,8 @@ class Api(betterproto.Message):
      detailed terminology.
     """
 
+    _proto_name = "google.protobuf.Api"
+
     name: str = betterproto.string_field(1)
     """
     The fully qualified name of this interface, including package name
@@ -706,6 +722,8 @@ class Api(betterproto.Message):
 class Method(betterproto.Message):
     """Method represents a method of an API interface."""
 
+    _proto_name = "google.protobuf.Method"
+
     name: str = betterproto.string_field(1)
     """The simple name of this method."""
 
@@ -811,6 +829,8 @@ class Mixin(betterproto.Message):
          }
     """
 
+    _proto_name = "google.protobuf.Mixin"
+
     name: str = betterproto.string_field(1)
     """The fully qualified name of the interface which is included."""
 
@@ -828,6 +848,8 @@ class FileDescriptorSet(betterproto.Message):
      files it parses.
     """
 
+    _proto_name = "google.protobuf.FileDescriptorSet"
+
     file: List["FileDescriptorProto"] = betterproto.message_field(1)
 
 
@@ -835,6 +857,8 @@ class FileDescriptorSet(betterproto.Message):
 class FileDescriptorProto(betterproto.Message):
     """Describes a complete .proto file."""
 
+    _proto_name = "google.protobuf.FileDescriptorProto"
+
     name: str = betterproto.string_field(1)
     package: str = betterproto.string_field(2)
     dependency: List[str] = betterproto.string_field(3)
@@ -880,6 +904,8 @@ class FileDescriptorProto(betterproto.Message):
 class DescriptorProto(betterproto.Message):
     """Describes a message type."""
 
+    _proto_name = "google.protobuf.DescriptorProto"
+
     name: str = betterproto.string_field(1)
     field: List["FieldDescriptorProto"] = betterproto.message_field(2)
     extension: List["FieldDescriptorProto"] = betterproto.message_field(6)
@@ -900,6 +926,8 @@ class DescriptorProto(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class DescriptorProtoExtensionRange(betterproto.Message):
+    _proto_name = "google.protobuf.DescriptorProto.ExtensionRange"
+
     start: int = betterproto.int32_field(1)
     end: int = betterproto.int32_field(2)
     options: "ExtensionRangeOptions" = betterproto.message_field(3)
@@ -913,12 +941,16 @@ class DescriptorProtoReservedRange(betterproto.Message):
      not overlap.
     """
 
+    _proto_name = "google.protobuf.DescriptorProto.ReservedRange"
+
     start: int = betterproto.int32_field(1)
     end: int = betterproto.int32_field(2)
 
 
 @dataclass(eq=False, repr=False)
 class ExtensionRangeOptions(betterproto.Message):
+    _proto_name = "google.protobuf.ExtensionRangeOptions"
+
     uninterpreted_option: List["UninterpretedOption"] = betterproto.message_field(999)
     """The parser stores options it doesn't recognize here. See above."""
 
@@ -942,6 +974,8 @@ class ExtensionRangeOptions(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class ExtensionRangeOptionsDeclaration(betterproto.Message):
+    _proto_name = "google.protobuf.ExtensionRangeOptions.Declaration"
+
     number: int = betterproto.int32_field(1)
     """The extension number declared within the extension range."""
 
@@ -976,6 +1010,8 @@ class ExtensionRangeOptionsDeclaration(betterproto.Message):
 class FieldDescriptorProto(betterproto.Message):
     """Describes a field within a message."""
 
+    _proto_name = "google.protobuf.FieldDescriptorProto"
+
     name: str = betterproto.string_field(1)
     number: int = betterproto.int32_field(3)
     label: "FieldDescriptorProtoLabel" = betterproto.enum_field(4)
@@ -1053,6 +1089,8 @@ class FieldDescriptorProto(betterproto.Message):
 class OneofDescriptorProto(betterproto.Message):
     """Describes a oneof."""
 
+    _proto_name = "google.protobuf.OneofDescriptorProto"
+
     name: str = betterproto.string_field(1)
     options: "OneofOptions" = betterproto.message_field(2)
 
@@ -1061,6 +1099,8 @@ class OneofDescriptorProto(betterproto.Message):
 class EnumDescriptorProto(betterproto.Message):
     """Describes an enum type."""
 
+    _proto_name = "google.protobuf.EnumDescriptorProto"
+
     name: str = betterproto.string_field(1)
     value: List["EnumValueDescriptorProto"] = betterproto.message_field(2)
     options: "EnumOptions" = betterproto.message_field(3)
@@ -1091,6 +1131,8 @@ class EnumDescriptorProtoEnumReservedRange(betterproto.Message):
      domain.
     """
 
+    _proto_name = "google.protobuf.EnumDescriptorProto.EnumReservedRange"
+
     start: int = betterproto.int32_field(1)
     end: int = betterproto.int32_field(2)
 
@@ -1099,6 +1141,8 @@ class EnumDescriptorProtoEnumReservedRange(betterproto.Message):
 class EnumValueDescriptorProto(betterproto.Message):
     """Describes a value within an enum."""
 
+    _proto_name = "google.protobuf.EnumValueDescriptorProto"
+
     name: str = betterproto.string_field(1)
     number: int = betterproto.int32_field(2)
     options: "EnumValueOptions" = betterproto.message_field(3)
@@ -1108,6 +1152,8 @@ class EnumValueDescriptorProto(betterproto.Message):
 class ServiceDescriptorProto(betterproto.Message):
     """Describes a service."""
 
+    _proto_name = "google.protobuf.ServiceDescriptorProto"
+
     name: str = betterproto.string_field(1)
     method: List["MethodDescriptorProto"] = betterproto.message_field(2)
     options: "ServiceOptions" = betterproto.message_field(3)
@@ -1117,6 +1163,8 @@ class ServiceDescriptorProto(betterproto.Message):
 class MethodDescriptorProto(betterproto.Message):
     """Describes a method of a service."""
 
+    _proto_name = "google.protobuf.MethodDescriptorProto"
+
     name: str = betterproto.string_field(1)
     input_type: str = betterproto.string_field(2)
     """
@@ -1135,6 +1183,8 @@ class MethodDescriptorProto(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class FileOptions(betterproto.Message):
+    _proto_name = "google.protobuf.FileOptions"
+
     java_package: str = betterproto.string_field(1)
     """
     Sets the Java package where classes generated from this .proto will be
@@ -1283,6 +1333,8 @@ class FileOptions(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class MessageOptions(betterproto.Message):
+    _proto_name = "google.protobuf.MessageOptions"
+
     message_set_wire_format: bool = betterproto.bool_field(1)
     """
     Set true to use the old proto1 MessageSet wire format for extensions.
@@ -1376,6 +1428,8 @@ class MessageOptions(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class FieldOptions(betterproto.Message):
+    _proto_name = "google.protobuf.FieldOptions"
+
     ctype: "FieldOptionsCType" = betterproto.enum_field(1)
     """
     The ctype option instructs the C++ code generator to use a different
@@ -1475,6 +1529,8 @@ class FieldOptions(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class FieldOptionsEditionDefault(betterproto.Message):
+    _proto_name = "google.protobuf.FieldOptions.EditionDefault"
+
     edition: "Edition" = betterproto.enum_field(3)
     value: str = betterproto.string_field(2)
 
@@ -1483,6 +1539,8 @@ class FieldOptionsEditionDefault(betterproto.Message):
 class FieldOptionsFeatureSupport(betterproto.Message):
     """Information about the support window of a feature."""
 
+    _proto_name = "google.protobuf.FieldOptions.FeatureSupport"
+
     edition_introduced: "Edition" = betterproto.enum_field(1)
     """
     The edition that this feature was first available in.  In editions
@@ -1512,6 +1570,8 @@ class FieldOptionsFeatureSupport(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class OneofOptions(betterproto.Message):
+    _proto_name = "google.protobuf.OneofOptions"
+
     features: "FeatureSet" = betterproto.message_field(1)
     """Any features defined in the specific edition."""
 
@@ -1521,6 +1581,8 @@ class OneofOptions(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class EnumOptions(betterproto.Message):
+    _proto_name = "google.protobuf.EnumOptions"
+
     allow_alias: bool = betterproto.bool_field(2)
     """
     Set this option to true to allow mapping different tag names to the same
@@ -1562,6 +1624,8 @@ class EnumOptions(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class EnumValueOptions(betterproto.Message):
+    _proto_name = "google.protobuf.EnumValueOptions"
+
     deprecated: bool = betterproto.bool_field(1)
     """
     Is this enum value deprecated?
@@ -1586,6 +1650,8 @@ class EnumValueOptions(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class ServiceOptions(betterproto.Message):
+    _proto_name = "google.protobuf.ServiceOptions"
+
     features: "FeatureSet" = betterproto.message_field(34)
     """Any features defined in the specific edition."""
 
@@ -1603,6 +1669,8 @@ class ServiceOptions(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class MethodOptions(betterproto.Message):
+    _proto_name = "google.protobuf.MethodOptions"
+
     deprecated: bool = betterproto.bool_field(33)
     """
     Is this method deprecated?
@@ -1630,6 +1698,8 @@ class UninterpretedOption(betterproto.Message):
      in them.
     """
 
+    _proto_name = "google.protobuf.UninterpretedOption"
+
     name: List["UninterpretedOptionNamePart"] = betterproto.message_field(2)
     identifier_value: str = betterproto.string_field(3)
     """
@@ -1654,6 +1724,8 @@ class UninterpretedOptionNamePart(betterproto.Message):
      "foo.(bar.baz).moo".
     """
 
+    _proto_name = "google.protobuf.UninterpretedOption.NamePart"
+
     name_part: str = betterproto.string_field(1)
     is_extension: bool = betterproto.bool_field(2)
 
@@ -1669,6 +1741,8 @@ class FeatureSet(betterproto.Message):
      conflict here.
     """
 
+    _proto_name = "google.protobuf.FeatureSet"
+
     field_presence: "FeatureSetFieldPresence" = betterproto.enum_field(1)
     enum_type: "FeatureSetEnumType" = betterproto.enum_field(2)
     repeated_field_encoding: "FeatureSetRepeatedFieldEncoding" = betterproto.enum_field(
@@ -1688,6 +1762,8 @@ class FeatureSetDefaults(betterproto.Message):
      for the closest matching edition, followed by proto merges.
     """
 
+    _proto_name = "google.protobuf.FeatureSetDefaults"
+
     defaults: List[
         "FeatureSetDefaultsFeatureSetEditionDefault"
     ] = betterproto.message_field(1)
@@ -1713,6 +1789,8 @@ class FeatureSetDefaultsFeatureSetEditionDefault(betterproto.Message):
      be used.  This field must be in strict ascending order by edition.
     """
 
+    _proto_name = "google.protobuf.FeatureSetDefaults.FeatureSetEditionDefault"
+
     edition: "Edition" = betterproto.enum_field(3)
     overridable_features: "FeatureSet" = betterproto.message_field(4)
     """Defaults of features that can be overridden in this edition."""
@@ -1734,6 +1812,8 @@ class SourceCodeInfo(betterproto.Message):
      FileDescriptorProto was generated.
     """
 
+    _proto_name = "google.protobuf.SourceCodeInfo"
+
     location: List["SourceCodeInfoLocation"] = betterproto.message_field(1)
     """
     A Location identifies a piece of source code in a .proto file which
@@ -1784,6 +1864,8 @@ class SourceCodeInfo(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class SourceCodeInfoLocation(betterproto.Message):
+    _proto_name = "google.protobuf.SourceCodeInfo.Location"
+
     path: List[int] = betterproto.int32_field(1)
     """
     Identifies which part of the FileDescriptorProto was defined at this
@@ -1883,6 +1965,8 @@ class GeneratedCodeInfo(betterproto.Message):
      source file, but may contain references to different source .proto files.
     """
 
+    _proto_name = "google.protobuf.GeneratedCodeInfo"
+
     annotation: List["GeneratedCodeInfoAnnotation"] = betterproto.message_field(1)
     """
     An Annotation connects some span of text in generated code to an element
@@ -1892,6 +1976,8 @@ class GeneratedCodeInfo(betterproto.Message):
 
 @dataclass(eq=False, repr=False)
 class GeneratedCodeInfoAnnotation(betterproto.Message):
+    _proto_name = "google.protobuf.GeneratedCodeInfo.Annotation"
+
     path: List[int] = betterproto.int32_field(1)
     """
     Identifies the element in the original source .proto file. This field
@@ -1980,6 +2066,8 @@ class Duration(betterproto.Message):
      microsecond should be expressed in JSON format as "3.000001s".
     """
 
+    _proto_name = "google.protobuf.Duration"
+
     seconds: int = betterproto.int64_field(1)
     """
     Signed seconds of the span of time. Must be from -315,576,000,000
@@ -2010,7 +2098,7 @@ class Empty(betterproto.Message):
          }
     """
 
-    pass
+    _proto_name = "google.protobuf.Empty"
 
 
 @dataclass(eq=False, repr=False)
@@ -2217,6 +2305,8 @@ class FieldMask(betterproto.Message):
      `INVALID_ARGUMENT` error if any path is unmappable.
     """
 
+    _proto_name = "google.protobuf.FieldMask"
+
     paths: List[str] = betterproto.string_field(1)
     """The set of field mask paths."""
 
@@ -2234,6 +2324,8 @@ class Struct(betterproto.Message):
      The JSON representation for `Struct` is JSON object.
     """
 
+    _proto_name = "google.protobuf.Struct"
+
     fields: Dict[str, "Value"] = betterproto.map_field(
         1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
     )
@@ -2277,6 +2369,8 @@ class Value(betterproto.Message):
      The JSON representation for `Value` is JSON value.
     """
 
+    _proto_name = "google.protobuf.Value"
+
     null_value: "NullValue" = betterproto.enum_field(1, group="kind")
     """Represents a null value."""
 
@@ -2304,6 +2398,8 @@ class ListValue(betterproto.Message):
      The JSON representation for `ListValue` is JSON array.
     """
 
+    _proto_name = "google.protobuf.ListValue"
+
     values: List["Value"] = betterproto.message_field(1)
     """Repeated field of dynamically typed values."""
 
@@ -2402,6 +2498,8 @@ class Timestamp(betterproto.Message):
      ) to obtain a formatter capable of generating timestamps in this format.
     """
 
+    _proto_name = "google.protobuf.Timestamp"
+
     seconds: int = betterproto.int64_field(1)
     """
     Represents seconds of UTC time since Unix epoch
@@ -2426,6 +2524,8 @@ class DoubleValue(betterproto.Message):
      The JSON representation for `DoubleValue` is JSON number.
     """
 
+    _proto_name = "google.protobuf.DoubleValue"
+
     value: float = betterproto.double_field(1)
     """The double value."""
 
@@ -2438,6 +2538,8 @@ class FloatValue(betterproto.Message):
      The JSON representation for `FloatValue` is JSON number.
     """
 
+    _proto_name = "google.protobuf.FloatValue"
+
     value: float = betterproto.float_field(1)
     """The float value."""
 
@@ -2450,6 +2552,8 @@ class Int64Value(betterproto.Message):
      The JSON representation for `Int64Value` is JSON string.
     """
 
+    _proto_name = "google.protobuf.Int64Value"
+
     value: int = betterproto.int64_field(1)
     """The int64 value."""
 
@@ -2462,6 +2566,8 @@ class UInt64Value(betterproto.Message):
      The JSON representation for `UInt64Value` is JSON string.
     """
 
+    _proto_name = "google.protobuf.UInt64Value"
+
     value: int = betterproto.uint64_field(1)
     """The uint64 value."""
 
@@ -2474,6 +2580,8 @@ class Int32Value(betterproto.Message):
      The JSON representation for `Int32Value` is JSON number.
     """
 
+    _proto_name = "google.protobuf.Int32Value"
+
     value: int = betterproto.int32_field(1)
     """The int32 value."""
 
@@ -2486,6 +2594,8 @@ class UInt32Value(betterproto.Message):
      The JSON representation for `UInt32Value` is JSON number.
     """
 
+    _proto_name = "google.protobuf.UInt32Value"
+
     value: int = betterproto.uint32_field(1)
     """The uint32 value."""
 
@@ -2498,6 +2608,8 @@ class BoolValue(betterproto.Message):
      The JSON representation for `BoolValue` is JSON `true` and `false`.
     """
 
+    _proto_name = "google.protobuf.BoolValue"
+
     value: bool = betterproto.bool_field(1)
     """The bool value."""
 
@@ -2510,6 +2622,8 @@ class StringValue(betterproto.Message):
      The JSON representation for `StringValue` is JSON string.
     """
 
+    _proto_name = "google.protobuf.StringValue"
+
     value: str = betterproto.string_field(1)
     """The string value."""
 
@@ -2522,5 +2636,7 @@ class BytesValue(betterproto.Message):
      The JSON representation for `BytesValue` is JSON string.
     """
 
+    _proto_name = "google.protobuf.BytesValue"
+
     value: bytes = betterproto.bytes_field(1)
     """The bytes value."""
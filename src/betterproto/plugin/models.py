@@ -250,6 +250,10 @@ class OutputTemplate:
     services: List["ServiceCompiler"] = field(default_factory=list)
     imports_type_checking_only: Set[str] = field(default_factory=set)
     pydantic_dataclasses: bool = False
+    # Whether messages are generated as slotted dataclasses (Python 3.10+)
+    slots: bool = False
+    # Module of the typed arrays to store repeated numeric fields in, if any
+    numeric_arrays: Optional[str] = None
     output: bool = True
 
     @property
@@ -281,8 +285,14 @@ class OutputTemplate:
             imports.add("warnings")
         if self.builtins_import:
             imports.add("builtins")
+        if self.has_numeric_array_fields:
+            imports.add(self.numeric_arrays)
         return imports
 
+    @property
+    def has_numeric_array_fields(self) -> bool:
+        return any(x.has_numeric_array_fields for x in self.messages)
+
 
 @dataclass
 class MessageCompiler(ProtoContentBase):
@@ -292,6 +302,8 @@ class MessageCompiler(ProtoContentBase):
     parent: Union["MessageCompiler", OutputTemplate] = PLACEHOLDER
     proto_obj: DescriptorProto = PLACEHOLDER
     path: List[int] = PLACEHOLDER
+    # Fully qualified protobuf name, as `proto_obj.name` is flattened
+    full_name: str = ""
     fields: List[Union["FieldCompiler", "MessageCompiler"]] = field(
         default_factory=list
     )
@@ -336,6 +348,13 @@ class MessageCompiler(ProtoContentBase):
     def has_oneof_fields(self) -> bool:
         return any(isinstance(field, OneOfFieldCompiler) for field in self.fields)
 
+    @property
+    def has_numeric_array_fields(self) -> bool:
+        return any(
+            isinstance(field, FieldCompiler) and field.numeric_array
+            for field in self.fields
+        )
+
     @property
     def has_message_field(self) -> bool:
         return any(
@@ -485,6 +504,15 @@ class FieldCompiler(MessageCompiler):
     def optional(self) -> bool:
         return self.proto_obj.proto3_optional
 
+    @property
+    def numeric_array(self) -> bool:
+        """True if the field is stored in a typed array rather than a list."""
+        return (
+            bool(self.output_file.numeric_arrays)
+            and self.repeated
+            and self.proto_obj.type in PROTO_FLOAT_TYPES + PROTO_INT_TYPES
+        )
+
     @property
     def mutable(self) -> bool:
         """True if the field is a mutable type, otherwise False."""
@@ -572,6 +600,10 @@ class FieldCompiler(MessageCompiler):
         py_type = self.py_type
         if self.use_builtins:
             py_type = f"builtins.{py_type}"
+        if self.numeric_array:
+            if self.output_file.numeric_arrays == "numpy":
+                return "numpy.ndarray"
+            return "array.array"
         if self.repeated:
             return f"List[{py_type}]"
         if self.optional:
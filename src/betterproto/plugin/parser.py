@@ -42,26 +42,34 @@ from .models import (
 def traverse(
     proto_file: FileDescriptorProto,
 ) -> Generator[
-    Tuple[Union[EnumDescriptorProto, DescriptorProto], List[int]], None, None
+    Tuple[Union[EnumDescriptorProto, DescriptorProto], List[int], str], None, None
 ]:
     # Todo: Keep information about nested hierarchy
     def _traverse(
         path: List[int],
         items: Union[List[EnumDescriptorProto], List[DescriptorProto]],
         prefix: str = "",
+        scope: str = proto_file.package,
     ) -> Generator[
-        Tuple[Union[EnumDescriptorProto, DescriptorProto], List[int]], None, None
+        Tuple[Union[EnumDescriptorProto, DescriptorProto], List[int], str],
+        None,
+        None,
     ]:
         for i, item in enumerate(items):
+            full_name = f"{scope}.{item.name}" if scope else item.name
             # Adjust the name since we flatten the hierarchy.
-            # Todo: don't change the name, but include full name in returned tuple
+            # Todo: don't change the name
             item.name = next_prefix = f"{prefix}_{item.name}"
-            yield item, [*path, i]
+            yield item, [*path, i], full_name
 
             if isinstance(item, DescriptorProto):
                 # Get nested types.
-                yield from _traverse([*path, i, 4], item.enum_type, next_prefix)
-                yield from _traverse([*path, i, 3], item.nested_type, next_prefix)
+                yield from _traverse(
+                    [*path, i, 4], item.enum_type, next_prefix, full_name
+                )
+                yield from _traverse(
+                    [*path, i, 3], item.nested_type, next_prefix, full_name
+                )
 
     yield from _traverse([5], proto_file.enum_type)
     yield from _traverse([4], proto_file.message_type)
@@ -98,16 +106,36 @@ def generate_code(request: CodeGeneratorRequest) -> CodeGeneratorResponse:
                 output_package_name
             ].pydantic_dataclasses = True
 
+        if "slots" in plugin_options:
+            if "pydantic_dataclasses" in plugin_options:
+                raise ValueError(
+                    "The slots option can't be combined with pydantic_dataclasses"
+                )
+            request_data.output_packages[output_package_name].slots = True
+
+        for option in plugin_options:
+            if option.startswith("numeric_arrays="):
+                numeric_arrays = option.split("=", 1)[1]
+                if numeric_arrays not in ("array", "numpy"):
+                    raise ValueError(
+                        f"Unknown numeric_arrays option {numeric_arrays!r}, expected "
+                        "'array' or 'numpy'"
+                    )
+                request_data.output_packages[
+                    output_package_name
+                ].numeric_arrays = numeric_arrays
+
     # Read Messages and Enums
     # We need to read Messages before Services in so that we can
     # get the references to input/output messages for each service
     for output_package_name, output_package in request_data.output_packages.items():
         for proto_input_file in output_package.input_files:
-            for item, path in traverse(proto_input_file):
+            for item, path, full_name in traverse(proto_input_file):
                 read_protobuf_type(
                     source_file=proto_input_file,
                     item=item,
                     path=path,
+                    full_name=full_name,
                     output_package=output_package,
                 )
 
@@ -174,6 +202,7 @@ def read_protobuf_type(
     path: List[int],
     source_file: "FileDescriptorProto",
     output_package: OutputTemplate,
+    full_name: str = "",
 ) -> None:
     if isinstance(item, DescriptorProto):
         if item.options.map_entry:
@@ -181,7 +210,11 @@ def read_protobuf_type(
             return
         # Process Message
         message_data = MessageCompiler(
-            source_file=source_file, parent=output_package, proto_obj=item, path=path
+            source_file=source_file,
+            parent=output_package,
+            proto_obj=item,
+            path=path,
+            full_name=full_name,
         )
         for index, field in enumerate(item.field):
             if is_map(field, item):
@@ -17,3 +17,9 @@ def test_pydantic_no_value():
 def test_pydantic_value():
     message = Test(value=False)
     assert not message.value
+
+
+def test_pydantic_from_dict():
+    assert TestPyd.from_dict({"value": True}).value is True
+    with pytest.raises(ValueError):
+        TestPyd.from_dict({"value": 5})
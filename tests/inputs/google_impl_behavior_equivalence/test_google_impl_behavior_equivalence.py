@@ -59,9 +59,9 @@ def test_bytes_are_the_same_for_oneof():
     # None of these fields were explicitly set BUT they should not actually be null
     # themselves
     assert not hasattr(message, "foo")
-    assert object.__getattribute__(message, "foo") == betterproto.PLACEHOLDER
+    assert not message.is_set("foo")
     assert not hasattr(message2, "foo")
-    assert object.__getattribute__(message2, "foo") == betterproto.PLACEHOLDER
+    assert not message2.is_set("foo")
 
     assert isinstance(message_reference.foo, ReferenceFoo)
     assert isinstance(message_reference2.foo, ReferenceFoo)
@@ -26,6 +26,20 @@ def test_which_count_pyd():
     assert betterproto.which_one_of(message, "foo") == ("pitier", "Mr. T")
 
 
+def test_from_dict_pyd():
+    message = TestPyd.from_dict(
+        {"pitied": 1, "justARegularField": 2, "barName": "a_bar"}
+    )
+    assert betterproto.which_one_of(message, "foo") == ("pitied", 1)
+    assert betterproto.serialized_on_wire(message)
+
+    # Setting several members of a group is rejected by the validator.
+    with pytest.raises(ValueError):
+        TestPyd.from_dict(
+            {"pitied": 1, "pitier": "x", "justARegularField": 2, "barName": "a_bar"}
+        )
+
+
 def test_oneof_constructor_assign():
     message = Test(mixed_drink=MixedDrink(shots=42))
     field, value = betterproto.which_one_of(message, "bar")
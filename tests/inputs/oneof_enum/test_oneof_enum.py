@@ -19,7 +19,7 @@ def test_which_one_of_returns_enum_with_default_value():
     )
 
     assert not hasattr(message, "move")
-    assert object.__getattribute__(message, "move") == betterproto.PLACEHOLDER
+    assert not message.is_set("move")
     assert message.signal == Signal.PASS
     assert betterproto.which_one_of(message, "action") == ("signal", Signal.PASS)
 
@@ -33,7 +33,7 @@ def test_which_one_of_returns_enum_with_non_default_value():
         get_test_case_json_data("oneof_enum", "oneof_enum-enum-1.json")[0].json
     )
     assert not hasattr(message, "move")
-    assert object.__getattribute__(message, "move") == betterproto.PLACEHOLDER
+    assert not message.is_set("move")
     assert message.signal == Signal.RESIGN
     assert betterproto.which_one_of(message, "action") == ("signal", Signal.RESIGN)
 
@@ -43,5 +43,5 @@ def test_which_one_of_returns_second_field_when_set():
     message.from_json(get_test_case_json_data("oneof_enum")[0].json)
     assert message.move == Move(x=2, y=3)
     assert not hasattr(message, "signal")
-    assert object.__getattribute__(message, "signal") == betterproto.PLACEHOLDER
+    assert not message.is_set("signal")
     assert betterproto.which_one_of(message, "action") == ("move", Move(x=2, y=3))
@@ -0,0 +1,15 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: bytes.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "bytes.Test"
+
+    data: bytes = betterproto.bytes_field(1)
@@ -0,0 +1,29 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: casing.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+class MyEnum(betterproto.Enum):
+    ZERO = 0
+    ONE = 1
+    TWO = 2
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "casing.Test"
+
+    camel_case: int = betterproto.int32_field(1)
+    snake_case: "MyEnum" = betterproto.enum_field(2)
+    snake_case_message: "SnakeCaseMessage" = betterproto.message_field(3)
+    uppercase: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class SnakeCaseMessage(betterproto.Message):
+    _proto_name = "casing.snake_case_message"
@@ -0,0 +1,23 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: empty_repeated.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class MessageA(betterproto.Message):
+    _proto_name = "empty_repeated.MessageA"
+
+    values: List[float] = betterproto.float_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "empty_repeated.Test"
+
+    msg: List["MessageA"] = betterproto.message_field(1)
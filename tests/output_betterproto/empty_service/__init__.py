@@ -0,0 +1,20 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: empty_service.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import Dict
+
+import betterproto
+import grpclib
+from betterproto.grpc.grpclib_server import ServiceBase
+
+
+class TestStub(betterproto.ServiceStub):
+    pass
+
+
+class TestBase(ServiceBase):
+    def __mapping__(self) -> Dict[str, grpclib.const.Handler]:
+        return {}
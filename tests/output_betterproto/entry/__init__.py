@@ -0,0 +1,23 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: entry.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "entry.Test"
+
+    export: List["ExportEntry"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ExportEntry(betterproto.Message):
+    _proto_name = "entry.ExportEntry"
+
+    name: str = betterproto.string_field(1)
@@ -0,0 +1,41 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: enum.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+class Choice(betterproto.Enum):
+    ZERO = 0
+    ONE = 1
+    FOUR = 4
+    """TWO = 2;"""
+
+    THREE = 3
+
+
+class ArithmeticOperator(betterproto.Enum):
+    """
+    A "C" like enum with the enum name prefixed onto members, these should be stripped
+    """
+
+    NONE = 0
+    PLUS = 1
+    MINUS = 2
+    _0_PREFIXED = 3
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    """
+    Tests that enums are correctly serialized and that it correctly handles skipped and out-of-order enum values
+    """
+
+    _proto_name = "enum.Test"
+
+    choice: "Choice" = betterproto.enum_field(1)
+    choices: List["Choice"] = betterproto.enum_field(2)
@@ -0,0 +1,44 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: google_impl_behavior_equivalence.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Foo(betterproto.Message):
+    _proto_name = "google_impl_behavior_equivalence.Foo"
+
+    bar: int = betterproto.int64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "google_impl_behavior_equivalence.Test"
+
+    string: str = betterproto.string_field(1, group="group")
+    integer: int = betterproto.int64_field(2, group="group")
+    foo: "Foo" = betterproto.message_field(3, group="group")
+
+
+@dataclass(eq=False, repr=False)
+class Spam(betterproto.Message):
+    _proto_name = "google_impl_behavior_equivalence.Spam"
+
+    ts: datetime = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class Request(betterproto.Message):
+    _proto_name = "google_impl_behavior_equivalence.Request"
+
+    foo: "Empty" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class Empty(betterproto.Message):
+    _proto_name = "google_impl_behavior_equivalence.Empty"
@@ -0,0 +1,16 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: googletypes_struct.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+import betterproto.lib.google.protobuf as betterproto_lib_google_protobuf
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "googletypes_struct.Test"
+
+    struct: "betterproto_lib_google_protobuf.Struct" = betterproto.message_field(1)
@@ -0,0 +1,13 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: capitalized.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Message(betterproto.Message):
+    _proto_name = "import_capitalized_package.Capitalized.Message"
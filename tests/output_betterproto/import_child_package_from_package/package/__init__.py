@@ -0,0 +1,17 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: package_message.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+from . import childpackage
+
+
+@dataclass(eq=False, repr=False)
+class PackageMessage(betterproto.Message):
+    _proto_name = "import_child_package_from_package.package.PackageMessage"
+
+    c: "childpackage.ChildMessage" = betterproto.message_field(1)
@@ -0,0 +1,13 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: child.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ChildMessage(betterproto.Message):
+    _proto_name = "import_child_package_from_package.package.childpackage.ChildMessage"
@@ -0,0 +1,19 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: other.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+from ... import import_circular_dependency as __import_circular_dependency__
+
+
+@dataclass(eq=False, repr=False)
+class OtherPackageMessage(betterproto.Message):
+    _proto_name = "import_circular_dependency.other.OtherPackageMessage"
+
+    root_package_message: "__import_circular_dependency__.RootPackageMessage" = (
+        betterproto.message_field(1)
+    )
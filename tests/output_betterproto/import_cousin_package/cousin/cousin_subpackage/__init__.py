@@ -0,0 +1,13 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: cousin.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class CousinMessage(betterproto.Message):
+    _proto_name = "import_cousin_package.cousin.cousin_subpackage.CousinMessage"
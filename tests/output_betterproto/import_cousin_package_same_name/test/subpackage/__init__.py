@@ -0,0 +1,17 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: test.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+from ...cousin import subpackage as __cousin_subpackage__
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "import_cousin_package_same_name.test.subpackage.Test"
+
+    message: "__cousin_subpackage__.CousinMessage" = betterproto.message_field(1)
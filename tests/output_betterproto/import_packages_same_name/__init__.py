@@ -0,0 +1,19 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: import_packages_same_name.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+from .posts import v1 as posts_v1
+from .users import v1 as users_v1
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "import_packages_same_name.Test"
+
+    user: "users_v1.User" = betterproto.message_field(1)
+    post: "posts_v1.Post" = betterproto.message_field(2)
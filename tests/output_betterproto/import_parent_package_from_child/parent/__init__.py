@@ -0,0 +1,13 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: parent_package_message.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ParentPackageMessage(betterproto.Message):
+    _proto_name = "import_parent_package_from_child.parent.ParentPackageMessage"
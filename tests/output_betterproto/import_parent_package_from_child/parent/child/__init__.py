@@ -0,0 +1,18 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: import_parent_package_from_child.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+from ... import parent as __parent__
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "import_parent_package_from_child.parent.child.Test"
+
+    message_implicit: "__parent__.ParentPackageMessage" = betterproto.message_field(1)
+    message_explicit: "__parent__.ParentPackageMessage" = betterproto.message_field(2)
@@ -0,0 +1,19 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: child.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+from ... import import_root_package_from_child as __import_root_package_from_child__
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "import_root_package_from_child.child.Test"
+
+    message: "__import_root_package_from_child__.RootMessage" = (
+        betterproto.message_field(1)
+    )
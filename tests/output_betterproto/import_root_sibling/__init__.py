@@ -0,0 +1,20 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: import_root_sibling.proto, sibling.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class SiblingMessage(betterproto.Message):
+    _proto_name = "import_root_sibling.SiblingMessage"
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "import_root_sibling.Test"
+
+    sibling: "SiblingMessage" = betterproto.message_field(1)
@@ -0,0 +1,15 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: child_package_request_message.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ChildRequestMessage(betterproto.Message):
+    _proto_name = "import_service_input_message.child.ChildRequestMessage"
+
+    child_argument: int = betterproto.int32_field(1)
@@ -0,0 +1,20 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: int32.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    """Some documentation about the Test message."""
+
+    _proto_name = "int32.Test"
+
+    positive: int = betterproto.int32_field(1)
+    """Some documentation about the count."""
+
+    negative: int = betterproto.int32_field(2)
@@ -0,0 +1,45 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: oneof_default_value_serialization.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import Optional
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Message(betterproto.Message):
+    _proto_name = "oneof_default_value_serialization.Message"
+
+    value: int = betterproto.int64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NestedMessage(betterproto.Message):
+    _proto_name = "oneof_default_value_serialization.NestedMessage"
+
+    id: int = betterproto.int64_field(1)
+    wrapped_message_value: "Message" = betterproto.message_field(2, group="value_type")
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "oneof_default_value_serialization.Test"
+
+    bool_value: bool = betterproto.bool_field(1, group="value_type")
+    int64_value: int = betterproto.int64_field(2, group="value_type")
+    timestamp_value: datetime = betterproto.message_field(3, group="value_type")
+    duration_value: timedelta = betterproto.message_field(4, group="value_type")
+    wrapped_message_value: "Message" = betterproto.message_field(5, group="value_type")
+    wrapped_nested_message_value: "NestedMessage" = betterproto.message_field(
+        6, group="value_type"
+    )
+    wrapped_bool_value: Optional[bool] = betterproto.message_field(
+        7, wraps=betterproto.TYPE_BOOL, group="value_type"
+    )
@@ -0,0 +1,29 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: oneof_empty.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Nothing(betterproto.Message):
+    _proto_name = "oneof_empty.Nothing"
+
+
+@dataclass(eq=False, repr=False)
+class MaybeNothing(betterproto.Message):
+    _proto_name = "oneof_empty.MaybeNothing"
+
+    sometimes: str = betterproto.string_field(42)
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "oneof_empty.Test"
+
+    nothing: "Nothing" = betterproto.message_field(1, group="empty")
+    maybe1: "MaybeNothing" = betterproto.message_field(2, group="empty")
+    maybe2: "MaybeNothing" = betterproto.message_field(3, group="empty")
@@ -0,0 +1,37 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: proto3_field_presence.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import betterproto
+
+
+class TestEnum(betterproto.Enum):
+    A = 0
+    B = 1
+
+
+@dataclass(eq=False, repr=False)
+class InnerTest(betterproto.Message):
+    _proto_name = "proto3_field_presence.InnerTest"
+
+    test: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "proto3_field_presence.Test"
+
+    test1: Optional[int] = betterproto.uint32_field(1, optional=True)
+    test2: Optional[bool] = betterproto.bool_field(2, optional=True)
+    test3: Optional[str] = betterproto.string_field(3, optional=True)
+    test4: Optional[bytes] = betterproto.bytes_field(4, optional=True)
+    test5: Optional["InnerTest"] = betterproto.message_field(5, optional=True)
+    test6: Optional["TestEnum"] = betterproto.enum_field(6, optional=True)
+    test7: Optional[int] = betterproto.uint64_field(7, optional=True)
+    test8: Optional[float] = betterproto.float_field(8, optional=True)
+    test9: Optional[datetime] = betterproto.message_field(9, optional=True)
@@ -0,0 +1,38 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: proto3_field_presence_oneof.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import Optional
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "proto3_field_presence_oneof.Test"
+
+    nested: "Nested" = betterproto.message_field(1, group="kind")
+    with_optional: "WithOptional" = betterproto.message_field(2, group="kind")
+
+
+@dataclass(eq=False, repr=False)
+class InnerNested(betterproto.Message):
+    _proto_name = "proto3_field_presence_oneof.InnerNested"
+
+    a: Optional[bool] = betterproto.bool_field(1, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class Nested(betterproto.Message):
+    _proto_name = "proto3_field_presence_oneof.Nested"
+
+    inner: "InnerNested" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WithOptional(betterproto.Message):
+    _proto_name = "proto3_field_presence_oneof.WithOptional"
+
+    b: Optional[bool] = betterproto.bool_field(2, optional=True)
@@ -0,0 +1,25 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: recursivemessage.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "recursivemessage.Test"
+
+    name: str = betterproto.string_field(1)
+    child: "Test" = betterproto.message_field(2)
+    intermediate: "Intermediate" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class Intermediate(betterproto.Message):
+    _proto_name = "recursivemessage.Intermediate"
+
+    number: int = betterproto.int32_field(1)
+    child: "Test" = betterproto.message_field(2)
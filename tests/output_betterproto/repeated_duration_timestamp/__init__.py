@@ -0,0 +1,21 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: repeated_duration_timestamp.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "repeated_duration_timestamp.Test"
+
+    times: List[datetime] = betterproto.message_field(1)
+    durations: List[timedelta] = betterproto.message_field(2)
@@ -0,0 +1,23 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: repeatedmessage.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "repeatedmessage.Test"
+
+    greetings: List["Sub"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class Sub(betterproto.Message):
+    _proto_name = "repeatedmessage.Sub"
+
+    greeting: str = betterproto.string_field(1)
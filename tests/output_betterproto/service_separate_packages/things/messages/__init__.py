@@ -0,0 +1,52 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: messages.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class DoThingRequest(betterproto.Message):
+    _proto_name = "service_separate_packages.things.messages.DoThingRequest"
+
+    name: str = betterproto.string_field(1)
+    comments: List[str] = betterproto.string_field(2)
+    """use `repeated` so we can check if `List` is correctly imported"""
+
+    when: datetime = betterproto.message_field(3)
+    """
+    use google types `timestamp` and `duration` so we can check
+     if everything from `datetime` is correctly imported
+    """
+
+    duration: timedelta = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class DoThingResponse(betterproto.Message):
+    _proto_name = "service_separate_packages.things.messages.DoThingResponse"
+
+    names: List[str] = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class GetThingRequest(betterproto.Message):
+    _proto_name = "service_separate_packages.things.messages.GetThingRequest"
+
+    name: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class GetThingResponse(betterproto.Message):
+    _proto_name = "service_separate_packages.things.messages.GetThingResponse"
+
+    name: str = betterproto.string_field(1)
+    version: int = betterproto.int32_field(2)
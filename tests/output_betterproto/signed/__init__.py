@@ -0,0 +1,22 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: signed.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "signed.Test"
+
+    signed32: int = betterproto.sint32_field(1)
+    """
+    todo: rename fields after fixing bug where 'signed_32_positive' will map to 'signed_32Positive' as output json
+    """
+
+    negative32: int = betterproto.sint32_field(2)
+    string64: int = betterproto.sint64_field(3)
+    negative64: int = betterproto.sint64_field(4)
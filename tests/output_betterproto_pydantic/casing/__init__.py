@@ -0,0 +1,38 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: casing.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+
+class MyEnum(betterproto.Enum):
+    ZERO = 0
+    ONE = 1
+    TWO = 2
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "casing.Test"
+
+    camel_case: int = betterproto.int32_field(1)
+    snake_case: "MyEnum" = betterproto.enum_field(2)
+    snake_case_message: "SnakeCaseMessage" = betterproto.message_field(3)
+    uppercase: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class SnakeCaseMessage(betterproto.Message):
+    _proto_name = "casing.snake_case_message"
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
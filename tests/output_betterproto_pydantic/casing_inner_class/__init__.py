@@ -0,0 +1,31 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: casing_inner_class.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "casing_inner_class.Test"
+
+    inner: "TestInnerClass" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class TestInnerClass(betterproto.Message):
+    _proto_name = "casing_inner_class.Test.inner_class"
+
+    old_exp: int = betterproto.sint32_field(1)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
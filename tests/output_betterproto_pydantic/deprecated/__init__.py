@@ -0,0 +1,43 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: deprecated.proto
+# plugin: python-betterproto
+# This file has been @generated
+import warnings
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    """Some documentation about the Test message."""
+
+    _proto_name = "deprecated.Test"
+
+    message: "Message" = betterproto.message_field(1)
+    value: int = betterproto.int32_field(2)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if self.is_set("message"):
+            warnings.warn("Test.message is deprecated", DeprecationWarning)
+
+
+@dataclass(eq=False, repr=False)
+class Message(betterproto.Message):
+    _proto_name = "deprecated.Message"
+
+    value: str = betterproto.string_field(1)
+
+    def __post_init__(self) -> None:
+        warnings.warn("Message is deprecated", DeprecationWarning)
+        super().__post_init__()
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
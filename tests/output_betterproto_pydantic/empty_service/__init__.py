@@ -0,0 +1,27 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: empty_service.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from typing import Dict
+
+import betterproto
+import grpclib
+from betterproto.grpc.grpclib_server import ServiceBase
+
+
+class TestStub(betterproto.ServiceStub):
+    pass
+
+
+class TestBase(ServiceBase):
+    def __mapping__(self) -> Dict[str, grpclib.const.Handler]:
+        return {}
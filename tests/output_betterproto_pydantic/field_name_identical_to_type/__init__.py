@@ -0,0 +1,25 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: field_name_identical_to_type.proto
+# plugin: python-betterproto
+# This file has been @generated
+import builtins
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "field_name_identical_to_type.Test"
+
+    int: builtins.int = betterproto.int32_field(1)
+    float: builtins.float = betterproto.float_field(2)
+    str: builtins.str = betterproto.string_field(3)
+    bytes: builtins.bytes = betterproto.bytes_field(4)
+    bool: builtins.bool = betterproto.bool_field(5)
@@ -0,0 +1,24 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: fixed.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "fixed.Test"
+
+    foo: int = betterproto.fixed32_field(1)
+    bar: int = betterproto.sfixed32_field(2)
+    baz: int = betterproto.fixed64_field(3)
+    qux: int = betterproto.sfixed64_field(4)
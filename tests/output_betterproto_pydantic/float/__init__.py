@@ -0,0 +1,29 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: float.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    """Some documentation about the Test message."""
+
+    _proto_name = "float.Test"
+
+    positive: float = betterproto.double_field(1)
+    negative: float = betterproto.double_field(2)
+    nan: float = betterproto.double_field(3)
+    three: float = betterproto.double_field(4)
+    three_point_one_four: float = betterproto.double_field(5)
+    neg_three: float = betterproto.double_field(6)
+    neg_three_point_one_four: float = betterproto.double_field(7)
@@ -0,0 +1,62 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: google_impl_behavior_equivalence.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from datetime import datetime
+from typing import Optional
+
+import betterproto
+from pydantic import root_validator
+
+
+@dataclass(eq=False, repr=False)
+class Foo(betterproto.Message):
+    _proto_name = "google_impl_behavior_equivalence.Foo"
+
+    bar: int = betterproto.int64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "google_impl_behavior_equivalence.Test"
+
+    string: Optional[str] = betterproto.string_field(1, optional=True, group="group")
+    integer: Optional[int] = betterproto.int64_field(2, optional=True, group="group")
+    foo: Optional["Foo"] = betterproto.message_field(3, optional=True, group="group")
+
+    @root_validator()
+    def check_oneof(cls, values):
+        return cls._validate_field_groups(values)
+
+
+@dataclass(eq=False, repr=False)
+class Spam(betterproto.Message):
+    _proto_name = "google_impl_behavior_equivalence.Spam"
+
+    ts: datetime = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class Request(betterproto.Message):
+    _proto_name = "google_impl_behavior_equivalence.Request"
+
+    foo: "Empty" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class Empty(betterproto.Message):
+    _proto_name = "google_impl_behavior_equivalence.Empty"
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
+Spam.__pydantic_model__.update_forward_refs()  # type: ignore
+Request.__pydantic_model__.update_forward_refs()  # type: ignore
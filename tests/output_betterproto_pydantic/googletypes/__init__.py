@@ -0,0 +1,39 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: googletypes.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import Optional
+
+import betterproto
+import betterproto.lib.pydantic.google.protobuf as betterproto_lib_pydantic_google_protobuf
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "googletypes.Test"
+
+    maybe: Optional[bool] = betterproto.message_field(1, wraps=betterproto.TYPE_BOOL)
+    ts: datetime = betterproto.message_field(2)
+    duration: timedelta = betterproto.message_field(3)
+    important: Optional[int] = betterproto.message_field(
+        4, wraps=betterproto.TYPE_INT32
+    )
+    empty: "betterproto_lib_pydantic_google_protobuf.Empty" = betterproto.message_field(
+        5
+    )
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
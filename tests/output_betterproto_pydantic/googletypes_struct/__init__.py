@@ -0,0 +1,27 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: googletypes_struct.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+import betterproto.lib.pydantic.google.protobuf as betterproto_lib_pydantic_google_protobuf
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "googletypes_struct.Test"
+
+    struct: "betterproto_lib_pydantic_google_protobuf.Struct" = (
+        betterproto.message_field(1)
+    )
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
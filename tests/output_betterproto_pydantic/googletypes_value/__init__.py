@@ -0,0 +1,39 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: googletypes_value.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+import betterproto.lib.pydantic.google.protobuf as betterproto_lib_pydantic_google_protobuf
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "googletypes_value.Test"
+
+    value1: "betterproto_lib_pydantic_google_protobuf.Value" = (
+        betterproto.message_field(1)
+    )
+    value2: "betterproto_lib_pydantic_google_protobuf.Value" = (
+        betterproto.message_field(2)
+    )
+    value3: "betterproto_lib_pydantic_google_protobuf.Value" = (
+        betterproto.message_field(3)
+    )
+    value4: "betterproto_lib_pydantic_google_protobuf.Value" = (
+        betterproto.message_field(4)
+    )
+    value5: "betterproto_lib_pydantic_google_protobuf.Value" = (
+        betterproto.message_field(5)
+    )
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
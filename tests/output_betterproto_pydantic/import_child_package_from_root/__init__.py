@@ -0,0 +1,26 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: import_child_package_from_root.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+from . import childpackage
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "import_child_package_from_root.Test"
+
+    child: "childpackage.Message" = betterproto.message_field(1)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
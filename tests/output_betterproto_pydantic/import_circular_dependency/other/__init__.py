@@ -0,0 +1,28 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: other.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+from ... import import_circular_dependency as __import_circular_dependency__
+
+
+@dataclass(eq=False, repr=False)
+class OtherPackageMessage(betterproto.Message):
+    _proto_name = "import_circular_dependency.other.OtherPackageMessage"
+
+    root_package_message: "__import_circular_dependency__.RootPackageMessage" = (
+        betterproto.message_field(1)
+    )
+
+
+OtherPackageMessage.__pydantic_model__.update_forward_refs()  # type: ignore
@@ -0,0 +1,28 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: import_packages_same_name.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+from .posts import v1 as posts_v1
+from .users import v1 as users_v1
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "import_packages_same_name.Test"
+
+    user: "users_v1.User" = betterproto.message_field(1)
+    post: "posts_v1.Post" = betterproto.message_field(2)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
@@ -0,0 +1,27 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: import_parent_package_from_child.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+from ... import parent as __parent__
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "import_parent_package_from_child.parent.child.Test"
+
+    message_implicit: "__parent__.ParentPackageMessage" = betterproto.message_field(1)
+    message_explicit: "__parent__.ParentPackageMessage" = betterproto.message_field(2)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
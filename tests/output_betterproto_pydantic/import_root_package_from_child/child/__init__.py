@@ -0,0 +1,28 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: child.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+from ... import import_root_package_from_child as __import_root_package_from_child__
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "import_root_package_from_child.child.Test"
+
+    message: "__import_root_package_from_child__.RootMessage" = (
+        betterproto.message_field(1)
+    )
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
@@ -0,0 +1,35 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: mapmessage.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from typing import Dict
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "mapmessage.Test"
+
+    items: Dict[str, "Nested"] = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class Nested(betterproto.Message):
+    _proto_name = "mapmessage.Nested"
+
+    count: int = betterproto.int32_field(1)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
@@ -0,0 +1,53 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: nested.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+
+class TestMsg(betterproto.Enum):
+    """This is the nested enum."""
+
+    NONE = 0
+    THIS = 1
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    """A test message with a nested message inside of it."""
+
+    _proto_name = "nested.Test"
+
+    nested: "TestNested" = betterproto.message_field(1)
+    sibling: "Sibling" = betterproto.message_field(2)
+    sibling2: "Sibling" = betterproto.message_field(3)
+    msg: "TestMsg" = betterproto.enum_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class TestNested(betterproto.Message):
+    """This is the nested type."""
+
+    _proto_name = "nested.Test.Nested"
+
+    count: int = betterproto.int32_field(1)
+    """Stores a simple counter."""
+
+
+@dataclass(eq=False, repr=False)
+class Sibling(betterproto.Message):
+    _proto_name = "nested.Sibling"
+
+    foo: int = betterproto.int32_field(1)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
@@ -0,0 +1,44 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: nested2.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+from . import equipment
+
+
+class GamePlayerRace(betterproto.Enum):
+    human = 0
+    orc = 1
+
+
+@dataclass(eq=False, repr=False)
+class Game(betterproto.Message):
+    _proto_name = "nested2.Game"
+
+
+@dataclass(eq=False, repr=False)
+class GamePlayer(betterproto.Message):
+    _proto_name = "nested2.Game.Player"
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "nested2.Test"
+
+    game: "Game" = betterproto.message_field(1)
+    game_player: "GamePlayer" = betterproto.message_field(2)
+    game_player_race: "GamePlayerRace" = betterproto.enum_field(3)
+    weapon: "equipment.Weapon" = betterproto.message_field(4)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
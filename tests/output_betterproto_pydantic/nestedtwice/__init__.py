@@ -0,0 +1,88 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: nestedtwice.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from typing import List
+
+import betterproto
+
+
+class TestTopMiddleEnumBottom(betterproto.Enum):
+    """EnumBottom doc."""
+
+    A = 0
+    """EnumBottom.A doc."""
+
+    B = 1
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    """Test doc."""
+
+    _proto_name = "nestedtwice.Test"
+
+    top: "TestTop" = betterproto.message_field(1)
+    """Test.top doc."""
+
+
+@dataclass(eq=False, repr=False)
+class TestTop(betterproto.Message):
+    """Top doc."""
+
+    _proto_name = "nestedtwice.Test.Top"
+
+    name: str = betterproto.string_field(1)
+    """Top.name doc."""
+
+    middle: "TestTopMiddle" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class TestTopMiddle(betterproto.Message):
+    """Middle doc."""
+
+    _proto_name = "nestedtwice.Test.Top.Middle"
+
+    bottom: List["TestTopMiddleBottom"] = betterproto.message_field(2)
+    """Middle.bottom doc."""
+
+    enum_bottom: List["TestTopMiddleEnumBottom"] = betterproto.enum_field(3)
+    top_middle_bottom: List["TestTopMiddleTopMiddleBottom"] = betterproto.message_field(
+        4
+    )
+    bar: bool = betterproto.bool_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class TestTopMiddleTopMiddleBottom(betterproto.Message):
+    """TopMiddleBottom doc."""
+
+    _proto_name = "nestedtwice.Test.Top.Middle.TopMiddleBottom"
+
+    a: str = betterproto.string_field(1)
+    """TopMiddleBottom.a doc."""
+
+
+@dataclass(eq=False, repr=False)
+class TestTopMiddleBottom(betterproto.Message):
+    """Bottom doc."""
+
+    _proto_name = "nestedtwice.Test.Top.Middle.Bottom"
+
+    foo: str = betterproto.string_field(1)
+    """Bottom.foo doc."""
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
+TestTop.__pydantic_model__.update_forward_refs()  # type: ignore
+TestTopMiddle.__pydantic_model__.update_forward_refs()  # type: ignore
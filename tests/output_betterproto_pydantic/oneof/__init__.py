@@ -0,0 +1,45 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: oneof.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from typing import Optional
+
+import betterproto
+from pydantic import root_validator
+
+
+@dataclass(eq=False, repr=False)
+class MixedDrink(betterproto.Message):
+    _proto_name = "oneof.MixedDrink"
+
+    shots: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "oneof.Test"
+
+    pitied: Optional[int] = betterproto.int32_field(1, optional=True, group="foo")
+    pitier: Optional[str] = betterproto.string_field(2, optional=True, group="foo")
+    just_a_regular_field: int = betterproto.int32_field(3)
+    drinks: Optional[int] = betterproto.int32_field(11, optional=True, group="bar")
+    bar_name: Optional[str] = betterproto.string_field(12, optional=True, group="bar")
+    mixed_drink: Optional["MixedDrink"] = betterproto.message_field(
+        13, optional=True, group="bar"
+    )
+
+    @root_validator()
+    def check_oneof(cls, values):
+        return cls._validate_field_groups(values)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
@@ -0,0 +1,51 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: oneof_empty.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from typing import Optional
+
+import betterproto
+from pydantic import root_validator
+
+
+@dataclass(eq=False, repr=False)
+class Nothing(betterproto.Message):
+    _proto_name = "oneof_empty.Nothing"
+
+
+@dataclass(eq=False, repr=False)
+class MaybeNothing(betterproto.Message):
+    _proto_name = "oneof_empty.MaybeNothing"
+
+    sometimes: str = betterproto.string_field(42)
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "oneof_empty.Test"
+
+    nothing: Optional["Nothing"] = betterproto.message_field(
+        1, optional=True, group="empty"
+    )
+    maybe1: Optional["MaybeNothing"] = betterproto.message_field(
+        2, optional=True, group="empty"
+    )
+    maybe2: Optional["MaybeNothing"] = betterproto.message_field(
+        3, optional=True, group="empty"
+    )
+
+    @root_validator()
+    def check_oneof(cls, values):
+        return cls._validate_field_groups(values)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
@@ -0,0 +1,47 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: oneof_enum.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from typing import Optional
+
+import betterproto
+from pydantic import root_validator
+
+
+class Signal(betterproto.Enum):
+    PASS = 0
+    RESIGN = 1
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "oneof_enum.Test"
+
+    signal: Optional["Signal"] = betterproto.enum_field(
+        1, optional=True, group="action"
+    )
+    move: Optional["Move"] = betterproto.message_field(2, optional=True, group="action")
+
+    @root_validator()
+    def check_oneof(cls, values):
+        return cls._validate_field_groups(values)
+
+
+@dataclass(eq=False, repr=False)
+class Move(betterproto.Message):
+    _proto_name = "oneof_enum.Move"
+
+    x: int = betterproto.int32_field(1)
+    y: int = betterproto.int32_field(2)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
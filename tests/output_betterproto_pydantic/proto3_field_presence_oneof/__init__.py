@@ -0,0 +1,58 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: proto3_field_presence_oneof.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from typing import Optional
+
+import betterproto
+from pydantic import root_validator
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "proto3_field_presence_oneof.Test"
+
+    nested: Optional["Nested"] = betterproto.message_field(
+        1, optional=True, group="kind"
+    )
+    with_optional: Optional["WithOptional"] = betterproto.message_field(
+        2, optional=True, group="kind"
+    )
+
+    @root_validator()
+    def check_oneof(cls, values):
+        return cls._validate_field_groups(values)
+
+
+@dataclass(eq=False, repr=False)
+class InnerNested(betterproto.Message):
+    _proto_name = "proto3_field_presence_oneof.InnerNested"
+
+    a: Optional[bool] = betterproto.bool_field(1, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class Nested(betterproto.Message):
+    _proto_name = "proto3_field_presence_oneof.Nested"
+
+    inner: "InnerNested" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WithOptional(betterproto.Message):
+    _proto_name = "proto3_field_presence_oneof.WithOptional"
+
+    b: Optional[bool] = betterproto.bool_field(2, optional=True)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
+Nested.__pydantic_model__.update_forward_refs()  # type: ignore
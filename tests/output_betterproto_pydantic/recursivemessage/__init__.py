@@ -0,0 +1,35 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: recursivemessage.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "recursivemessage.Test"
+
+    name: str = betterproto.string_field(1)
+    child: "Test" = betterproto.message_field(2)
+    intermediate: "Intermediate" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class Intermediate(betterproto.Message):
+    _proto_name = "recursivemessage.Intermediate"
+
+    number: int = betterproto.int32_field(1)
+    child: "Test" = betterproto.message_field(2)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
+Intermediate.__pydantic_model__.update_forward_refs()  # type: ignore
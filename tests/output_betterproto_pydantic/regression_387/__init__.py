@@ -0,0 +1,34 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: regression_387.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "regression_387.Test"
+
+    id: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ParentElement(betterproto.Message):
+    _proto_name = "regression_387.ParentElement"
+
+    name: str = betterproto.string_field(1)
+    elems: List["Test"] = betterproto.message_field(2)
+
+
+ParentElement.__pydantic_model__.update_forward_refs()  # type: ignore
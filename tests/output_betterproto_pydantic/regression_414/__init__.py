@@ -0,0 +1,25 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: regression_414.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "regression_414.Test"
+
+    body: bytes = betterproto.bytes_field(1)
+    auth: bytes = betterproto.bytes_field(2)
+    signatures: List[bytes] = betterproto.bytes_field(3)
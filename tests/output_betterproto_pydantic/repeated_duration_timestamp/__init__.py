@@ -0,0 +1,31 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: repeated_duration_timestamp.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "repeated_duration_timestamp.Test"
+
+    times: List[datetime] = betterproto.message_field(1)
+    durations: List[timedelta] = betterproto.message_field(2)
+
+
+Test.__pydantic_model__.update_forward_refs()  # type: ignore
@@ -0,0 +1,25 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: repeatedpacked.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Test(betterproto.Message):
+    _proto_name = "repeatedpacked.Test"
+
+    counts: List[int] = betterproto.int32_field(1)
+    signed: List[int] = betterproto.sint64_field(2)
+    fixed: List[float] = betterproto.double_field(3)
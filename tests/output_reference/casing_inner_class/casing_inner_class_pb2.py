@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: casing_inner_class.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18\x63\x61sing_inner_class.proto\x12\x12\x63\x61sing_inner_class\"[\n\x04Test\x12\x33\n\x05inner\x18\x02 \x01(\x0b\x32$.casing_inner_class.Test.inner_class\x1a\x1e\n\x0binner_class\x12\x0f\n\x07old_exp\x18\x01 \x01(\x11\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'casing_inner_class_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_TEST']._serialized_start=48
+  _globals['_TEST']._serialized_end=139
+  _globals['_TEST_INNER_CLASS']._serialized_start=109
+  _globals['_TEST_INNER_CLASS']._serialized_end=139
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: casing_message_field_uppercase.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n$casing_message_field_uppercase.proto\x12\x1e\x63\x61sing_message_field_uppercase\"I\n\x04Test\x12\x11\n\tUPPERCASE\x18\x01 \x01(\x05\x12\x14\n\x0cUPPERCASE_V2\x18\x02 \x01(\x05\x12\x18\n\x10UPPER_CAMEL_CASE\x18\x03 \x01(\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'casing_message_field_uppercase_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_TEST']._serialized_start=72
+  _globals['_TEST']._serialized_end=145
+# @@protoc_insertion_point(module_scope)
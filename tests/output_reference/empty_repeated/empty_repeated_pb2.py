@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: empty_repeated.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x65mpty_repeated.proto\x12\x0e\x65mpty_repeated\"\x1a\n\x08MessageA\x12\x0e\n\x06values\x18\x01 \x03(\x02\"-\n\x04Test\x12%\n\x03msg\x18\x01 \x03(\x0b\x32\x18.empty_repeated.MessageAb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'empty_repeated_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_MESSAGEA']._serialized_start=40
+  _globals['_MESSAGEA']._serialized_end=66
+  _globals['_TEST']._serialized_start=68
+  _globals['_TEST']._serialized_end=113
+# @@protoc_insertion_point(module_scope)
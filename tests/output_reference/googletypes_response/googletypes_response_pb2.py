@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: googletypes_response.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1agoogletypes_response.proto\x12\x14googletypes_response\x1a\x1egoogle/protobuf/wrappers.proto\"\x07\n\x05Input2\x82\x05\n\x04Test\x12\x46\n\tGetDouble\x12\x1b.googletypes_response.Input\x1a\x1c.google.protobuf.DoubleValue\x12\x44\n\x08GetFloat\x12\x1b.googletypes_response.Input\x1a\x1b.google.protobuf.FloatValue\x12\x44\n\x08GetInt64\x12\x1b.googletypes_response.Input\x1a\x1b.google.protobuf.Int64Value\x12\x46\n\tGetUInt64\x12\x1b.googletypes_response.Input\x1a\x1c.google.protobuf.UInt64Value\x12\x44\n\x08GetInt32\x12\x1b.googletypes_response.Input\x1a\x1b.google.protobuf.Int32Value\x12\x46\n\tGetUInt32\x12\x1b.googletypes_response.Input\x1a\x1c.google.protobuf.UInt32Value\x12\x42\n\x07GetBool\x12\x1b.googletypes_response.Input\x1a\x1a.google.protobuf.BoolValue\x12\x46\n\tGetString\x12\x1b.googletypes_response.Input\x1a\x1c.google.protobuf.StringValue\x12\x44\n\x08GetBytes\x12\x1b.googletypes_response.Input\x1a\x1b.google.protobuf.BytesValueb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'googletypes_response_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_INPUT']._serialized_start=84
+  _globals['_INPUT']._serialized_end=91
+  _globals['_TEST']._serialized_start=94
+  _globals['_TEST']._serialized_end=736
+# @@protoc_insertion_point(module_scope)
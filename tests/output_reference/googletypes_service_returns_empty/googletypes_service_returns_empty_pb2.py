@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: googletypes_service_returns_empty.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'googletypes_service_returns_empty.proto\x12!googletypes_service_returns_empty\x1a\x1bgoogle/protobuf/empty.proto\"\x10\n\x0eRequestMessage2[\n\x04Test\x12S\n\x04Send\x12\x31.googletypes_service_returns_empty.RequestMessage\x1a\x16.google.protobuf.Empty\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'googletypes_service_returns_empty_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_REQUESTMESSAGE']._serialized_start=107
+  _globals['_REQUESTMESSAGE']._serialized_end=123
+  _globals['_TEST']._serialized_start=125
+  _globals['_TEST']._serialized_end=216
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: import_parent_package_from_child.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import parent_package_message_pb2 as parent__package__message__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n&import_parent_package_from_child.proto\x12-import_parent_package_from_child.parent.child\x1a\x1cparent_package_message.proto\"\xb8\x01\n\x04Test\x12W\n\x10message_implicit\x18\x01 \x01(\x0b\x32=.import_parent_package_from_child.parent.ParentPackageMessage\x12W\n\x10message_explicit\x18\x02 \x01(\x0b\x32=.import_parent_package_from_child.parent.ParentPackageMessageb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'import_parent_package_from_child_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_TEST']._serialized_start=120
+  _globals['_TEST']._serialized_end=304
+# @@protoc_insertion_point(module_scope)
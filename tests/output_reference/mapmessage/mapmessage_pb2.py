@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: mapmessage.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10mapmessage.proto\x12\nmapmessage\"t\n\x04Test\x12*\n\x05items\x18\x01 \x03(\x0b\x32\x1b.mapmessage.Test.ItemsEntry\x1a@\n\nItemsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.mapmessage.Nested:\x02\x38\x01\"\x17\n\x06Nested\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mapmessage_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_TEST_ITEMSENTRY']._options = None
+  _globals['_TEST_ITEMSENTRY']._serialized_options = b'8\001'
+  _globals['_TEST']._serialized_start=32
+  _globals['_TEST']._serialized_end=148
+  _globals['_TEST_ITEMSENTRY']._serialized_start=84
+  _globals['_TEST_ITEMSENTRY']._serialized_end=148
+  _globals['_NESTED']._serialized_start=150
+  _globals['_NESTED']._serialized_end=173
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: namespace_builtin_types.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1dnamespace_builtin_types.proto\x12\x17namespace_builtin_types\"\xeb\x01\n\x04Test\x12\x0b\n\x03int\x18\x01 \x01(\t\x12\r\n\x05\x66loat\x18\x02 \x01(\t\x12\x0f\n\x07\x63omplex\x18\x03 \x01(\t\x12\x0c\n\x04list\x18\x04 \x01(\t\x12\r\n\x05tuple\x18\x05 \x01(\t\x12\r\n\x05range\x18\x06 \x01(\t\x12\x0b\n\x03str\x18\x07 \x01(\t\x12\x11\n\tbytearray\x18\x08 \x01(\t\x12\r\n\x05\x62ytes\x18\t \x01(\t\x12\x12\n\nmemoryview\x18\n \x01(\t\x12\x0b\n\x03set\x18\x0b \x01(\t\x12\x11\n\tfrozenset\x18\x0c \x01(\t\x12\x0b\n\x03map\x18\r \x01(\t\x12\x0c\n\x04\x64ict\x18\x0e \x01(\t\x12\x0c\n\x04\x62ool\x18\x0f \x01(\tb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'namespace_builtin_types_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_TEST']._serialized_start=59
+  _globals['_TEST']._serialized_end=294
+# @@protoc_insertion_point(module_scope)
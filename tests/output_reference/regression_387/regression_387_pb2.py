@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: regression_387.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14regression_387.proto\x12\x0eregression_387\"\x12\n\x04Test\x12\n\n\x02id\x18\x01 \x01(\x04\"B\n\rParentElement\x12\x0c\n\x04name\x18\x01 \x01(\t\x12#\n\x05\x65lems\x18\x02 \x03(\x0b\x32\x14.regression_387.Testb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'regression_387_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_TEST']._serialized_start=40
+  _globals['_TEST']._serialized_end=58
+  _globals['_PARENTELEMENT']._serialized_start=60
+  _globals['_PARENTELEMENT']._serialized_end=126
+# @@protoc_insertion_point(module_scope)
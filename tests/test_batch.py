@@ -0,0 +1,106 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import betterproto.batch
+from betterproto.batch import (
+    parse_many,
+    serialize_many,
+)
+from tests.output_betterproto import (
+    nested,
+    repeatedpacked,
+)
+
+
+messages = [
+    nested.Test().from_dict(
+        {"nested": {"count": i}, "sibling": {"foo": i % 5}, "msg": i % 2}
+    )
+    for i in range(250)
+]
+messages.append(nested.Test())
+encoded = [bytes(message) for message in messages]
+
+
+def nested_count(message: nested.Test) -> int:
+    return message.nested.count
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+def test_parse_many(executor):
+    assert parse_many(nested.Test, encoded, workers=1) == messages
+    assert parse_many(nested.Test, encoded, chunk_size=100, workers=2) == messages
+    assert (
+        parse_many(nested.Test, iter(encoded), chunk_size=30, executor=executor)
+        == messages
+    )
+    assert parse_many(
+        nested.Test,
+        [bytearray(data) for data in encoded],
+        chunk_size=30,
+        executor=executor,
+        transform=nested_count,
+    ) == [message.nested.count for message in messages]
+    assert parse_many(nested.Test, [], executor=executor) == []
+
+    with pytest.raises(ValueError):
+        parse_many(nested.Test, encoded + [encoded[1][:-1]], workers=1)
+    with pytest.raises(ValueError):
+        parse_many(
+            nested.Test, encoded + [encoded[1][:-1]], chunk_size=30, executor=executor
+        )
+
+
+def test_serialize_many(executor):
+    assert serialize_many(messages, workers=1) == encoded
+    assert serialize_many(messages, chunk_size=100, workers=2) == encoded
+    assert serialize_many(iter(messages), chunk_size=30, executor=executor) == encoded
+    assert (
+        serialize_many([nested.Test()] * 3, chunk_size=1, executor=executor)
+        == [b""] * 3
+    )
+
+    packed = [
+        repeatedpacked.Test(counts=list(range(i)), signed=[-i], fixed=[i / 2])
+        for i in range(50)
+    ]
+    data = serialize_many(packed, chunk_size=7, executor=executor)
+    assert data == [bytes(message) for message in packed]
+    assert parse_many(repeatedpacked.Test, data, chunk_size=7, executor=executor) == (
+        packed
+    )
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/dev/shm"), reason="shared memory isn't listed in /dev/shm"
+)
+def test_serialize_many_error(executor):
+    invalid = nested.Test()
+    invalid.nested.count = "invalid"
+    blocks = set(os.listdir("/dev/shm"))
+
+    # The shared memory blocks of the chunks serialized before and after the
+    # failing one are unlinked.
+    batch = [*messages, invalid, *messages]
+    with pytest.raises(TypeError):
+        serialize_many(batch, chunk_size=30, executor=executor)
+    with pytest.raises(TypeError):
+        serialize_many(batch, chunk_size=100, workers=2)
+    assert set(os.listdir("/dev/shm")) == blocks
+
+
+def test_batch_without_shared_memory(monkeypatch):
+    monkeypatch.setattr(betterproto.batch, "SharedMemory", None)
+    assert parse_many(nested.Test, encoded, workers=1) == messages
+    assert serialize_many(messages, chunk_size=30, workers=1) == encoded
+    with pytest.raises(RuntimeError):
+        parse_many(nested.Test, encoded, chunk_size=30)
+    with pytest.raises(RuntimeError):
+        serialize_many(messages, chunk_size=30, workers=2)
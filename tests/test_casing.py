@@ -127,3 +127,13 @@ def test_snake_case_strict(value, expected):
 def test_snake_case_not_strict(value, expected):
     actual = snake_case(value, strict=False)
     assert actual == expected, f"{value} => {expected} (actual: {actual})"
+
+
+@pytest.mark.parametrize("casing", [camel_case, pascal_case, snake_case])
+def test_casing_is_memoized(casing):
+    casing.cache_clear()
+    assert casing("some_value_name") == casing("some_value_name")
+    assert casing("some_value_name", strict=False) is not None
+    info = casing.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+    assert info.maxsize is not None
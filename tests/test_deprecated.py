@@ -43,3 +43,10 @@ def test_message_with_deprecated_field_not_set_default(message):
         _ = Test(value=10).message
 
     assert not record
+
+
+def test_deprecated_message_as_default_value():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert Test(value=10).message.value == ""
+        assert bytes(Test(value=10)) == b"\x10\x0a"
@@ -1,5 +1,8 @@
+import array
+import io
 import json
 import sys
+import warnings
 from copy import (
     copy,
     deepcopy,
@@ -113,6 +116,31 @@ def test_enum_as_int_json():
     assert foo.to_pydict() == {"bar": TestEnum.ONE}
 
 
+def test_type_hints_resolved_once(monkeypatch):
+    class TestEnum(betterproto.Enum):
+        ZERO = 0
+        ONE = 1
+
+    @dataclass
+    class Foo(betterproto.Message):
+        bar: TestEnum = betterproto.enum_field(1)
+        baz: List[TestEnum] = betterproto.enum_field(2)
+        qux: Optional[TestEnum] = betterproto.enum_field(3, optional=True)
+
+    assert Foo._type_hints() == {
+        "bar": TestEnum,
+        "baz": List[TestEnum],
+        "qux": Optional[TestEnum],
+    }
+
+    def get_type_hints(*args, **kwargs):
+        raise AssertionError("type hints resolved again")
+
+    monkeypatch.setattr(betterproto, "get_type_hints", get_type_hints)
+    foo = Foo.from_dict({"bar": "ONE", "baz": ["ONE", "ZERO"], "qux": "ZERO"})
+    assert foo.to_dict() == {"bar": "ONE", "baz": ["ONE", "ZERO"], "qux": "ZERO"}
+
+
 def test_unknown_fields():
     @dataclass
     class Newer(betterproto.Message):
@@ -135,6 +163,372 @@ def test_unknown_fields():
     assert newer == new_again
 
 
+def test_repeated_packed_and_unpacked_values():
+    @dataclass
+    class Foo(betterproto.Message):
+        bar: List[int] = betterproto.int32_field(1)
+
+    # Packed and unpacked encodings of the same field may be mixed on the wire
+    data = b"\x0a\x02\x01\x02" + b"\x08\x03" + b"\x0a\x01\x04"
+    assert Foo().parse(data).bar == [1, 2, 3, 4]
+
+    # A value with an unexpected wire type is kept as an unknown field
+    data = b"\x0d\x01\x00\x00\x00"
+    foo = Foo().parse(data)
+    assert foo.bar == []
+    assert bytes(foo) == data
+
+
+def test_repeated_packed_bulk_round_trip():
+    @dataclass
+    class Foo(betterproto.Message):
+        doubles: List[float] = betterproto.double_field(1)
+        sfixed: List[int] = betterproto.sfixed32_field(2)
+        ints: List[int] = betterproto.int32_field(3)
+        sints: List[int] = betterproto.sint64_field(4)
+        bools: List[bool] = betterproto.bool_field(5)
+
+    foo = Foo(
+        doubles=[i / 3 for i in range(-500, 500)],
+        sfixed=list(range(-500, 500)),
+        ints=list(range(-500, 500)),
+        sints=list(range(-500, 500)),
+        bools=[i % 3 == 0 for i in range(1000)],
+    )
+    assert Foo().parse(bytes(foo)) == foo
+
+    # Values that all fit into a single byte
+    foo = Foo(ints=list(range(100)), bools=[True, False])
+    assert bytes(foo) == b"\x1a\x64" + bytes(range(100)) + b"\x2a\x02\x01\x00"
+    assert Foo().parse(bytes(foo)) == foo
+
+
+def test_repeated_typed_array_fields():
+    @dataclass
+    class Foo(betterproto.Message):
+        doubles: array.array = betterproto.double_field(1)
+        sints: array.array = betterproto.sint32_field(2)
+        uints: array.array = betterproto.uint64_field(3)
+
+    @dataclass
+    class FooLists(betterproto.Message):
+        doubles: List[float] = betterproto.double_field(1)
+        sints: List[int] = betterproto.sint32_field(2)
+        uints: List[int] = betterproto.uint64_field(3)
+
+    assert Foo().doubles == array.array("d")
+    assert not Foo()
+    assert bytes(Foo()) == b""
+
+    values = dict(doubles=[0.5, -1.5], sints=[-2, 300], uints=[2**63 + 1])
+    foo = Foo(
+        doubles=array.array("d", values["doubles"]),
+        sints=array.array("i", values["sints"]),
+        uints=array.array("Q", values["uints"]),
+    )
+    assert foo
+    assert bytes(foo) == bytes(FooLists(**values))
+    assert len(foo) == len(bytes(foo))
+
+    parsed = Foo().parse(bytes(foo))
+    assert isinstance(parsed.doubles, array.array)
+    assert parsed == foo
+    assert parsed.to_dict() == FooLists(**values).to_dict()
+    assert Foo().from_dict(foo.to_dict()) == foo
+    assert Foo().from_pydict(FooLists(**values).to_pydict()) == foo
+
+    # Unpacked values are added to the array as well
+    assert Foo().parse(b"\x10\x03" + bytes(foo)).sints == array.array(
+        "i", [-2, -2, 300]
+    )
+
+
+def test_repeated_numpy_array_fields():
+    numpy = pytest.importorskip("numpy")
+
+    # Compare using Message.__eq__, like generated messages do
+    @dataclass(eq=False, repr=False)
+    class Foo(betterproto.Message):
+        doubles: numpy.ndarray = betterproto.double_field(1)
+        ints: numpy.ndarray = betterproto.int64_field(2)
+
+    assert Foo().doubles.dtype == numpy.float64
+    assert not Foo()
+
+    foo = Foo(doubles=numpy.linspace(-1, 1, 1000), ints=numpy.arange(-50, 50))
+    assert Foo().parse(bytes(foo)) == foo
+    assert Foo().parse(bytes(foo)) != Foo(doubles=foo.doubles)
+    assert Foo().from_dict(foo.to_dict()) == foo
+
+    parsed = Foo().parse(bytes(foo) + bytes(foo))
+    assert parsed.ints.dtype == numpy.int64
+    assert parsed.ints.tolist() == list(range(-50, 50)) * 2
+
+
+def test_repeated_numpy_array_fields_64_bit():
+    numpy = pytest.importorskip("numpy")
+
+    # The annotations generated with the `numeric_arrays=numpy` plugin option
+    @dataclass(eq=False, repr=False)
+    class Foo(betterproto.Message):
+        uints: numpy.ndarray = betterproto.uint64_field(1)
+        fixed: numpy.ndarray = betterproto.fixed64_field(2)
+
+    @dataclass
+    class FooLists(betterproto.Message):
+        uints: List[int] = betterproto.uint64_field(1)
+        fixed: List[int] = betterproto.fixed64_field(2)
+
+    # Values above 2**53 can't round trip through float64.
+    values = [0, 2**53 + 1, 2**63 + 1, 2**64 - 1]
+    data = bytes(FooLists(uints=values, fixed=values))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        parsed = Foo().parse(data)
+        # Unpacked values are added to the existing ones.
+        unpacked = Foo().parse(data + b"\x08\x01\x11" + (3).to_bytes(8, "little"))
+    assert parsed.uints.dtype == parsed.fixed.dtype == numpy.uint64
+    assert parsed.uints.tolist() == parsed.fixed.tolist() == values
+    assert unpacked.uints.tolist() == values + [1]
+    assert unpacked.fixed.tolist() == values + [3]
+    assert bytes(parsed) == data
+
+
+def test_nested_message_length_prefixes():
+    @dataclass
+    class Bar(betterproto.Message):
+        name: str = betterproto.string_field(1)
+
+    @dataclass
+    class Foo(betterproto.Message):
+        bar: Bar = betterproto.message_field(1)
+        bars: Dict[str, Bar] = betterproto.map_field(
+            2, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+        )
+
+    # Lengths on both sides of a varint byte boundary
+    for size in (1, 125, 126, 127, 128, 16381, 16382):
+        bar = Bar(name="x" * size)
+        bar_bytes = bytes(bar)
+        foo = Foo(bar=bar)
+        expected = b"\x0a" + betterproto.encode_varint(len(bar_bytes)) + bar_bytes
+        assert bytes(foo) == expected
+        assert len(foo) == len(expected)
+        assert Foo().parse(expected) == foo
+
+        foo = Foo(bars={"": bar})
+        entry = b"\x12" + betterproto.encode_varint(len(bar_bytes)) + bar_bytes
+        expected = b"\x12" + betterproto.encode_varint(len(entry)) + entry
+        assert bytes(foo) == expected
+        assert Foo().parse(expected) == foo
+
+    # Unset nested messages and empty map entries aren't written at all
+    assert bytes(Foo(bar=Bar(), bars={"": Bar()})) == b""
+
+
+def test_lazy_parse():
+    @dataclass
+    class Bar(betterproto.Message):
+        name: str = betterproto.string_field(1)
+
+    @dataclass(eq=False, repr=False)
+    class Foo(betterproto.Message):
+        id: int = betterproto.int32_field(1)
+        bar: Bar = betterproto.message_field(2)
+        bars: List[Bar] = betterproto.message_field(3)
+        baz: Bar = betterproto.message_field(4, group="group")
+        qux: int = betterproto.int32_field(5, group="group")
+
+    foo = Foo(id=1, bar=Bar("a"), bars=[Bar("b"), Bar(), Bar("c")], baz=Bar())
+    data = bytes(foo)
+
+    lazy = Foo().parse(data, lazy=True)
+    assert bytes(lazy) == data
+    assert betterproto.which_one_of(lazy, "group")[0] == "baz"
+    assert lazy.id == 1
+    assert lazy.bar == Bar("a")
+    assert lazy.bars == [Bar("b"), Bar(), Bar("c")]
+    assert lazy == foo
+    assert Foo.FromString(data, lazy=True).to_dict() == foo.to_dict()
+
+    # Nested messages which aren't accessed aren't decoded at all, even if invalid
+    data = bytes(Foo(id=1)) + b"\x12\x02\x0a\x05" + b"\x1a\x00"
+    lazy = Foo().parse(data, lazy=True)
+    assert lazy.id == 1
+    assert bytes(lazy) == data
+    assert lazy.bars == [Bar()]
+    with pytest.raises(ValueError):
+        lazy.bar
+
+
+def test_projected_parse():
+    @dataclass
+    class Header(betterproto.Message):
+        trace_id: str = betterproto.string_field(1)
+        tags: List[str] = betterproto.string_field(2)
+
+    @dataclass
+    class Item(betterproto.Message):
+        id: int = betterproto.int32_field(1)
+        name: str = betterproto.string_field(2)
+
+    @dataclass
+    class Record(betterproto.Message):
+        header: Header = betterproto.message_field(1)
+        items: List[Item] = betterproto.message_field(2)
+        count: int = betterproto.int32_field(3)
+
+    record = Record(
+        header=Header(trace_id="abc", tags=["x", "y"]),
+        items=[Item(id=1, name="one"), Item(id=2, name="two")],
+        count=2,
+    )
+    data = bytes(record)
+
+    projected = Record().parse(data, fields=["header.trace_id", "items.id"])
+    assert projected.header.trace_id == "abc"
+    assert projected.header.tags == []
+    assert [item.id for item in projected.items] == [1, 2]
+    assert [item.name for item in projected.items] == ["", ""]
+    assert projected.count == 0
+    # Skipped fields are kept as unknown fields
+    assert Record().parse(bytes(projected)) == record
+
+    dropped = Record().parse(data, fields=["header", "count"], keep_skipped=False)
+    assert dropped == Record(header=record.header, count=2)
+    assert bytes(dropped) == bytes(Record(header=record.header, count=2))
+
+    with pytest.raises(ValueError):
+        Record().parse(data, fields=["header.missing"])
+    with pytest.raises(ValueError):
+        Record().parse(data, fields=["count.value"])
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10),
+    reason="slotted dataclasses are only supported in python3.10+",
+)
+def test_slotted_messages():
+    @dataclass(eq=False, repr=False, slots=True)
+    class Bar(betterproto.Message):
+        name: str = betterproto.string_field(1)
+
+    @dataclass(eq=False, repr=False, slots=True)
+    class Foo(betterproto.Message):
+        id: int = betterproto.int32_field(1)
+        bar: Bar = betterproto.message_field(2, group="kind")
+        tag: str = betterproto.string_field(3, group="kind")
+        values: List[int] = betterproto.int32_field(4)
+
+    foo = Foo(id=1, bar=Bar(name="bar"), values=[1, 2])
+    assert not hasattr(foo, "__dict__")
+    assert not hasattr(foo.bar, "__dict__")
+    assert Foo().parse(bytes(foo)) == foo
+    assert Foo().parse(bytes(foo), lazy=True) == foo
+    assert Foo.from_dict(foo.to_dict()) == foo
+    assert deepcopy(foo) == foo
+
+    foo.tag = "tag"
+    assert betterproto.which_one_of(foo, "kind") == ("tag", "tag")
+    assert not hasattr(foo, "bar")
+    assert Foo().values == []
+    assert not betterproto.serialized_on_wire(Foo())
+
+
+def test_first_instance_assignments():
+    # Fresh classes, so that the first instance is the one checked.
+    @dataclass(eq=False, repr=False)
+    class Empty(betterproto.Message):
+        pass
+
+    @dataclass(eq=False, repr=False)
+    class Foo(betterproto.Message):
+        empty: Empty = betterproto.message_field(1)
+        value: int = betterproto.int32_field(2)
+        name: str = betterproto.string_field(3, group="kind")
+        count: int = betterproto.int32_field(4, group="kind")
+
+    first = Foo(empty=Empty(), value=1, name="")
+    assert bytes(first) == b"\n\x00\x10\x01\x1a\x00"
+    assert betterproto.which_one_of(first, "kind") == ("name", "")
+    assert bytes(Foo(empty=Empty(), value=1, name="")) == bytes(first)
+
+
+def test_from_wire_instances():
+    @dataclass(eq=False, repr=False)
+    class Foo(betterproto.Message):
+        bar: int = betterproto.int32_field(1, group="group1")
+        baz: str = betterproto.string_field(2, group="group1")
+        values: List[int] = betterproto.int32_field(3)
+
+    foo = Foo._from_wire()
+    assert betterproto.serialized_on_wire(foo)
+    assert betterproto.which_one_of(foo, "group1") == ("", None)
+    assert not foo.is_set("values")
+    assert foo.values == []
+    assert foo == Foo()
+
+    foo = Foo.from_dict({"baz": "baz", "values": [1, 2]})
+    assert foo == Foo(baz="baz", values=[1, 2])
+    assert betterproto.which_one_of(foo, "group1") == ("baz", "baz")
+    assert betterproto.serialized_on_wire(Foo.from_dict({}))
+
+
+def test_message_registry_and_warmup(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from types import ModuleType
+
+    from betterproto.lib.google.protobuf import Timestamp
+
+    assert betterproto.get_message_class("google.protobuf.Timestamp") is Timestamp
+    with pytest.raises(KeyError):
+        betterproto.get_message_class("test_features.Unknown")
+
+    module = ModuleType("test_features_registry")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    @dataclass
+    class Inner(betterproto.Message):
+        _proto_name = "test_features.Outer.Inner"
+
+        value: int = betterproto.int32_field(1)
+
+    @dataclass
+    class Outer(betterproto.Message):
+        _proto_name = "test_features.Outer"
+
+        inner: Dict[str, Inner] = betterproto.map_field(
+            1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+        )
+
+    @dataclass
+    class Derived(Outer):
+        pass
+
+    for cls in (Inner, Outer):
+        cls.__module__ = module.__name__
+        setattr(module, cls.__name__, cls)
+
+    assert betterproto.get_message_class("test_features.Outer") is Outer
+    assert betterproto.get_message_class("test_features.Outer.Inner") is Inner
+
+    betterproto.warmup(module)
+    assert "_betterproto_meta" in Outer.__dict__
+    assert "_betterproto_meta" in Inner.__dict__
+    entry_cls = Outer._betterproto.cls_by_field["inner.value"]
+    assert "_betterproto_meta" in entry_cls.__dict__
+    # Subclasses get their own metadata rather than their parent's
+    assert Derived._betterproto is not Outer._betterproto
+
+    @dataclass
+    class Lazy(betterproto.Message):
+        value: int = betterproto.int32_field(1)
+
+    with ThreadPoolExecutor(8) as executor:
+        metas = set(map(id, executor.map(lambda _: Lazy._betterproto, range(32))))
+    assert len(metas) == 1
+
+
 def test_oneof_support():
     @dataclass
     class Sub(betterproto.Message):
@@ -156,7 +550,7 @@ def test_oneof_support():
 
     # Other oneof fields should now be unset
     assert not hasattr(foo, "bar")
-    assert object.__getattribute__(foo, "bar") == betterproto.PLACEHOLDER
+    assert not foo.is_set("bar")
     assert betterproto.which_one_of(foo, "group1")[0] == "baz"
 
     foo.sub = Sub(val=1)
@@ -166,7 +560,7 @@ def test_oneof_support():
 
     # Group 1 shouldn't be touched, group 2 should have reset
     assert not hasattr(foo, "sub")
-    assert object.__getattribute__(foo, "sub") == betterproto.PLACEHOLDER
+    assert not foo.is_set("sub")
     assert betterproto.which_one_of(foo, "group2")[0] == "abc"
 
     # Zero value should always serialize for one-of
@@ -337,6 +731,106 @@ def test_to_json_default_values():
     }
 
 
+def test_to_dict_encoders():
+    @dataclass
+    class Custom(betterproto.Message):
+        value: int = betterproto.int32_field(1)
+
+        def to_dict(
+            self, casing=betterproto.Casing.CAMEL, include_default_values=False
+        ):
+            return {"custom": self.value}
+
+    @dataclass
+    class Foo(betterproto.Message):
+        some_value: int = betterproto.int64_field(1)
+        custom: Custom = betterproto.message_field(2)
+        customs: Dict[str, Custom] = betterproto.map_field(
+            3, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+        )
+
+    foo = Foo(some_value=1, custom=Custom(2), customs={"a": Custom(3)})
+    assert foo.to_dict() == {
+        "someValue": "1",
+        "custom": {"custom": 2},
+        "customs": {"a": {"custom": 3}},
+    }
+    assert foo.to_dict(betterproto.Casing.SNAKE) == {
+        "some_value": "1",
+        "custom": {"custom": 2},
+        "customs": {"a": {"custom": 3}},
+    }
+    assert Foo().to_dict(include_default_values=True) == {
+        "someValue": "0",
+        "custom": {"custom": 0},
+        "customs": {},
+    }
+
+    meta = Foo._betterproto
+    assert len(meta.dict_encoders) == 3
+    assert meta.get_dict_encoder(
+        betterproto.Casing.CAMEL, False
+    ) is meta.get_dict_encoder(betterproto.Casing.CAMEL, False)
+
+
+def test_dump_json():
+    @dataclass
+    class Bar(betterproto.Message):
+        name: str = betterproto.string_field(1)
+        values: List[float] = betterproto.double_field(2)
+
+    @dataclass
+    class Foo(betterproto.Message):
+        id: int = betterproto.uint64_field(1)
+        bar: Bar = betterproto.message_field(2)
+        bars: List[Bar] = betterproto.message_field(3)
+        data: bytes = betterproto.bytes_field(4)
+
+    foo = Foo(
+        id=1,
+        bars=[Bar(name="é", values=[float("inf"), 0.5]), Bar()],
+        data=b"\x00",
+    )
+    for message in (foo, Foo()):
+        for indent in (None, 4, "\t"):
+            for include_default_values in (False, True):
+                stream = io.StringIO()
+                message.dump_json(stream, indent, include_default_values)
+                assert stream.getvalue() == message.to_json(
+                    indent, include_default_values
+                )
+
+
+def test_from_dict_keys():
+    @dataclass
+    class Foo(betterproto.Message):
+        some_value: int = betterproto.int32_field(1)
+        value_2: int = betterproto.int32_field(2)
+        in_: str = betterproto.string_field(3)
+
+    expected = Foo(some_value=1, value_2=2, in_="in")
+    for data in (
+        {"someValue": 1, "value2": 2, "in": "in"},
+        {"some_value": 1, "value_2": 2, "in_": "in"},
+        {"SomeValue": 1, "Value_2": 2, "IN": "in", "unknown": 3},
+    ):
+        assert Foo.from_dict(data) == expected
+        assert Foo().from_dict(data) == expected
+
+    foo = Foo(some_value=1, value_2=2)
+    for casing in (betterproto.Casing.CAMEL, betterproto.Casing.SNAKE):
+        assert Foo.from_dict(foo.to_dict(casing)) == foo
+
+    meta = Foo._betterproto
+    assert meta.get_output_names(betterproto.Casing.CAMEL) == {
+        "some_value": "someValue",
+        "value_2": "value2",
+        "in_": "in",
+    }
+    assert meta.field_name_by_key["value2"] == "value_2"
+    assert meta.field_name_by_key["in"] == "in_"
+
+
 def test_to_dict_default_values():
     @dataclass
     class TestMessage(betterproto.Message):
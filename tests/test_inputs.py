@@ -1,4 +1,5 @@
 import importlib
+import io
 import json
 import math
 import os
@@ -187,6 +188,11 @@ def test_message_json(repeat, test_data: TestData) -> None:
             message.from_json(sample.json)
             message_json = message.to_json(0)
 
+            for indent in (0, 2, None):
+                stream = io.StringIO()
+                message.dump_json(stream, indent)
+                assert stream.getvalue() == message.to_json(indent)
+
             assert dict_replace_nans(json.loads(message_json)) == dict_replace_nans(
                 json.loads(sample.json)
             )
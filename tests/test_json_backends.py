@@ -0,0 +1,99 @@
+import json
+import sys
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    List,
+)
+
+import pytest
+
+import betterproto
+from betterproto import json_backends
+
+
+class Color(betterproto.Enum):
+    RED = 0
+    BLUE = 1
+
+
+@dataclass
+class Item(betterproto.Message):
+    name: str = betterproto.string_field(1)
+    weight: float = betterproto.double_field(2)
+
+
+@dataclass
+class Order(betterproto.Message):
+    id: int = betterproto.int64_field(1)
+    color: Color = betterproto.enum_field(2)
+    data: bytes = betterproto.bytes_field(3)
+    items: List[Item] = betterproto.message_field(4)
+    counts: Dict[int, Item] = betterproto.map_field(
+        5, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+
+
+ORDER = Order(
+    id=2**60,
+    color=Color.BLUE,
+    data=b"\x00\xff",
+    items=[Item(name="café", weight=float("inf")), Item(name="tea", weight=0.5)],
+    counts={1: Item(name="one")},
+)
+
+
+@pytest.fixture
+def default_backend():
+    backend = betterproto.get_json_backend()
+    yield
+    betterproto.set_json_backend(backend)
+
+
+def test_default_backend_is_json():
+    assert betterproto.get_json_backend().name == "json"
+    assert ORDER.to_json(indent=4) == json.dumps(ORDER.to_dict(), indent=4)
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_orjson_backend(indent, default_backend):
+    pytest.importorskip("orjson")
+
+    text = ORDER.to_json(indent, backend="orjson")
+    assert json.loads(text) == json.loads(ORDER.to_json())
+    parsed = Order().from_json(ORDER.to_json())
+    assert Order().from_json(text, backend="orjson") == parsed
+    if indent == 2:
+        assert text == json.dumps(ORDER.to_dict(), indent=2, ensure_ascii=False)
+
+    betterproto.set_json_backend("orjson")
+    assert isinstance(betterproto.get_json_backend(), json_backends.OrjsonBackend)
+    assert ORDER.to_json(indent) == text
+    assert Order().from_json(text.encode()) == parsed
+
+
+def test_missing_backend_falls_back_to_json(monkeypatch):
+    monkeypatch.setitem(sys.modules, "ujson", None)
+    monkeypatch.setattr(json_backends, "_backends", {})
+
+    with pytest.warns(RuntimeWarning):
+        backend = betterproto.get_json_backend("ujson")
+    assert isinstance(backend, json_backends.StdlibJsonBackend)
+    assert ORDER.to_json(backend="ujson") == ORDER.to_json()
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        betterproto.get_json_backend("yaml")
+
+
+def test_custom_backend():
+    class SortedBackend(json_backends.StdlibJsonBackend):
+        name = "sorted"
+
+        def dumps(self, value, indent=None):
+            return json.dumps(value, indent=indent, sort_keys=True)
+
+    assert ORDER.to_json(backend=SortedBackend()) == json.dumps(
+        ORDER.to_dict(), sort_keys=True
+    )
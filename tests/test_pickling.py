@@ -1,4 +1,5 @@
 import pickle
+import sys
 from copy import (
     copy,
     deepcopy,
@@ -11,6 +12,7 @@ from typing import (
 from unittest.mock import ANY
 
 import cachelib
+import pytest
 
 import betterproto
 from betterproto.lib.google import protobuf as google
@@ -201,3 +203,88 @@ def test_message_can_be_cached():
             .string_value
             == "world"
         )
+
+
+def test_pickled_state():
+    from tests.output_betterproto.nested import (
+        Test as NestedMessage,
+        TestMsg,
+    )
+
+    msg = NestedMessage().from_dict(
+        {"nested": {"count": 1}, "sibling": {"foo": 2}, "msg": TestMsg.THIS}
+    )
+    # The fields are pickled rather than the encoded message.
+    assert b"TestNested" in pickle.dumps(msg)
+    assert unpickled(msg) == msg
+    assert unpickled(msg).msg is TestMsg.THIS
+    assert unpickled(TestMsg.try_value(5)) == 5
+
+    lazy = NestedMessage().parse(bytes(msg), lazy=True)
+    assert unpickled(lazy) == msg
+    assert bytes(unpickled(lazy)) == bytes(msg)
+    assert not betterproto.serialized_on_wire(unpickled(NestedMessage()))
+    assert betterproto.serialized_on_wire(unpickled(NestedMessage._from_wire()))
+
+    # Unset fields of a oneof group stay unset.
+    complex = unpickled(Complex(fe=Fe(abc="1")))
+    complex.fi = Fi(abc="2")
+    assert betterproto.which_one_of(complex, "grp") == ("fi", Fi(abc="2"))
+    assert not complex.is_set("fe")
+
+    unknown = Fe().parse(b"\x10\x01")
+    assert bytes(unpickled(unknown)) == b"\x10\x01"
+
+    # Messages pickled as their encoding still load.
+    class Legacy:
+        def __reduce__(self):
+            return Fe.FromString, (bytes(Fe(abc="1")),)
+
+    assert pickle.loads(pickle.dumps(Legacy())) == Fe(abc="1")
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10),
+    reason="slotted dataclasses are only supported in python3.10+",
+)
+def test_pickled_state_slotted():
+    @dataclass(eq=False, repr=False, slots=True)
+    class Foo(betterproto.Message):
+        id: int = betterproto.int32_field(1)
+        bar: Fe = betterproto.message_field(2, group="kind")
+        tag: str = betterproto.string_field(3, group="kind")
+
+    foo = Foo(id=1, tag="tag")
+    unpickle, state = foo.__reduce__()
+    copied = unpickle(*state)
+    assert not hasattr(copied, "__dict__")
+    assert copied == foo
+    assert betterproto.which_one_of(copied, "kind") == ("tag", "tag")
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10),
+    reason="slotted dataclasses are only supported in python3.10+",
+)
+def test_pickled_state_slotted_empty():
+    @dataclass(eq=False, repr=False, slots=True)
+    class Empty(betterproto.Message):
+        pass
+
+    @dataclass(eq=False, repr=False, slots=True)
+    class Holder(betterproto.Message):
+        empty: Empty = betterproto.message_field(1)
+
+    empty = Empty()
+    unpickle, state = empty.__reduce__()
+    copied = unpickle(*state)
+    assert not hasattr(copied, "__dict__")
+    assert copied == empty
+    assert not copied._serialized_on_wire
+
+    holder = Holder.FromString(bytes(Holder(empty=Empty())))
+    unpickle, state = holder.__reduce__()
+    copied = unpickle(*state)
+    assert copied == holder
+    assert copied.empty._serialized_on_wire
+    assert bytes(copied) == bytes(holder)
@@ -1,3 +1,6 @@
+import mmap
+import os
+import warnings
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
@@ -8,10 +11,23 @@ from typing import Optional
 import pytest
 
 import betterproto
+from betterproto.io import (
+    DelimitedIndex,
+    DelimitedReader,
+    DelimitedWriter,
+    IndexedReader,
+    index_path,
+    main,
+    read_delimited,
+    write_delimited,
+)
 from tests.output_betterproto import (
+    bytes as bytes_,
+    deprecated,
     map,
     nested,
     oneof,
+    proto3_field_presence,
     repeated,
     repeatedpacked,
 )
@@ -95,6 +111,25 @@ def test_dump_varint_file(tmp_path):
         )
 
 
+def test_encode_decode_varint_buffer():
+    values = [0, 1, 127, 128, 300, 16383, 16384, 123456789, (1 << 64) - 1, -1]
+    buffer = bytearray(b"prefix")
+    for value in values:
+        betterproto.encode_varint_into(value, buffer)
+    assert buffer.startswith(b"prefix")
+
+    pos = len(b"prefix")
+    for value in values:
+        decoded, pos = betterproto.decode_varint(buffer, pos)
+        assert decoded == value % (1 << 64)
+    assert pos == len(buffer)
+
+    with pytest.raises(EOFError):
+        betterproto.decode_varint(b"\x80\x80", 0)
+    with pytest.raises(ValueError):
+        betterproto.decode_varint(b"\x80" * 10 + b"\x01", 0)
+
+
 def test_parse_fields():
     with open(streams_path / "message_dump_file_single.expected", "rb") as stream:
         parsed_bytes = betterproto.parse_fields(stream.read())
@@ -143,6 +178,25 @@ def test_message_dump_delimited(tmp_path):
         assert test_stream.read() == exp_stream.read()
 
 
+def test_message_dump_into():
+    buffer = bytearray(b"prefix")
+    assert oneof_example.dump_into(buffer) == len_oneof
+    assert oneof_example.dump_into(buffer) == len_oneof
+    assert nested_example.dump_into(buffer) == len(nested_example)
+
+    with open(streams_path / "message_dump_file_multiple.expected", "rb") as stream:
+        assert buffer == b"prefix" + stream.read()
+
+    # The buffer can be reused
+    del buffer[:]
+    oneof_example.dump_into(buffer, betterproto.SIZE_DELIMITED)
+    oneof_example.dump_into(buffer, betterproto.SIZE_DELIMITED)
+    nested_example.dump_into(buffer, betterproto.SIZE_DELIMITED)
+
+    with open(streams_path / "delimited_messages.in", "rb") as stream:
+        assert buffer == stream.read()
+
+
 def test_message_len():
     assert len_oneof == len(bytes(oneof_example))
     assert len(nested_example) == len(bytes(nested_example))
@@ -179,6 +233,225 @@ def test_message_load_delimited():
         assert stream.read(1) == b""
 
 
+def test_delimited_reader_writer(tmp_path):
+    messages = [
+        nested.Test().from_dict({"nested": {"count": i}, "sibling": {"foo": 2}})
+        for i in range(1000)
+    ]
+    messages.append(nested.Test())
+
+    stream = BytesIO()
+    with DelimitedWriter(stream, buffer_size=100) as writer:
+        assert writer.write(messages[0]) == len(messages[0]) + 1
+        assert writer.write_many(messages[1:]) > 0
+    data = stream.getvalue()
+    expected = BytesIO()
+    for message in messages:
+        message.dump(expected, betterproto.SIZE_DELIMITED)
+    assert data == expected.getvalue()
+    assert write_delimited(BytesIO(), messages) == len(data)
+
+    # Buffers smaller than a message are grown to fit it.
+    for buffer_size in (1, 7, 1 << 16):
+        assert list(read_delimited(BytesIO(data), nested.Test, False, buffer_size)) == (
+            messages
+        )
+    assert list(read_delimited(data, nested.Test)) == messages
+    assert list(read_delimited(memoryview(data), nested.Test, lazy=True)) == messages
+
+    with open(tmp_path / "delimited.out", "wb") as stream:
+        stream.write(data)
+    with open(tmp_path / "delimited.out", "rb") as stream:
+        assert list(read_delimited(stream, nested.Test)) == messages
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert list(DelimitedReader(mapped, nested.Test)) == messages
+
+    # Messages are read one at a time.
+    reader = read_delimited(BytesIO(data), nested.Test)
+    assert next(reader) == messages[0]
+    reader.close()
+
+    for truncated in (data[:-2], data + b"\x05\x01", data + b"\x80"):
+        with pytest.raises(ValueError):
+            list(read_delimited(truncated, nested.Test))
+        with pytest.raises(ValueError):
+            list(read_delimited(BytesIO(truncated), nested.Test))
+
+
+indexed_messages = [
+    nested.Test().from_dict(
+        {"nested": {"count": i * 7}, "sibling": {"foo": i % 3}, "msg": i % 2}
+    )
+    for i in range(500)
+]
+
+
+def write_messages(path, messages):
+    with open(path, "wb") as stream:
+        write_delimited(stream, messages)
+    return path
+
+
+def test_indexed_reader(tmp_path):
+    path = write_messages(tmp_path / "indexed.bin", indexed_messages)
+
+    with IndexedReader.open(path, nested.Test, key="nested.count") as reader:
+        assert len(reader) == len(indexed_messages)
+        assert reader[0] == indexed_messages[0]
+        assert reader[321] == indexed_messages[321]
+        assert reader[-1] == indexed_messages[-1]
+        assert reader.find(7 * 42) == indexed_messages[42]
+        with pytest.raises(IndexError):
+            reader[len(indexed_messages)]
+        with pytest.raises(KeyError):
+            reader.find(1)
+    assert (tmp_path / "indexed.bin.idx").exists()
+
+
+def test_indexed_reader_saved_index(tmp_path):
+    path = write_messages(tmp_path / "indexed.bin", indexed_messages)
+    with IndexedReader.open(path, nested.Test, key="nested.count") as reader:
+        offsets = list(reader.index.offsets)
+
+    index = DelimitedIndex.load(index_path(path))
+    assert list(index.offsets) == offsets
+    assert index.mtime == os.stat(path).st_mtime_ns
+    assert index.record(0) == 0
+
+    # Keys keep their first record, and indexes of other keys are rebuilt.
+    with IndexedReader.open(path, nested.Test, key="msg") as reader:
+        assert reader.index.records_by_key == {0: 0, 1: 1}
+        assert reader.find(nested.TestMsg.THIS) == indexed_messages[1]
+    with IndexedReader.open(path, nested.Test) as reader:
+        assert reader.index.keys is None
+        with pytest.raises(ValueError):
+            reader.find(0)
+
+
+def test_indexed_reader_stale_index(tmp_path):
+    path = write_messages(tmp_path / "indexed.bin", indexed_messages)
+    IndexedReader.open(path, nested.Test).close()
+
+    with open(path, "ab") as stream:
+        nested.Test().dump(stream, betterproto.SIZE_DELIMITED)
+    with IndexedReader.open(path, nested.Test) as reader:
+        assert len(reader) == len(indexed_messages) + 1
+        assert reader[-1] == nested.Test()
+
+    # Files rewritten at the same size are detected by their modification time.
+    shuffled = [nested.Test(), *indexed_messages[::-1]]
+    stat = os.stat(write_messages(path, shuffled))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert os.stat(path).st_size == DelimitedIndex.load(index_path(path)).size
+    with IndexedReader.open(path, nested.Test) as reader:
+        assert reader[0] == nested.Test()
+        assert reader[1] == indexed_messages[-1]
+
+
+def test_indexed_reader_stream():
+    # Streams are read from the position the index was built from.
+    stream = BytesIO(b"header")
+    stream.seek(0, 2)
+    write_delimited(stream, indexed_messages)
+    stream.seek(len(b"header"))
+    index = DelimitedIndex.build(stream, nested.Test, "sibling.foo")
+    assert index.mtime is None
+    stream.seek(len(b"header"))
+    reader = IndexedReader(stream, nested.Test, index)
+    assert reader[10] == indexed_messages[10]
+    assert reader.find(2) == indexed_messages[2]
+
+
+def test_indexed_reader_deprecated(tmp_path):
+    with pytest.warns(DeprecationWarning):
+        old = deprecated.Message(value="old")
+    path = write_messages(tmp_path / "deprecated.bin", [old])
+
+    # Reading messages doesn't go through `__init__`, which warns about deprecated
+    # messages.
+    with IndexedReader.open(path, deprecated.Message) as reader:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert reader[0] == old
+
+
+def test_delimited_index_invalid_keys():
+    data = bytes(write_delimited_buffer(indexed_messages[:3]))
+    with pytest.raises(TypeError):
+        DelimitedIndex.build(data, nested.Test, "nested")
+    with pytest.raises(ValueError):
+        DelimitedIndex.build(data, nested.Test, "missing")
+
+
+def test_delimited_index_bytes_keys(tmp_path):
+    blobs = [bytes_.Test(data=bytes([i, 0xFF])) for i in range(3)]
+    path = write_messages(tmp_path / "blobs.bin", blobs)
+    IndexedReader.open(path, bytes_.Test, key="data").close()
+    with IndexedReader.open(path, bytes_.Test, key="data") as reader:
+        assert reader.index.keys == [blob.data for blob in blobs]
+        assert reader.find(b"\x02\xff") == blobs[2]
+
+    # Unset optional keys are `None`.
+    present = [
+        proto3_field_presence.Test(test4=b"\x01"),
+        proto3_field_presence.Test(test1=1),
+    ]
+    path = write_messages(tmp_path / "present.bin", present)
+    with IndexedReader.open(path, proto3_field_presence.Test, "test4") as reader:
+        assert reader.index.keys == [b"\x01", None]
+        assert reader.find(None) == present[1]
+    assert DelimitedIndex.load(index_path(path)).keys == [b"\x01", None]
+
+
+def test_delimited_index_oneof_keys():
+    # Keys in unselected oneof members are `None`.
+    data = bytes(
+        write_delimited_buffer(
+            [
+                oneof.Test(mixed_drink=oneof.MixedDrink(shots=2)),
+                oneof.Test(bar_name="bar"),
+                oneof.Test(pitied=1),
+            ]
+        )
+    )
+    index = DelimitedIndex.build(data, oneof.Test, "mixed_drink.shots")
+    assert index.keys == [2, None, None]
+    assert DelimitedIndex.build(data, oneof.Test, "pitied").keys == [None, None, 1]
+
+
+def test_delimited_index_tool(tmp_path, capsys):
+    path = write_messages(tmp_path / "indexed.bin", indexed_messages)
+    main([str(path), "tests.output_betterproto.nested:Test", "--key", "nested.count"])
+    assert "Indexed 500 messages" in capsys.readouterr().out
+    assert DelimitedIndex.load(index_path(path)).record(7) == 1
+
+
+def test_delimited_index_load_invalid(tmp_path):
+    (tmp_path / "bad.idx").write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        DelimitedIndex.load(tmp_path / "bad.idx")
+
+
+def write_delimited_buffer(messages):
+    buffer = bytearray()
+    for message in messages:
+        message.dump_into(buffer, betterproto.SIZE_DELIMITED)
+    return buffer
+
+
+def test_message_parse_buffers(tmp_path):
+    data = bytes(nested_example)
+
+    assert nested.Test().parse(bytearray(data)) == nested_example
+    assert nested.Test().parse(memoryview(b"\x00" + data)[1:]) == nested_example
+
+    with open(tmp_path / "message_parse_mmap.out", "wb") as stream:
+        stream.write(data)
+    with open(tmp_path / "message_parse_mmap.out", "rb") as stream:
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert nested.Test().parse(mapped) == nested_example
+
+
 def test_message_load_too_large():
     with open(
         streams_path / "message_dump_file_single.expected", "rb"